@@ -0,0 +1,24 @@
+"""Create the daily and weekly rollups of the measurements already in the database.
+
+New measurements are rolled up when they are written. Run this script once to also roll up the measurements written
+by versions of Quality-time without rollups. The script can safely be run multiple times, and while the collector
+is running: rollups of measurements that are newer than the backfilled measurements are not overwritten.
+"""
+
+from shared.database.measurement_rollups import backfill_rollups
+from shared.initialization.database import get_database, mongo_client
+from shared.utils.log import init_logging
+
+
+def backfill() -> None:  # pragma: no feature-test-cover
+    """Connect to the database and roll up the measurements."""
+    logger = init_logging("INFO")
+    with mongo_client() as client:
+        database = get_database(client)
+        logger.info("Rolling up the measurements, this may take a while")
+        nr_operations = backfill_rollups(database)
+        logger.info("Rolled up the measurements with %d rollup update(s)", nr_operations)
+
+
+if __name__ == "__main__":  # pragma: no feature-test-cover, pragma: no cover
+    backfill()
@@ -0,0 +1,28 @@
+"""Replace the previous versions of the reports in the database with patches.
+
+When the REPORT_SNAPSHOT_INTERVAL environment variable is larger than one, new report versions are stored as full
+report and the previous version is replaced with a patch, except for every interval-th version. Run this script once
+to also replace the report versions stored before the interval was set. The script can safely be run multiple times.
+"""
+
+from shared.initialization.database import get_database, mongo_client
+from shared.utils.log import init_logging
+
+from database.report_history import compact_report_history, report_snapshot_interval
+
+
+def compact() -> None:  # pragma: no feature-test-cover
+    """Connect to the database and compact the report history."""
+    logger = init_logging("INFO")
+    if (interval := report_snapshot_interval()) <= 1:
+        logger.error("Set REPORT_SNAPSHOT_INTERVAL to a value larger than one to compact the report history")
+        return
+    with mongo_client() as client:
+        database = get_database(client)
+        logger.info("Compacting the report history, keeping every %d-th version as full snapshot", interval)
+        nr_replaced = compact_report_history(database, interval)
+        logger.info("Replaced %d report version(s) with a patch", nr_replaced)
+
+
+if __name__ == "__main__":  # pragma: no feature-test-cover, pragma: no cover
+    compact()
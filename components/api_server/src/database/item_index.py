@@ -0,0 +1,82 @@
+"""Index of the items in the reports collection."""
+
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pymongo.database import Database
+
+    from shared.utils.type import ItemId, ReportId
+
+type ItemPath = tuple[ItemId, ...]
+
+
+class ItemIndex:
+    """Index the uuids of the reports, subjects, metrics, and sources in the latest reports.
+
+    The index maps each uuid to the path of the item, i.e. the uuids of the report, subject, metric, and source, as far
+    as applicable. This allows for finding the report that contains an item without loading all reports. The index is
+    versioned with the timestamp of the most recent report it has seen. Before each lookup, only the reports that are
+    at least as recent as that timestamp are read from the database, so the index is kept up to date with changes
+    made by other processes without reading unchanged reports again.
+    """
+
+    def __init__(self) -> None:
+        self.__paths: dict[ItemId, ItemPath] = {}
+        self.__items: dict[ReportId, tuple[str, list[ItemId]]] = {}  # Report timestamp and item uuids per report
+        self.__version = ""
+        self.__lock = Lock()
+
+    def paths(self, database: Database, *uuids: ItemId) -> list[ItemPath | None]:
+        """Return the paths of the items, or None for items not in the index."""
+        self.refresh(database)
+        return [self.__paths.get(uuid) for uuid in uuids]
+
+    def refresh(self, database: Database) -> None:
+        """Update the index with the reports that changed since the last refresh."""
+        with self.__lock:
+            # Use $gte instead of $gt, because reports inserted in one go share the same timestamp:
+            reports = database.reports.find(
+                {"last": True, "timestamp": {"$gte": self.__version}},
+                projection={"_id": False, "report_uuid": True, "timestamp": True, "deleted": True, "subjects": True},
+            )
+            for report in reports:
+                self.__update(report)
+
+    def clear(self) -> None:
+        """Empty the index."""
+        with self.__lock:
+            self.__paths.clear()
+            self.__items.clear()
+            self.__version = ""
+
+    def __update(self, report: dict) -> None:
+        """Update the index with the report."""
+        report_uuid, timestamp = report["report_uuid"], report.get("timestamp", "")
+        if report_uuid in self.__items and self.__items[report_uuid][0] == timestamp:
+            return  # The index is up to date with this version of the report
+        for uuid in self.__items.pop(report_uuid, ("", []))[1]:
+            if self.__paths.get(uuid, ())[:1] == (report_uuid,):  # Don't remove items moved to another report
+                del self.__paths[uuid]
+        if "deleted" not in report:
+            paths = dict(item_paths(report))
+            self.__paths.update(paths)
+            self.__items[report_uuid] = (timestamp, list(paths))
+        self.__version = max(self.__version, timestamp)
+
+
+def item_paths(report: dict) -> Iterator[tuple[ItemId, ItemPath]]:
+    """Yield the uuid and path of the report and of each subject, metric, and source in the report."""
+    report_uuid = report["report_uuid"]
+    yield report_uuid, (report_uuid,)
+    for subject_uuid, subject in report.get("subjects", {}).items():
+        yield subject_uuid, (report_uuid, subject_uuid)
+        for metric_uuid, metric in subject.get("metrics", {}).items():
+            yield metric_uuid, (report_uuid, subject_uuid, metric_uuid)
+            for source_uuid in metric.get("sources", {}):
+                yield source_uuid, (report_uuid, subject_uuid, metric_uuid, source_uuid)
+
+
+ITEM_INDEX = ItemIndex()
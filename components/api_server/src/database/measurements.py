@@ -1,5 +1,6 @@
 """Measurements collection."""
 
+import itertools
 from datetime import datetime, timedelta
 from typing import Any, TYPE_CHECKING
 
@@ -9,16 +10,22 @@ from shared.model.measurement import Measurement
 from shared.utils.functions import iso_timestamp
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pymongo.database import Database
 
     from shared.model.metric import Metric
-    from shared.utils.type import MetricId
+    from shared.utils.type import MetricId, Resolution
 
 
 # Projection options
 NO_ID = {"_id": False}
 NO_SOURCE_DETAILS = NO_ID | {"sources.entities": False}
 NO_MEASUREMENT_DETAILS = NO_SOURCE_DETAILS | {"issue_status": False}
+NO_ROLLUP_ID = NO_ID | {"resolution": False}
+
+# Number of documents to retrieve per round trip when iterating over measurements
+CURSOR_BATCH_SIZE = 1000
 
 # Sort options
 START_ASCENDING = [("start", pymongo.ASCENDING), ("end", pymongo.DESCENDING)]
@@ -40,27 +47,57 @@ def count_measurements(database: Database) -> int:
     return int(database.measurements.estimated_document_count())
 
 
-def measurements_in_period(database: Database, min_iso_timestamp: str, max_iso_timestamp: str):
-    """Return recent measurements within the specified period, without source details and issue status."""
+def measurements_in_period(
+    database: Database, min_iso_timestamp: str, max_iso_timestamp: str, resolution: Resolution | None = None
+) -> Iterator[dict]:
+    """Return recent measurements within the specified period, without source details and issue status.
+
+    If a resolution is specified, return the daily or weekly rollups of the measurements instead of the measurements.
+    """
     # Return measurements that partially or completely overlap with the period, meaning they have their start before
     # the end of the period (max_iso_timestamp) and their end after the start of the period (min_iso_timestamp):
     now = iso_timestamp()
     measurement_filter = {"start": {"$lte": max_iso_timestamp or now}, "end": {"$gte": min_iso_timestamp or now}}
-    return list(database.measurements.find(measurement_filter, sort=START_ASCENDING, projection=NO_MEASUREMENT_DETAILS))
+    if resolution:
+        rollup_filter = measurement_filter | {"resolution": resolution}
+        return database.measurement_rollups.find(
+            rollup_filter, sort=START_ASCENDING, projection=NO_ROLLUP_ID, batch_size=CURSOR_BATCH_SIZE
+        )
+    return database.measurements.find(
+        measurement_filter, sort=START_ASCENDING, projection=NO_MEASUREMENT_DETAILS, batch_size=CURSOR_BATCH_SIZE
+    )
+
 
+def all_metric_measurements(
+    database: Database, metric_uuid: MetricId, max_iso_timestamp: str, resolution: Resolution | None = None
+) -> Iterator[dict]:
+    """Return all measurements for one metric, without entities and issue status, except for the most recent one.
 
-def all_metric_measurements(database: Database, metric_uuid: MetricId, max_iso_timestamp: str):
-    """Return all measurements for one metric, without entities and issue status, except for the most recent one."""
+    If a resolution is specified, return the daily or weekly rollups of the measurements that precede the most recent
+    measurement instead of the measurements.
+    """
     measurement_filter: dict[str, str | dict[str, str]] = {"metric_uuid": str(metric_uuid)}
     if max_iso_timestamp:
         measurement_filter["start"] = {"$lte": max_iso_timestamp}
     latest_measurement = database.measurements.find_one(measurement_filter, sort=START_DESCENDING, projection=NO_ID)
     if not latest_measurement:
-        return []
-    all_measurements_stripped = list(
-        database.measurements.find(measurement_filter, sort=START_ASCENDING, projection=NO_MEASUREMENT_DETAILS),
-    )
-    return [*all_measurements_stripped[:-1], latest_measurement]
+        return
+    if resolution:
+        rollup_filter = {
+            "metric_uuid": str(metric_uuid),
+            "resolution": resolution,
+            "start": {"$lt": latest_measurement["start"]},
+        }
+        yield from database.measurement_rollups.find(
+            rollup_filter, sort=START_ASCENDING, projection=NO_ROLLUP_ID, batch_size=CURSOR_BATCH_SIZE
+        )
+    else:
+        all_measurements_stripped = database.measurements.find(
+            measurement_filter, sort=START_ASCENDING, projection=NO_MEASUREMENT_DETAILS, batch_size=CURSOR_BATCH_SIZE
+        )
+        # Skip the most recent measurement without details, it's replaced by the most recent measurement with details:
+        yield from (measurement for measurement, _next_measurement in itertools.pairwise(all_measurements_stripped))
+    yield latest_measurement
 
 
 def recent_measurements(
@@ -0,0 +1,151 @@
+"""Report history, stored as full report snapshots and patches."""
+
+import os
+from typing import TYPE_CHECKING
+
+import pymongo
+from pymongo import ReplaceOne
+
+from utils.json_patch import apply_patch, create_patch
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pymongo.database import Database
+
+    from utils.json_patch import Operation
+
+# Fields of report documents that are not part of the report content and that patch documents keep:
+PATCH_DOCUMENT_FIELDS = ("_id", "report_uuid", "timestamp", "delta")
+# Fields of report documents that are not part of the report content:
+METADATA_FIELDS = (*PATCH_DOCUMENT_FIELDS, "last", "report_patch")
+
+
+def report_snapshot_interval() -> int:
+    """Return the number of report versions per full snapshot of the report, or 0 if all versions are full copies.
+
+    If the interval is larger than zero, previous versions of reports are stored as patches, except for every
+    interval-th version, which is kept as full snapshot. The latest version of a report is always stored in full.
+    """
+    return int(os.getenv("REPORT_SNAPSHOT_INTERVAL", "0"))
+
+
+def is_patch(report_document: dict) -> bool:
+    """Return whether the report document is a patch instead of a full report."""
+    return "report_patch" in report_document
+
+
+def report_content(report_document: dict) -> dict:
+    """Return the report document without metadata."""
+    return {key: value for key, value in report_document.items() if key not in METADATA_FIELDS}
+
+
+def report_metadata(report_document: dict) -> dict:
+    """Return the metadata of the report document that patch documents keep."""
+    return {field: report_document[field] for field in PATCH_DOCUMENT_FIELDS if field in report_document}
+
+
+def patch_document(newer_report_document: dict, report_document: dict) -> dict:
+    """Return a patch document that changes the newer version of a report into the report version."""
+    patch = create_patch(report_content(newer_report_document), report_content(report_document))
+    return report_metadata(report_document) | {"report_patch": patch}
+
+
+def reconstruct_report(database: Database, report_document: dict) -> dict:
+    """Return the full report version, reconstructing it from the newer versions if the document is a patch.
+
+    Reconstruct the report by starting at the first newer version that is stored in full and then applying the patches
+    in between, from new to old.
+    """
+    if not is_patch(report_document):
+        return report_document
+    newer_versions = database.reports.find(
+        {"report_uuid": report_document["report_uuid"], "timestamp": {"$gt": report_document["timestamp"]}},
+        sort=[("timestamp", pymongo.ASCENDING)],
+    )
+    patches: list[list[Operation]] = [report_document["report_patch"]]
+    for newer_version in newer_versions:
+        if not is_patch(newer_version):
+            content = report_content(newer_version)
+            break
+        patches.append(newer_version["report_patch"])
+    else:  # pragma: no feature-test-cover
+        message = f"Report {report_document['report_uuid']} has no full version after {report_document['timestamp']}"
+        raise ValueError(message)
+    for patch in reversed(patches):
+        content = apply_patch(content, patch)
+    return content | report_metadata(report_document)
+
+
+def history_operations(
+    database: Database, previous_report_documents: Sequence[dict], new_report_documents: Sequence[dict]
+) -> list[ReplaceOne]:
+    """Return the operations to replace the previous versions of the reports with patches, if so configured.
+
+    The new report documents should have been inserted already, so the previous versions can be reconstructed.
+    """
+    if (interval := report_snapshot_interval()) <= 1:
+        return []
+    new_reports = {report["report_uuid"]: report for report in new_report_documents}
+    operations = []
+    for previous in previous_report_documents:
+        if nr_patches_before(database, previous, interval) >= interval - 1:
+            continue  # Keep the previous version as full snapshot
+        patch = patch_document(new_reports[previous["report_uuid"]], previous)
+        operations.append(ReplaceOne({"_id": previous["_id"]}, patch))
+    return operations
+
+
+def nr_patches_before(database: Database, report_document: dict, interval: int) -> int:
+    """Return the number of consecutive patches before the report version, with a maximum of interval - 1."""
+    older_versions = database.reports.find(
+        {"report_uuid": report_document["report_uuid"], "timestamp": {"$lt": report_document["timestamp"]}},
+        projection={"report_patch": {"$slice": 1}},
+        sort=[("timestamp", pymongo.DESCENDING)],
+        limit=interval - 1,
+    )
+    nr_patches = 0
+    for older_version in older_versions:
+        if not is_patch(older_version):
+            break
+        nr_patches += 1
+    return nr_patches
+
+
+def compact_report_history(database: Database, interval: int, batch_size: int = 100) -> int:
+    """Replace the previous versions of all reports with patches, keeping every interval-th version as full snapshot.
+
+    Return the number of report versions replaced with a patch.
+    """
+    nr_replaced = 0
+    for report_uuid in database.reports.distinct("report_uuid"):
+        operations = []
+        newer_content: dict | None = None
+        nr_patches = 0
+        for version in database.reports.find({"report_uuid": report_uuid}, sort=[("timestamp", pymongo.DESCENDING)]):
+            if newer_content is None:  # The latest version, which is always stored in full
+                newer_content = report_content(version)
+                continue
+            if is_patch(version):
+                content = apply_patch(newer_content, version["report_patch"])
+                nr_patches += 1
+            elif nr_patches >= interval - 1:
+                content = report_content(version)
+                nr_patches = 0  # Keep the version as full snapshot
+            else:
+                content = report_content(version)
+                operations.append(ReplaceOne({"_id": version["_id"]}, patch_document(newer_content, version)))
+                nr_patches += 1
+            newer_content = content
+            if len(operations) >= batch_size:
+                nr_replaced += write_history_operations(database, operations)
+                operations = []
+        nr_replaced += write_history_operations(database, operations)
+    return nr_replaced
+
+
+def write_history_operations(database: Database, operations: list[ReplaceOne]) -> int:
+    """Write the report history operations to the database and return the number of operations."""
+    if operations:
+        database.reports.bulk_write(operations)
+    return len(operations)
@@ -0,0 +1,145 @@
+"""Report summaries cache."""
+
+import os
+from collections import OrderedDict
+from contextlib import suppress
+from datetime import UTC, datetime
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from bson.errors import InvalidDocument
+from pymongo.errors import DocumentTooLarge
+
+from shared.database.measurement_rollups import period_start
+from shared.utils.functions import iso_timestamp
+from shared_data_model.snapshot import DATA_MODEL_HASH
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pymongo.database import Database
+
+    from shared.utils.type import MetricId, ReportId
+
+    from model.report import Report
+
+type SummaryKey = tuple[ReportId, str, str, str, str]
+
+
+class ReportSummaryCache:
+    """Cache the summaries of reports, so unchanged reports can be served without reading their measurements.
+
+    The cache key of a summary consists of the report uuid, the timestamp of the report, the data model hash, the
+    current date, and the end of the latest measurement of the report's metrics. A new version of the report or a new
+    or updated measurement of one of its metrics changes the key, so summaries don't need to be invalidated when other
+    processes, such as the collector, write to the database. The current date is part of the key because summaries
+    contain the measurements of the last days.
+
+    The summaries are kept in memory in a least-recently-used cache. If enabled, the summaries are also kept in the
+    report summaries collection so API-server processes can share them. Cached summaries must not be changed.
+    """
+
+    def __init__(self, max_size: int, shared: bool = False) -> None:
+        self.max_size = max_size
+        self.shared = shared
+        self.__summaries: OrderedDict[SummaryKey, dict] = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, database: Database, key: SummaryKey) -> dict | None:
+        """Return the cached summary, if any."""
+        with self.__lock:
+            if key in self.__summaries:
+                self.__summaries.move_to_end(key)
+                return self.__summaries[key]
+        if not self.shared:
+            return None
+        if document := database.report_summaries.find_one({"_id": self.document_id(key)}, {"summary": True}):
+            self.__put_in_memory(key, document["summary"])
+            return document["summary"]
+        return None
+
+    def put(self, database: Database, key: SummaryKey, summary: dict) -> None:
+        """Add the summary to the cache."""
+        self.__put_in_memory(key, summary)
+        if not self.shared:
+            return
+        document = {"report_uuid": key[0], "summary": summary, "timestamp": datetime.now(tz=UTC)}
+        # If the summary can't be stored in the database, the in-memory cache still has it:
+        with suppress(DocumentTooLarge, InvalidDocument):
+            database.report_summaries.replace_one({"_id": self.document_id(key)}, document, upsert=True)
+
+    def invalidate(self, database: Database, report_uuids: Iterable[ReportId]) -> None:
+        """Remove the summaries of the reports from the cache."""
+        uuids = set(report_uuids)
+        with self.__lock:
+            for key in [key for key in self.__summaries if key[0] in uuids]:
+                del self.__summaries[key]
+        if self.shared:
+            database.report_summaries.delete_many({"report_uuid": {"$in": sorted(uuids)}})
+
+    def clear(self) -> None:
+        """Remove all summaries from the in-memory cache."""
+        with self.__lock:
+            self.__summaries.clear()
+
+    def __put_in_memory(self, key: SummaryKey, summary: dict) -> None:
+        """Add the summary to the in-memory cache and evict the least recently used summaries if needed."""
+        with self.__lock:
+            self.__summaries[key] = summary
+            self.__summaries.move_to_end(key)
+            while len(self.__summaries) > self.max_size:
+                self.__summaries.popitem(last=False)
+
+    @staticmethod
+    def document_id(key: SummaryKey) -> str:
+        """Return the id of the report summaries document for the key."""
+        return ":".join(key)
+
+
+SUMMARY_CACHE = ReportSummaryCache(
+    max_size=int(os.getenv("SUMMARY_CACHE_SIZE", "100")),
+    shared=os.getenv("SUMMARY_CACHE_SHARED", "False").lower() == "true",
+)
+
+
+def summary_keys(database: Database, reports: Iterable[Report]) -> dict[ReportId, SummaryKey]:
+    """Return the summary cache keys of the reports.
+
+    The end of the latest measurement of each metric is read from the daily rollups of today, which are updated
+    whenever a measurement of the metric is inserted or its end is updated.
+    """
+    reports = list(reports)
+    now = iso_timestamp()
+    today = period_start(now, "day").isoformat()
+    metric_uuids = sorted({metric_uuid for report in reports for metric_uuid in report.metric_uuids})
+    rollups = database.measurement_rollups.find(
+        {"metric_uuid": {"$in": metric_uuids}, "resolution": "day", "start": today},
+        projection={"_id": False, "metric_uuid": True, "end": True},
+    )
+    latest_end: dict[MetricId, str] = {rollup["metric_uuid"]: rollup["end"] for rollup in rollups}
+    keys = {}
+    for report in reports:
+        ends = [latest_end[metric_uuid] for metric_uuid in report.metric_uuids if metric_uuid in latest_end]
+        report_timestamp = str(report.get("timestamp", ""))
+        keys[report.uuid] = (report.uuid, report_timestamp, DATA_MODEL_HASH, today, max(ends, default=""))
+    return keys
+
+
+def cached_summaries(database: Database, keys: dict[ReportId, SummaryKey]) -> dict[ReportId, dict]:
+    """Return the cached summaries of the reports, if any."""
+    summaries = {}
+    for report_uuid, key in keys.items():
+        if (summary := SUMMARY_CACHE.get(database, key)) is not None:
+            summaries[report_uuid] = summary
+    return summaries
+
+
+def cache_summaries(database: Database, keys: dict[ReportId, SummaryKey], summaries: dict[ReportId, dict]) -> None:
+    """Add the summaries of the reports to the cache.
+
+    The keys must have been determined before the measurements were read, so that a summary is never stored under a
+    key that includes measurements the summary doesn't contain.
+    """
+    for report_uuid, summary in summaries.items():
+        if key := keys.get(report_uuid):
+            SUMMARY_CACHE.put(database, key, summary)
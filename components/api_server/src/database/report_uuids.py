@@ -0,0 +1,44 @@
+"""Cache of the uuids of the reports in the reports collection."""
+
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import pymongo
+
+if TYPE_CHECKING:
+    from pymongo.database import Database
+
+    from shared.utils.type import ReportId
+
+
+class ReportUuids:
+    """Cache the uuids of all reports in the reports collection, including deleted reports.
+
+    The cache is versioned with the timestamp of the most recent report version it has seen. If the reports
+    collection contains a more recent report version, only the uuids of the reports changed since then are read.
+    """
+
+    def __init__(self) -> None:
+        self.__uuids: set[ReportId] = set()
+        self.__version = ""
+        self.__lock = Lock()
+
+    def get(self, database: Database) -> set[ReportId]:
+        """Return the uuids of all reports."""
+        with self.__lock:
+            latest = database.reports.find_one(
+                {}, sort=[("timestamp", pymongo.DESCENDING)], projection={"_id": False, "timestamp": True}
+            )
+            if latest and latest["timestamp"] != self.__version:
+                self.__uuids.update(database.reports.distinct("report_uuid", {"timestamp": {"$gte": self.__version}}))
+                self.__version = latest["timestamp"]
+            return set(self.__uuids)
+
+    def clear(self) -> None:
+        """Empty the cache."""
+        with self.__lock:
+            self.__uuids.clear()
+            self.__version = ""
+
+
+REPORT_UUIDS = ReportUuids()
@@ -7,12 +7,16 @@ import pymongo
 from shared.database.filters import DOES_EXIST, DOES_NOT_EXIST
 from shared.database.reports import get_reports
 from shared.utils.functions import iso_timestamp
-from shared_data_model import DATA_MODEL
+from shared_data_model.snapshot import data_model_snapshot
 
 from model.report import Report
 from utils.functions import unique
 
 from . import sessions
+from .item_index import ITEM_INDEX
+from .report_history import history_operations, reconstruct_report, report_snapshot_interval
+from .report_summaries import SUMMARY_CACHE
+from .report_uuids import REPORT_UUIDS
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -72,7 +76,7 @@ def _get_change_key(change: Change) -> str:
 def latest_report(database: Database, report_uuid: str) -> Report | None:
     """Get latest report with this uuid."""
     report_dict = database.reports.find_one({"report_uuid": report_uuid, "last": True, "deleted": DOES_NOT_EXIST})
-    return Report(DATA_MODEL.model_dump(), report_dict) if report_dict else None
+    return Report(data_model_snapshot(), report_dict) if report_dict else None
 
 
 # Sort order:
@@ -84,21 +88,21 @@ def latest_reports(database: Database) -> list[Report]:
     return cast(list[Report], get_reports(database, Report))
 
 
-type AggregationPipeline = list[dict[str, dict[str, int | str | dict[str, str]]]]
-
-
 def latest_reports_before_timestamp(database: Database, data_model: dict, max_iso_timestamp: str) -> list[Report]:
-    """Return the latest, undeleted, reports in the reports collection before the max timestamp."""
-    pipeline: AggregationPipeline = [
-        {"$sort": {"timestamp": pymongo.DESCENDING}},
-        # Group reports by report uuid and add the first report, which is the latest due to the sorting, to the group:
-        {"$group": {"_id": "$report_uuid", "latestReport": {"$first": "$$ROOT"}}},
-        # Replace the group by the latest report:
-        {"$replaceRoot": {"newRoot": "$latestReport"}},
-    ]
+    """Return the latest, undeleted, reports in the reports collection before the max timestamp.
+
+    Without max timestamp, return the reports marked as last. Otherwise, look up the latest version before the max
+    timestamp of each report, using the index on report uuid and timestamp, so the work is proportional to the number
+    of reports times the logarithm of the number of versions per report, instead of to the size of the collection.
+    """
     if max_iso_timestamp:
-        pipeline.insert(0, {"$match": {"timestamp": {"$lte": max_iso_timestamp}}})
-    report_dicts = database.reports.aggregate(pipeline)
+        report_dicts = []
+        for report_uuid in sorted(REPORT_UUIDS.get(database)):
+            version_filter = {"report_uuid": report_uuid, "timestamp": {"$lte": max_iso_timestamp}}
+            if report_dict := database.reports.find_one(version_filter, sort=TIMESTAMP_DESCENDING):
+                report_dicts.append(reconstruct_report(database, report_dict))
+    else:
+        report_dicts = list(database.reports.find({"last": True}))
     return [Report(data_model, report_dict) for report_dict in report_dicts if "deleted" not in report_dict]
 
 
@@ -111,13 +115,38 @@ def latest_report_for_uuids(all_reports: list[Report], *uuids: ItemId) -> list[R
     reports = []
     for uuid in uuids:
         for report in all_reports:  # pragma: no feature-test-cover
-            uuids_in_report = {report.uuid}.union(report.subject_uuids, report.metric_uuids, report.source_uuids)
-            if uuid in uuids_in_report:
+            if _report_contains(report, uuid):
                 reports.append(report)
                 break
     return reports
 
 
+def _report_contains(report: Report, uuid: ItemId) -> bool:
+    """Return whether the report is, or contains, the item with the uuid."""
+    return uuid in {report.uuid}.union(report.subject_uuids, report.metric_uuids, report.source_uuids)
+
+
+def latest_reports_for_uuids(database: Database, *uuids: ItemId) -> list[Report]:
+    """Return the latest reports for the given child entity uuids, without loading all reports.
+
+    The uuids can be of a report, subject, metric or source. The returned reports will be in the order of the provided
+    uuids. If multiple uuids are in the same report, the same report instance is returned for each of them.
+    """
+    paths = ITEM_INDEX.paths(database, *uuids)
+    report_uuids = sorted({path[0] for path in paths if path})
+    report_filter = {"report_uuid": {"$in": report_uuids}, "last": True, "deleted": DOES_NOT_EXIST}
+    reports = {}
+    for report_dict in database.reports.find(report_filter):
+        report = Report(data_model_snapshot(), report_dict)
+        reports[report.uuid] = report
+    found = [(uuid, reports.get(path[0])) for uuid, path in zip(uuids, paths, strict=True) if path]
+    if len(found) < len(uuids) or not all(report and _report_contains(report, uuid) for uuid, report in found):
+        # The index didn't contain the items or is outdated, for example because a report changed since the index was
+        # refreshed. Fall back to loading all reports:
+        return latest_report_for_uuids(latest_reports(database), *uuids)
+    return [cast(Report, report) for _, report in found]
+
+
 def report_exists(database: Database, report_uuid: ReportId) -> bool:
     """Return whether a report with the specified report uuid exists."""
     return report_uuid in database.reports.distinct("report_uuid")
@@ -148,11 +177,16 @@ def insert_new_report(
     """Insert one or more new reports in the reports collection."""
     prepare_documents_for_insertion(database, delta_description, reports, uuids, last=True)
     report_uuids = [report["report_uuid"] for report in reports]
-    database.reports.update_many({"report_uuid": {"$in": report_uuids}, "last": DOES_EXIST}, {"$unset": {"last": ""}})
+    last_filter = {"report_uuid": {"$in": report_uuids}, "last": DOES_EXIST}
+    previous_reports = list(database.reports.find(last_filter)) if report_snapshot_interval() > 1 else []
+    database.reports.update_many(last_filter, {"$unset": {"last": ""}})
     if len(reports) > 1:
         database.reports.insert_many(reports, ordered=False)
     else:
         database.reports.insert_one(reports[0])
+    if operations := history_operations(database, previous_reports, reports):
+        database.reports.bulk_write(operations)
+    SUMMARY_CACHE.invalidate(database, report_uuids)
     return {"ok": True}
 
 
@@ -44,6 +44,7 @@ def create_indexes(database: Database) -> None:
     """Create any indexes."""
     database.datamodels.create_index("timestamp")
     database.reports.create_index([("timestamp", pymongo.ASCENDING), ("report_uuid", pymongo.ASCENDING)])
+    database.reports.create_index([("report_uuid", pymongo.ASCENDING), ("timestamp", pymongo.ASCENDING)])
     database.users.create_index("username", unique=True)
     period_index = pymongo.IndexModel([("start", pymongo.ASCENDING), ("end", pymongo.DESCENDING)])
     latest_measurement_index = pymongo.IndexModel([("metric_uuid", pymongo.ASCENDING), ("start", pymongo.DESCENDING)])
@@ -51,3 +52,13 @@ def create_indexes(database: Database) -> None:
         [("metric_uuid", pymongo.ASCENDING), ("has_error", pymongo.ASCENDING), ("start", pymongo.DESCENDING)],
     )
     database.measurements.create_indexes([period_index, latest_measurement_index, latest_successful_measurement_index])
+    database.latest_measurements.create_index("metric_uuid", unique=True)
+    metric_rollup_index = pymongo.IndexModel(
+        [("metric_uuid", pymongo.ASCENDING), ("resolution", pymongo.ASCENDING), ("start", pymongo.ASCENDING)],
+        unique=True,
+    )
+    period_rollup_index = pymongo.IndexModel(
+        [("resolution", pymongo.ASCENDING), ("start", pymongo.ASCENDING), ("end", pymongo.DESCENDING)]
+    )
+    database.measurement_rollups.create_indexes([metric_rollup_index, period_rollup_index])
+    database.report_summaries.create_index("timestamp", expireAfterSeconds=24 * 60 * 60)
@@ -1,14 +1,19 @@
 """Model queries."""
 
-from shared_data_model import DATA_MODEL
+from typing import TYPE_CHECKING
 
+from shared_data_model.snapshot import data_model_snapshot
 
-def is_password_parameter(source_type: str, parameter: str, data_model: dict | None = None) -> bool:
+if TYPE_CHECKING:
+    from shared_data_model.snapshot import DataModelSnapshot
+
+
+def is_password_parameter(source_type: str, parameter: str, data_model: DataModelSnapshot | None = None) -> bool:
     """Return whether the parameter of the source type is a password."""
     # If the parameter key can't be found (this can happen when the parameter is removed from the data model),
     # err on the safe side and assume it was a password type
     if data_model is None:
-        data_model = DATA_MODEL.model_dump()
+        data_model = data_model_snapshot()
     try:
         return bool(data_model["sources"][source_type]["parameters"][parameter]["type"] == "password")
     except KeyError:
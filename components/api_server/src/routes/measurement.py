@@ -12,8 +12,8 @@ from shared.utils.type import MetricId, SourceId
 
 from database import sessions
 from database.measurements import count_measurements, all_metric_measurements, measurements_in_period
-from database.reports import latest_report_for_uuids, latest_reports
-from utils.functions import report_date_time, sanitize_html
+from database.reports import latest_reports_for_uuids
+from utils.functions import measurement_resolution, report_date_time, sanitize_html, stream_json
 from utils.log import get_logger
 
 from .plugins.auth_plugin import EDIT_ENTITY_PERMISSION
@@ -36,7 +36,7 @@ def set_entity_attribute(
     database: Database,
 ) -> Measurement:
     """Set an entity attribute."""
-    report = latest_report_for_uuids(latest_reports(database), metric_uuid)[0]
+    report = latest_reports_for_uuids(database, metric_uuid)[0]
     metric = report.metrics_dict[metric_uuid]
     new_measurement = cast(Measurement, latest_measurement(database, metric)).copy()
     source = first(new_measurement["sources"], lambda source: source["source_uuid"] == source_uuid)
@@ -103,16 +103,28 @@ def stream_nr_measurements(database: Database) -> Iterator[str]:
 
 
 @bottle.get("/api/internal/measurements", authentication_required=False)
-def get_measurements(database: Database):
-    """Return all measurements (without details) for all reports between the date and the minimum date."""
+def get_measurements(database: Database) -> Iterator[str]:
+    """Return all measurements (without details) for all reports between the date and the minimum date.
+
+    Use the resolution query parameter to get daily or weekly rollups of the measurements instead. The measurements
+    are streamed as JSON, or as newline delimited JSON if the client accepts it.
+    """
     date_time = report_date_time()
     min_date_time = report_date_time("min_report_date")
-    measurements = measurements_in_period(database, min_iso_timestamp=min_date_time, max_iso_timestamp=date_time)
-    return {"measurements": measurements}
+    measurements = measurements_in_period(
+        database, min_iso_timestamp=min_date_time, max_iso_timestamp=date_time, resolution=measurement_resolution()
+    )
+    return stream_json("measurements", measurements)
 
 
 @bottle.get("/api/internal/measurements/<metric_uuid>", authentication_required=False)
-def get_metric_measurements(metric_uuid: MetricId, database: Database) -> dict:
-    """Return the measurements for the metric."""
+def get_metric_measurements(metric_uuid: MetricId, database: Database) -> Iterator[str]:
+    """Return the measurements for the metric.
+
+    Use the resolution query parameter to get daily or weekly rollups of the measurements instead.
+    """
     metric_uuid = cast(MetricId, metric_uuid.split("&")[0])
-    return {"measurements": all_metric_measurements(database, metric_uuid, max_iso_timestamp=report_date_time())}
+    measurements = all_metric_measurements(
+        database, metric_uuid, max_iso_timestamp=report_date_time(), resolution=measurement_resolution()
+    )
+    return stream_json("measurements", measurements)
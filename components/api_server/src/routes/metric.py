@@ -8,8 +8,9 @@ from shared.database.measurements import insert_new_measurement, latest_measurem
 from shared.model.metric import Metric
 from shared.utils.type import ItemId, MetricId, SubjectId, Value
 from shared_data_model import DATA_MODEL
+from shared_data_model.snapshot import data_model_snapshot
 
-from database.reports import insert_new_report, latest_report_for_uuids, latest_reports
+from database.reports import insert_new_report, latest_reports_for_uuids
 from model.actions import copy_metric, move_item, move_metric_to_index
 from model.defaults import default_metric_attributes
 from utils.functions import sanitize_html, uuid
@@ -24,8 +25,7 @@ if TYPE_CHECKING:
 @bottle.post("/api/internal/metric/new/<subject_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def post_metric_new(subject_uuid: SubjectId, database: Database):
     """Add a new metric."""
-    all_reports = latest_reports(database)
-    report = latest_report_for_uuids(all_reports, subject_uuid)[0]
+    report = latest_reports_for_uuids(database, subject_uuid)[0]
     subject = report.subjects_dict[subject_uuid]
     metric_type = cast(dict, bottle.request.json)["type"]
     metric_uuid = cast(MetricId, uuid())
@@ -40,8 +40,7 @@ def post_metric_new(subject_uuid: SubjectId, database: Database):
 @bottle.post("/api/internal/metric/<metric_uuid>/copy/<subject_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def post_metric_copy(metric_uuid: MetricId, subject_uuid: SubjectId, database: Database):
     """Add a copy of the metric to the subject."""
-    all_reports = latest_reports(database)
-    source_and_target_reports = latest_report_for_uuids(all_reports, metric_uuid, subject_uuid)
+    source_and_target_reports = latest_reports_for_uuids(database, metric_uuid, subject_uuid)
     source_report = source_and_target_reports[0]
     target_report = source_and_target_reports[1]
     source_metric, source_subject = source_report.metric_and_subject(metric_uuid)
@@ -63,8 +62,7 @@ def post_metric_copy(metric_uuid: MetricId, subject_uuid: SubjectId, database: D
 )
 def post_move_metric(metric_uuid: MetricId, target_subject_uuid: SubjectId, database: Database):
     """Move the metric to another subject."""
-    all_reports = latest_reports(database)
-    source_and_target_reports = latest_report_for_uuids(all_reports, metric_uuid, target_subject_uuid)
+    source_and_target_reports = latest_reports_for_uuids(database, metric_uuid, target_subject_uuid)
     source_report = source_and_target_reports[0]
     target_report = source_and_target_reports[1]
     metric, source_subject = source_report.metric_and_subject(metric_uuid)
@@ -95,8 +93,7 @@ def post_move_metric(metric_uuid: MetricId, target_subject_uuid: SubjectId, data
 @bottle.delete("/api/internal/metric/<metric_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def delete_metric(metric_uuid: MetricId, database: Database):
     """Delete a metric."""
-    all_reports = latest_reports(database)
-    report = latest_report_for_uuids(all_reports, metric_uuid)[0]
+    report = latest_reports_for_uuids(database, metric_uuid)[0]
     metric, subject = report.metric_and_subject(metric_uuid)
     description = f"{{user}} deleted metric '{metric.name}' from subject '{subject.name}' in report '{report.name}'."
     uuids: list[ItemId] = [report.uuid, subject.uuid, metric_uuid]
@@ -123,8 +120,7 @@ ATTRIBUTES_IMPACTING_STATUS = (
 def post_metric_attribute(metric_uuid: MetricId, metric_attribute: str, database: Database):
     """Set the metric attribute."""
     new_value = cast(dict, bottle.request.json)[metric_attribute]
-    reports = latest_reports(database)
-    report = latest_report_for_uuids(reports, metric_uuid)[0]
+    report = latest_reports_for_uuids(database, metric_uuid)[0]
     metric, subject = report.metric_and_subject(metric_uuid)
     old_metric_name = metric.name  # in case the name is the attribute that will be changed
     if metric_attribute == "comment" and new_value:
@@ -150,7 +146,7 @@ def post_metric_attribute(metric_uuid: MetricId, metric_attribute: str, database
         f"'{subject.name}' in report '{report.name}' from '{old_value}' to '{new_value}'."
     )
     insert_new_report(database, description, [report.uuid, subject.uuid, metric.uuid], report)
-    metric = Metric(DATA_MODEL.model_dump(), metric, metric_uuid)
+    metric = Metric(data_model_snapshot(), metric, metric_uuid)
     if metric_attribute in ATTRIBUTES_IMPACTING_STATUS and (latest := latest_measurement(database, metric)):
         return insert_new_measurement(database, latest.copy())
     return {"ok": True}
@@ -160,11 +156,11 @@ def post_metric_attribute(metric_uuid: MetricId, metric_attribute: str, database
 def post_metric_debt(metric_uuid: MetricId, database: Database):
     """Turn the technical debt on or off, including technical debt target and end date."""
     new_accept_debt = cast(dict, bottle.request.json)["accept_debt"]
-    report = latest_report_for_uuids(latest_reports(database), metric_uuid)[0]
+    report = latest_reports_for_uuids(database, metric_uuid)[0]
     metric, subject = report.metric_and_subject(metric_uuid)
     if new_accept_debt:
         # Get the latest measurement to get the current metric value:
-        latest = latest_measurement(database, Metric(DATA_MODEL.model_dump(), metric, metric_uuid))
+        latest = latest_measurement(database, Metric(data_model_snapshot(), metric, metric_uuid))
         # Only if the metric has at least one measurement can a technical debt target be set:
         new_debt_target = latest.value() if latest else None
         new_end_date = report.deadline("debt_target_met")
@@ -188,7 +184,7 @@ def post_metric_debt(metric_uuid: MetricId, database: Database):
     description += " and".join(attribute_descriptions)
     description += f" of metric '{metric.name}' of subject '{subject.name}' in report '{report.name}'."
     insert_new_report(database, description, [report.uuid, subject.uuid, metric.uuid], report)
-    if latest := latest_measurement(database, Metric(DATA_MODEL.model_dump(), metric, metric_uuid)):
+    if latest := latest_measurement(database, Metric(data_model_snapshot(), metric, metric_uuid)):
         return insert_new_measurement(database, latest.copy())
     return {"ok": True}
 
@@ -196,7 +192,7 @@ def post_metric_debt(metric_uuid: MetricId, database: Database):
 @bottle.post("/api/internal/metric/<metric_uuid>/issue/new", permissions_required=[EDIT_REPORT_PERMISSION])
 def add_metric_issue(metric_uuid: MetricId, database: Database):
     """Add a new issue to the metric using the configured issue tracker."""
-    report = latest_report_for_uuids(latest_reports(database), metric_uuid)[0]
+    report = latest_reports_for_uuids(database, metric_uuid)[0]
     metric, subject = report.metric_and_subject(metric_uuid)
     last_measurement = latest_measurement(database, metric, skip_measurements_with_error=True)
     measured_value = last_measurement.value() if last_measurement else "missing"
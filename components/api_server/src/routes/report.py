@@ -11,6 +11,7 @@ from shared_data_model.parameters import CREDENTIAL_PARAMETERS, PASSWORD_PARAMET
 
 from database.datamodels import latest_datamodel
 from database.measurements import recent_measurements
+from database.report_summaries import cache_summaries, cached_summaries, summary_keys
 from database.reports import insert_new_report, latest_report, latest_reports_before_timestamp
 from initialization.app_secrets import EXPORT_FIELDS_KEYS_NAME
 from model.actions import copy_report
@@ -64,24 +65,32 @@ def get_report(database: Database, report_uuid: ReportId | None = None):
     date_time = report_date_time()
     data_model = latest_datamodel(database, date_time)
     reports = latest_reports_before_timestamp(database, data_model, date_time)
-    summarized_reports = []
-    metrics_dict = {metric_uuid: metric for report in reports for metric_uuid, metric in report.metrics_dict.items()}
-    measurements = recent_measurements(database, metrics_dict, date_time)
-    for report in reports:
-        if not report_uuid or report["report_uuid"] == report_uuid:
-            summarized_reports.append(report.summarize(measurements))
-        else:
-            summarized_reports.append(report)
-    hide_credentials(data_model, *summarized_reports)
-    return {"ok": True, "reports": summarized_reports}
+    reports_to_summarize = [report for report in reports if not report_uuid or report.uuid == report_uuid]
+    # Summaries of past reports are not cached, only summaries of the current reports:
+    keys = {} if date_time else summary_keys(database, reports_to_summarize)
+    summaries = cached_summaries(database, keys)
+    if reports_to_summarize := [report for report in reports_to_summarize if report.uuid not in summaries]:
+        metrics_dict = {uuid: metric for report in reports_to_summarize for uuid, metric in report.metrics_dict.items()}
+        measurements = recent_measurements(database, metrics_dict, date_time)
+        new_summaries = {report.uuid: report.summarize(measurements) for report in reports_to_summarize}
+        hide_credentials(data_model, *new_summaries.values())
+        cache_summaries(database, keys, new_summaries)
+        summaries |= new_summaries
+    other_reports = [report for report in reports if report.uuid not in summaries]
+    hide_credentials(data_model, *other_reports)
+    return {"ok": True, "reports": [summaries.get(report.uuid, report) for report in reports]}
 
 
 @bottle.get("/api/v3/report/<report_uuid>/metric_status_summary", authentication_required=False)
 @with_report
 def get_report_metric_status_summary(database: Database, report: Report, report_uuid: ReportId):
     """Return a metric status summary of the report."""
-    measurements = recent_measurements(database, report.metrics_dict)
-    summarized_report = report.summarize(measurements)
+    keys = summary_keys(database, [report])
+    if not (summarized_report := cached_summaries(database, keys).get(report_uuid)):
+        measurements = recent_measurements(database, report.metrics_dict)
+        summarized_report = report.summarize(measurements)
+        hide_credentials(None, summarized_report)
+        cache_summaries(database, keys, {report_uuid: summarized_report})
     return {"report_uuid": report_uuid, "title": summarized_report["title"], **summarized_report["summary"]}
 
 
@@ -9,7 +9,7 @@ from shared_data_model.parameters import PrivateToken
 from shared.model.source import Source
 from shared.utils.type import ItemId, SourceId
 
-from database.reports import insert_new_report, latest_report_for_uuids, latest_reports
+from database.reports import insert_new_report, latest_report_for_uuids, latest_reports_for_uuids
 from model.actions import copy_source, move_item
 from model.defaults import default_source_parameters
 from model.queries import is_password_parameter
@@ -31,8 +31,7 @@ if TYPE_CHECKING:
 @bottle.post("/api/internal/source/new/<metric_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def post_source_new(metric_uuid: MetricId, database: Database):
     """Add a new source."""
-    all_reports = latest_reports(database)
-    report = latest_report_for_uuids(all_reports, metric_uuid)[0]
+    report = latest_reports_for_uuids(database, metric_uuid)[0]
     metric, subject = report.metric_and_subject(metric_uuid)
     source_type = cast(dict, bottle.request.json)["type"]
     parameters = default_source_parameters(cast(str, metric.type()), source_type)
@@ -50,8 +49,7 @@ def post_source_new(metric_uuid: MetricId, database: Database):
 @bottle.post("/api/internal/source/<source_uuid>/copy/<metric_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def post_source_copy(source_uuid: SourceId, metric_uuid: MetricId, database: Database):
     """Add a copy of the source to the metric."""
-    all_reports = latest_reports(database)
-    reports = latest_report_for_uuids(all_reports, source_uuid, metric_uuid)
+    reports = latest_reports_for_uuids(database, source_uuid, metric_uuid)
     source, source_metric, source_subject = reports[0].source_metric_and_subject(source_uuid)
     target_metric, target_subject = reports[1].metric_and_subject(metric_uuid)
 
@@ -73,8 +71,7 @@ def post_source_copy(source_uuid: SourceId, metric_uuid: MetricId, database: Dat
 )
 def post_move_source(source_uuid: SourceId, target_metric_uuid: MetricId, database: Database):
     """Move the source to another metric."""
-    all_reports = latest_reports(database)
-    reports = latest_report_for_uuids(all_reports, source_uuid, target_metric_uuid)
+    reports = latest_reports_for_uuids(database, source_uuid, target_metric_uuid)
     source, source_metric, source_subject = reports[0].source_metric_and_subject(source_uuid)
     target_metric, target_subject = reports[1].metric_and_subject(target_metric_uuid)
 
@@ -108,8 +105,7 @@ def post_move_source(source_uuid: SourceId, target_metric_uuid: MetricId, databa
 @bottle.delete("/api/internal/source/<source_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def delete_source(source_uuid: SourceId, database: Database):
     """Delete a source."""
-    reports = latest_reports(database)
-    report = latest_report_for_uuids(reports, source_uuid)[0]
+    report = latest_reports_for_uuids(database, source_uuid)[0]
     source, metric, subject = report.source_metric_and_subject(source_uuid)
     delta_description = (
         f"{{user}} deleted the source '{source.name}' from metric "
@@ -125,8 +121,7 @@ def delete_source(source_uuid: SourceId, database: Database):
 )
 def post_source_attribute(source_uuid: SourceId, source_attribute: str, database: Database):
     """Set a source attribute."""
-    reports = latest_reports(database)
-    report = latest_report_for_uuids(reports, source_uuid)[0]
+    report = latest_reports_for_uuids(database, source_uuid)[0]
     source, metric, subject = report.source_metric_and_subject(source_uuid)
     old_source_name = source.name  # in case the name is the attribute that is changed
     value = cast(dict, bottle.request.json)[source_attribute]
@@ -153,7 +148,7 @@ def post_source_attribute(source_uuid: SourceId, source_attribute: str, database
 )
 def post_source_parameter(source_uuid: SourceId, parameter_key: str, database: Database):
     """Set the source parameter."""
-    reports = latest_reports(database)
+    reports = latest_reports_for_uuids(database, source_uuid)
     context = get_source_context(reports, source_uuid)
     new_value = _new_parameter_value(context.source, parameter_key)
     old_value = context.source["parameters"].get(parameter_key) or ""
@@ -7,7 +7,7 @@ import bottle
 from shared.model.subject import Subject
 from shared.utils.type import ItemId, ReportId, SubjectId
 
-from database.reports import insert_new_report, latest_report_for_uuids, latest_reports
+from database.reports import insert_new_report, latest_reports_for_uuids
 from model.actions import copy_subject, move_item
 from model.defaults import default_subject_attributes
 from utils.functions import sanitize_html, uuid
@@ -22,8 +22,7 @@ if TYPE_CHECKING:
 @bottle.post("/api/internal/subject/new/<report_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def post_new_subject(report_uuid: ReportId, database: Database):
     """Create a new subject."""
-    reports = latest_reports(database)
-    report = latest_report_for_uuids(reports, report_uuid)[0]
+    report = latest_reports_for_uuids(database, report_uuid)[0]
     subject_type = cast(dict, bottle.request.json)["type"]
     subject_uuid = cast(SubjectId, uuid())
     report.subjects_dict[subject_uuid] = cast(Subject, default_subject_attributes(subject_type))
@@ -37,8 +36,7 @@ def post_new_subject(report_uuid: ReportId, database: Database):
 @bottle.post("/api/internal/subject/<subject_uuid>/copy/<report_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def post_subject_copy(subject_uuid: SubjectId, report_uuid: ReportId, database: Database):
     """Add a copy of the subject to the report."""
-    reports = latest_reports(database)
-    source_and_target_reports = latest_report_for_uuids(reports, subject_uuid, report_uuid)
+    source_and_target_reports = latest_reports_for_uuids(database, subject_uuid, report_uuid)
     source_report = source_and_target_reports[0]
     target_report = source_and_target_reports[1]
     subject = source_report.subjects_dict[subject_uuid]
@@ -59,8 +57,7 @@ def post_subject_copy(subject_uuid: SubjectId, report_uuid: ReportId, database:
 )
 def post_move_subject(subject_uuid: SubjectId, target_report_uuid: ReportId, database: Database):
     """Move the subject to another report."""
-    reports = latest_reports(database)
-    source_and_target_reports = latest_report_for_uuids(reports, subject_uuid, target_report_uuid)
+    source_and_target_reports = latest_reports_for_uuids(database, subject_uuid, target_report_uuid)
     source_report = source_and_target_reports[0]
     target_report = source_and_target_reports[1]
     subject = source_report.subjects_dict[subject_uuid]
@@ -77,8 +74,7 @@ def post_move_subject(subject_uuid: SubjectId, target_report_uuid: ReportId, dat
 @bottle.delete("/api/internal/subject/<subject_uuid>", permissions_required=[EDIT_REPORT_PERMISSION])
 def delete_subject(subject_uuid: SubjectId, database: Database):
     """Delete the subject."""
-    reports = latest_reports(database)
-    report = latest_report_for_uuids(reports, subject_uuid)[0]
+    report = latest_reports_for_uuids(database, subject_uuid)[0]
     subject = report.subjects_dict[subject_uuid]
     del report["subjects"][subject_uuid]
     delta_description = f"{{user}} deleted the subject '{subject.name}' from report '{report.name}'."
@@ -93,8 +89,7 @@ def delete_subject(subject_uuid: SubjectId, database: Database):
 def post_subject_attribute(subject_uuid: SubjectId, subject_attribute: str, database: Database):
     """Set the subject attribute."""
     new_value = cast(dict, bottle.request.json)[subject_attribute]
-    reports = latest_reports(database)
-    report = latest_report_for_uuids(reports, subject_uuid)[0]
+    report = latest_reports_for_uuids(database, subject_uuid)[0]
     subject = report.subjects_dict[subject_uuid]
     old_subject_name = subject.name  # In case the name is the attribute that is changed
     if subject_attribute == "comment" and new_value:
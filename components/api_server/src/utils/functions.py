@@ -1,10 +1,12 @@
 """Utility functions."""
 
+import itertools
+import json
 import re
 import uuid as _uuid
 from base64 import b64decode, b64encode
 from datetime import datetime
-from typing import cast, TYPE_CHECKING
+from typing import cast, get_args, TYPE_CHECKING
 
 import bottle
 import requests
@@ -19,7 +21,7 @@ from lxml_html_clean import autolink_html, clean_html  # nosec
 from lxml_html_clean.clean import _link_regexes  # type: ignore[attr-defined] # ty: ignore[unresolved-import]
 from lxml.html import fromstring, tostring  # nosec
 
-from shared.utils.type import ItemId
+from shared.utils.type import ItemId, Resolution
 from shared.utils.functions import iso_timestamp
 
 from .type import URL
@@ -188,3 +190,34 @@ def report_date_time(attribute_name: str = "report_date") -> str:
         if iso_report_date_string < iso_timestamp():
             return iso_report_date_string
     return ""
+
+
+def stream_json(name: str, documents: Iterable[dict], batch_size: int = 100) -> Iterator[str]:
+    """Stream the documents as JSON in chunks of at most batch size documents, to keep memory use flat.
+
+    If the client accepts newline delimited JSON, stream one document per line. Otherwise, stream a JSON object with
+    the name as key and the list of documents as value.
+    """
+    ndjson = "application/x-ndjson" in str(bottle.request.get_header("Accept", ""))
+    bottle.response.content_type = "application/x-ndjson" if ndjson else "application/json"
+    return _stream_ndjson(documents, batch_size) if ndjson else _stream_json(name, documents, batch_size)
+
+
+def _stream_ndjson(documents: Iterable[dict], batch_size: int) -> Iterator[str]:
+    """Stream the documents as newline delimited JSON."""
+    for batch in itertools.batched(documents, batch_size, strict=False):
+        yield "".join(json.dumps(document) + "\n" for document in batch)
+
+
+def _stream_json(name: str, documents: Iterable[dict], batch_size: int) -> Iterator[str]:
+    """Stream the documents as JSON object with one key."""
+    yield f"{{{json.dumps(name)}: ["
+    for index, batch in enumerate(itertools.batched(documents, batch_size, strict=False)):
+        yield ("," if index else "") + ",".join(json.dumps(document) for document in batch)
+    yield "]}"
+
+
+def measurement_resolution() -> Resolution | None:
+    """Return the measurement resolution requested as query parameter, or None if the raw measurements are requested."""
+    resolution = dict(bottle.request.query).get("resolution")
+    return cast(Resolution, resolution) if resolution in get_args(Resolution) else None
@@ -0,0 +1,70 @@
+"""Create and apply JSON patches (RFC 6902) for JSON objects.
+
+Only the add, remove, and replace operations are used. Objects are patched key by key; other values, including arrays,
+are replaced as a whole. Because the order of keys in objects is meaningful to Quality-time (for example, the order of
+the subjects in a report), objects whose key order changes are replaced as a whole as well.
+"""
+
+import copy
+from typing import Literal, NotRequired, TypedDict
+
+
+class Operation(TypedDict):
+    """JSON patch operation."""
+
+    op: Literal["add", "remove", "replace"]
+    path: str
+    value: NotRequired[object]
+
+
+def create_patch(source: dict, target: dict, path: str = "") -> list[Operation]:
+    """Return the operations that change the source object into the target object."""
+    removed_keys = [key for key in source if key not in target]
+    operations: list[Operation] = [{"op": "remove", "path": f"{path}/{escape(key)}"} for key in removed_keys]
+    for key, value in target.items():
+        pointer = f"{path}/{escape(key)}"
+        if key not in source:
+            operations.append({"op": "add", "path": pointer, "value": value})
+        elif isinstance(source[key], dict) and isinstance(value, dict):
+            if same_key_order(source[key], value):
+                operations.extend(create_patch(source[key], value, pointer))
+            else:  # Dicts with the same items compare equal regardless of key order, so always replace
+                operations.append({"op": "replace", "path": pointer, "value": value})
+        elif type(source[key]) is not type(value) or source[key] != value:
+            operations.append({"op": "replace", "path": pointer, "value": value})
+    return operations
+
+
+def apply_patch(document: dict, operations: list[Operation]) -> dict:
+    """Apply the patch operations to a copy of the document and return the copy."""
+    document = copy.deepcopy(document)
+    for operation in operations:
+        *parent_keys, key = [unescape(key) for key in operation["path"].split("/")[1:]]
+        parent = document
+        for parent_key in parent_keys:
+            parent = parent[parent_key]
+        if operation["op"] == "remove":
+            del parent[key]
+        else:
+            parent[key] = copy.deepcopy(operation["value"])
+    return document
+
+
+def same_key_order(source: dict, target: dict) -> bool:
+    """Return whether patching the source object key by key results in the key order of the target object.
+
+    Keys that are removed disappear from the source and keys that are added are appended to the source.
+    """
+    kept_keys = [key for key in source if key in target]
+    added_keys = [key for key in target if key not in source]
+    return kept_keys + added_keys == list(target)
+
+
+def escape(key: str) -> str:
+    """Escape the key for use in a JSON pointer."""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def unescape(key: str) -> str:
+    """Unescape the key from a JSON pointer."""
+    return key.replace("~1", "/").replace("~0", "~")
@@ -4,6 +4,10 @@ from unittest.mock import Mock
 
 from shared_test_code.base import DataModelTestCase
 
+from database.item_index import ITEM_INDEX
+from database.report_summaries import SUMMARY_CACHE
+from database.report_uuids import REPORT_UUIDS
+
 
 class DatabaseTestCase(DataModelTestCase):
     """Base class with a database fixture."""
@@ -12,6 +16,11 @@ class DatabaseTestCase(DataModelTestCase):
         """Extend to set of the data models database collection."""
         super().setUp()
         self.database = Mock()
+        self.database.latest_measurements.find_one.return_value = None
+        self.database.measurement_rollups.find.return_value = []
+        SUMMARY_CACHE.clear()
+        ITEM_INDEX.clear()
+        REPORT_UUIDS.clear()
 
 
 class DatabaseWithDataModelTestCase(DatabaseTestCase):
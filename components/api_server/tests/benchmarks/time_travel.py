@@ -0,0 +1,119 @@
+"""Benchmark retrieving the reports as they were at a moment in the past (time travel).
+
+The benchmark fills a separate database with a synthetic report history and compares the time needed to retrieve the
+reports before a timestamp by looking up the latest version per report with the time needed by the aggregation that
+sorts and groups the whole reports collection, which the API-server used before.
+
+The benchmark needs a running MongoDB, configured with the usual DATABASE_* environment variables. Run it from the
+api_server folder, for example:
+
+    PYTHONPATH=src python -m tests.benchmarks.time_travel --reports 500 --versions 5000
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pymongo
+
+from shared.initialization.database import get_database, mongo_client
+from shared_data_model.snapshot import data_model_snapshot
+
+from database.report_uuids import REPORT_UUIDS
+from database.reports import latest_reports_before_timestamp
+from initialization.database import create_indexes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pymongo.database import Database
+
+BENCHMARK_DATABASE = "quality_time_benchmark"
+START = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+def timestamp(nr_reports: int, report_index: int, version_index: int) -> str:
+    """Return the timestamp of the version of the report. Versions of different reports are interleaved."""
+    return (START + timedelta(seconds=version_index * nr_reports + report_index)).isoformat()
+
+
+def fill_database(database: Database, nr_reports: int, nr_versions: int, batch_size: int = 10_000) -> None:
+    """Fill the database with the report versions."""
+    database.reports.drop()
+    create_indexes(database)
+    batch = []
+    for version_index in range(nr_versions):
+        for report_index in range(nr_reports):
+            version = {
+                "report_uuid": f"report-{report_index}",
+                "timestamp": timestamp(nr_reports, report_index, version_index),
+                "title": f"Report {report_index} version {version_index}",
+                "subjects": {},
+            }
+            if version_index == nr_versions - 1:
+                version["last"] = True
+            batch.append(version)
+            if len(batch) >= batch_size:
+                database.reports.insert_many(batch)
+                batch = []
+    if batch:
+        database.reports.insert_many(batch)
+
+
+def aggregate_reports_before_timestamp(database: Database, max_iso_timestamp: str) -> list[dict]:
+    """Return the latest reports before the timestamp using a sort and group over the whole collection."""
+    pipeline = [
+        {"$match": {"timestamp": {"$lte": max_iso_timestamp}}},
+        {"$sort": {"timestamp": pymongo.DESCENDING}},
+        {"$group": {"_id": "$report_uuid", "latestReport": {"$first": "$$ROOT"}}},
+        {"$replaceRoot": {"newRoot": "$latestReport"}},
+    ]
+    return list(database.reports.aggregate(pipeline))
+
+
+def duration(function: Callable[[], list], repeat: int) -> tuple[float, int]:
+    """Return the best duration of calling the function and the number of reports it returned."""
+    durations = []
+    nr_reports = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nr_reports = len(function())
+        durations.append(time.perf_counter() - start)
+    return min(durations), nr_reports
+
+
+def benchmark(database: Database, nr_reports: int, nr_versions: int, repeat: int) -> None:
+    """Time retrieving the reports before several moments in the report history."""
+    data_model = data_model_snapshot()
+    print(f"{'Report date':<34}{'Per report (s)':>16}{'Aggregation (s)':>17}{'Reports':>9}")  # noqa: T201
+    for fraction in (0.25, 0.5, 0.75, 1.0):
+        version_index = max(0, int(nr_versions * fraction) - 1)
+        report_date = timestamp(nr_reports, nr_reports - 1, version_index)
+        REPORT_UUIDS.clear()
+        per_report, found = duration(
+            lambda report_date=report_date: latest_reports_before_timestamp(database, data_model, report_date), repeat
+        )
+        aggregation, _ = duration(
+            lambda report_date=report_date: aggregate_reports_before_timestamp(database, report_date), repeat
+        )
+        print(f"{report_date:<34}{per_report:>16.3f}{aggregation:>17.3f}{found:>9}")  # noqa: T201
+
+
+def main() -> None:
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=500, help="number of reports (default: %(default)s)")
+    parser.add_argument("--versions", type=int, default=5000, help="versions per report (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per measurement (default: %(default)s)")
+    parser.add_argument("--skip-fill", action="store_true", help="reuse the database of a previous run")
+    args = parser.parse_args()
+    with mongo_client() as client:
+        database = get_database(client, BENCHMARK_DATABASE)
+        if not args.skip_fill:
+            fill_database(database, args.reports, args.versions)
+        benchmark(database, args.reports, args.versions, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
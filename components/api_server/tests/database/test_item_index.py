@@ -0,0 +1,68 @@
+"""Unit tests for the item index."""
+
+import unittest
+from unittest.mock import Mock
+
+from database.item_index import ItemIndex
+
+from shared_test_code.fixtures import METRIC_ID, REPORT_ID, REPORT_ID2, SOURCE_ID, SUBJECT_ID
+
+
+class ItemIndexTest(unittest.TestCase):
+    """Unit tests for the item index."""
+
+    def setUp(self) -> None:
+        """Override to create an index and a mock database."""
+        self.index = ItemIndex()
+        self.database = Mock()
+        self.report = {
+            "report_uuid": REPORT_ID,
+            "timestamp": "2026-10-01",
+            "subjects": {SUBJECT_ID: {"metrics": {METRIC_ID: {"sources": {SOURCE_ID: {}}}}}},
+        }
+        self.database.reports.find.return_value = [self.report]
+
+    def test_paths(self):
+        """Test that the paths of the report and its items are returned."""
+        self.assertEqual(
+            [
+                (REPORT_ID,),
+                (REPORT_ID, SUBJECT_ID),
+                (REPORT_ID, SUBJECT_ID, METRIC_ID),
+                (REPORT_ID, SUBJECT_ID, METRIC_ID, SOURCE_ID),
+            ],
+            self.index.paths(self.database, REPORT_ID, SUBJECT_ID, METRIC_ID, SOURCE_ID),
+        )
+
+    def test_missing_item(self):
+        """Test that None is returned for items not in the index."""
+        self.assertEqual([None], self.index.paths(self.database, "missing"))
+
+    def test_only_read_changed_reports(self):
+        """Test that the index only reads the reports changed since the last refresh."""
+        self.index.paths(self.database, METRIC_ID)
+        self.index.paths(self.database, METRIC_ID)
+        self.assertEqual({"$gte": "2026-10-01"}, self.database.reports.find.call_args.args[0]["timestamp"])
+
+    def test_deleted_item(self):
+        """Test that items deleted from a report are removed from the index."""
+        self.index.paths(self.database, METRIC_ID)
+        self.database.reports.find.return_value = [
+            {"report_uuid": REPORT_ID, "timestamp": "2026-10-02", "subjects": {SUBJECT_ID: {"metrics": {}}}}
+        ]
+        self.assertEqual([None, (REPORT_ID, SUBJECT_ID)], self.index.paths(self.database, METRIC_ID, SUBJECT_ID))
+
+    def test_deleted_report(self):
+        """Test that the items of deleted reports are removed from the index."""
+        self.index.paths(self.database, METRIC_ID)
+        self.database.reports.find.return_value = [self.report | {"timestamp": "2026-10-02", "deleted": "true"}]
+        self.assertEqual([None, None], self.index.paths(self.database, REPORT_ID, METRIC_ID))
+
+    def test_moved_item(self):
+        """Test that items moved to another report are indexed under the other report."""
+        self.index.paths(self.database, METRIC_ID)
+        self.database.reports.find.return_value = [
+            {"report_uuid": REPORT_ID2, "timestamp": "2026-10-02", "subjects": self.report["subjects"]},
+            {"report_uuid": REPORT_ID, "timestamp": "2026-10-02", "subjects": {}},
+        ]
+        self.assertEqual([(REPORT_ID2, SUBJECT_ID, METRIC_ID)], self.index.paths(self.database, METRIC_ID))
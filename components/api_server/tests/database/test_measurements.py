@@ -39,11 +39,30 @@ class MeasurementsByMetricTest(DatabaseTestCase):
     def test_get_all_measurements_for_one_metric(self):
         """Test that we get all three measurement fields."""
         self.database.measurements.find.return_value = self.measurements[0:3]
-        measurements = all_metric_measurements(self.database, METRIC_ID, max_iso_timestamp="8")
+        measurements = list(all_metric_measurements(self.database, METRIC_ID, max_iso_timestamp="8"))
         self.assertEqual(len(measurements), 3)
         for measurement in measurements:
             self.assertEqual(measurement["metric_uuid"], METRIC_ID)
 
+    def test_measurement_rollups_in_period(self):
+        """Test that the rollups are returned if a resolution is specified."""
+        rollup = {"metric_uuid": METRIC_ID, "start": "0", "end": "1", "count": {"value": "1", "status": "target_met"}}
+        self.database.measurement_rollups.find.return_value = [rollup]
+        measurements = measurements_in_period(self.database, "0.5", "4", resolution="day")
+        self.assertEqual([rollup], measurements)
+        self.assertEqual("day", self.database.measurement_rollups.find.call_args.args[0]["resolution"])
+        self.database.measurements.find.assert_not_called()
+
+    def test_get_measurement_rollups_for_one_metric(self):
+        """Test that the rollups preceding the latest measurement are returned, followed by the latest measurement."""
+        rollup = {"metric_uuid": METRIC_ID, "start": "0", "end": "1", "count": {"value": "1", "status": "target_met"}}
+        self.database.measurement_rollups.find.return_value = [rollup]
+        self.database.measurements.find_one.return_value = self.measurements[2]
+        measurements = list(all_metric_measurements(self.database, METRIC_ID, max_iso_timestamp="8", resolution="week"))
+        self.assertEqual([rollup, self.measurements[2]], measurements)
+        self.assertEqual({"$lt": "6"}, self.database.measurement_rollups.find.call_args.args[0]["start"])
+        self.database.measurements.find.assert_not_called()
+
     def test_recent_measurements(self):
         """Test that we get all measurements with all metric ids."""
         self.database.measurements.find.return_value = self.measurements
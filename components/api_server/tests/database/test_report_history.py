@@ -0,0 +1,85 @@
+"""Unit tests for the report history."""
+
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from pymongo import ReplaceOne
+
+from database.report_history import compact_report_history, history_operations, reconstruct_report
+
+from shared_test_code.fixtures import REPORT_ID
+
+
+def version(timestamp: str, title: str, **metadata) -> dict:
+    """Return a report version."""
+    return {"_id": timestamp, "report_uuid": REPORT_ID, "timestamp": timestamp, "title": title, **metadata}
+
+
+def patch_version(timestamp: str, title: str) -> dict:
+    """Return a report version stored as patch."""
+    report_patch = [{"op": "replace", "path": "/title", "value": title}]
+    return {"_id": timestamp, "report_uuid": REPORT_ID, "timestamp": timestamp, "report_patch": report_patch}
+
+
+class ReconstructReportTest(unittest.TestCase):
+    """Unit tests for reconstructing reports."""
+
+    def setUp(self) -> None:
+        """Override to create a mock database."""
+        self.database = Mock()
+
+    def test_full_report(self):
+        """Test that full reports are returned as is."""
+        report = version("1", "Title")
+        self.assertEqual(report, reconstruct_report(self.database, report))
+        self.database.reports.find.assert_not_called()
+
+    def test_patch(self):
+        """Test that a report stored as patch is reconstructed from the newer versions."""
+        self.database.reports.find.return_value = [patch_version("2", "Title 2"), version("3", "Title 3", last=True)]
+        self.assertEqual(version("1", "Title 1"), reconstruct_report(self.database, patch_version("1", "Title 1")))
+
+
+@patch.dict(os.environ, {"REPORT_SNAPSHOT_INTERVAL": "3"})
+class HistoryOperationsTest(unittest.TestCase):
+    """Unit tests for replacing the previous versions of reports with patches."""
+
+    def setUp(self) -> None:
+        """Override to create a mock database."""
+        self.database = Mock()
+        self.previous = version("2", "Old title")
+        self.new = version("3", "New title", last=True)
+
+    def test_replace_previous_version_with_patch(self):
+        """Test that the previous version of the report is replaced with a patch."""
+        self.database.reports.find.return_value = [patch_version("1", "Title"), version("0", "Title")]
+        self.assertEqual(
+            [ReplaceOne({"_id": "2"}, patch_version("2", "Old title"))],
+            history_operations(self.database, [self.previous], [self.new]),
+        )
+
+    def test_keep_snapshot(self):
+        """Test that the previous version of the report is kept if the versions before it are patches."""
+        self.database.reports.find.return_value = [patch_version("1", "Title"), patch_version("0", "Title")]
+        self.assertEqual([], history_operations(self.database, [self.previous], [self.new]))
+
+    @patch.dict(os.environ, {"REPORT_SNAPSHOT_INTERVAL": "0"})
+    def test_disabled(self):
+        """Test that the previous versions are kept if the snapshot interval is zero."""
+        self.assertEqual([], history_operations(self.database, [self.previous], [self.new]))
+        self.database.reports.find.assert_not_called()
+
+
+class CompactReportHistoryTest(unittest.TestCase):
+    """Unit tests for compacting the report history."""
+
+    def test_compact(self):
+        """Test that previous versions are replaced with patches, keeping every interval-th version in full."""
+        database = Mock()
+        database.reports.distinct.return_value = [REPORT_ID]
+        database.reports.find.return_value = [version(str(index), f"Title {index}") for index in range(5, 0, -1)]
+        self.assertEqual(3, compact_report_history(database, interval=3, batch_size=2))
+        operations = [operation for call in database.reports.bulk_write.call_args_list for operation in call.args[0]]
+        expected_operations = [ReplaceOne({"_id": index}, patch_version(index, f"Title {index}")) for index in "431"]
+        self.assertEqual(expected_operations, operations)
@@ -0,0 +1,107 @@
+"""Unit tests for the report summaries cache."""
+
+import unittest
+from unittest.mock import Mock
+
+from shared.database.measurement_rollups import period_start
+from shared.utils.functions import iso_timestamp
+
+from database.report_summaries import ReportSummaryCache, summary_keys
+from model.report import Report
+
+from shared_test_code.fixtures import METRIC_ID, METRIC_ID2, REPORT_ID, REPORT_ID2, SUBJECT_ID, SUBJECT_ID2
+
+
+class ReportSummaryCacheTest(unittest.TestCase):
+    """Unit tests for the report summaries cache."""
+
+    KEY = (REPORT_ID, "timestamp", "hash", "today", "end")
+    KEY2 = (REPORT_ID2, "timestamp", "hash", "today", "end")
+
+    def setUp(self) -> None:
+        """Override to create a cache and a mock database."""
+        self.cache = ReportSummaryCache(max_size=2)
+        self.database = Mock()
+        self.summary = {"summary": {"red": 1}}
+
+    def test_get_missing_summary(self):
+        """Test that None is returned if the summary is not cached."""
+        self.assertIsNone(self.cache.get(self.database, self.KEY))
+
+    def test_get_summary(self):
+        """Test that a cached summary is returned."""
+        self.cache.put(self.database, self.KEY, self.summary)
+        self.assertEqual(self.summary, self.cache.get(self.database, self.KEY))
+
+    def test_evict_least_recently_used_summary(self):
+        """Test that the least recently used summary is evicted when the cache is full."""
+        key3 = (REPORT_ID, "new timestamp", "hash", "today", "end")
+        self.cache.put(self.database, self.KEY, self.summary)
+        self.cache.put(self.database, self.KEY2, self.summary)
+        self.cache.get(self.database, self.KEY)
+        self.cache.put(self.database, key3, self.summary)
+        self.assertIsNone(self.cache.get(self.database, self.KEY2))
+        self.assertEqual(self.summary, self.cache.get(self.database, self.KEY))
+
+    def test_invalidate(self):
+        """Test that the summaries of a report can be removed from the cache."""
+        self.cache.put(self.database, self.KEY, self.summary)
+        self.cache.put(self.database, self.KEY2, self.summary)
+        self.cache.invalidate(self.database, [REPORT_ID])
+        self.assertIsNone(self.cache.get(self.database, self.KEY))
+        self.assertEqual(self.summary, self.cache.get(self.database, self.KEY2))
+        self.database.report_summaries.delete_many.assert_not_called()
+
+    def test_shared_cache_put(self):
+        """Test that the summary is also stored in the database when the cache is shared."""
+        self.cache.shared = True
+        self.cache.put(self.database, self.KEY, self.summary)
+        self.database.report_summaries.replace_one.assert_called_once()
+
+    def test_shared_cache_get(self):
+        """Test that the summary is retrieved from the database when it is not in memory."""
+        self.cache.shared = True
+        self.database.report_summaries.find_one.return_value = {"summary": self.summary}
+        self.assertEqual(self.summary, self.cache.get(self.database, self.KEY))
+        self.database.report_summaries.find_one.return_value = None
+        self.assertEqual(self.summary, self.cache.get(self.database, self.KEY))
+
+    def test_shared_cache_get_missing_summary(self):
+        """Test that None is returned if the summary is neither in memory nor in the database."""
+        self.cache.shared = True
+        self.database.report_summaries.find_one.return_value = None
+        self.assertIsNone(self.cache.get(self.database, self.KEY))
+
+    def test_shared_cache_invalidate(self):
+        """Test that the summaries are also removed from the database when the cache is shared."""
+        self.cache.shared = True
+        self.cache.invalidate(self.database, [REPORT_ID])
+        self.database.report_summaries.delete_many.assert_called_once_with({"report_uuid": {"$in": [REPORT_ID]}})
+
+
+class SummaryKeysTest(unittest.TestCase):
+    """Unit tests for the summary cache keys."""
+
+    def setUp(self) -> None:
+        """Override to create reports and a mock database."""
+        self.reports = [
+            Report(
+                {}, {"report_uuid": REPORT_ID, "timestamp": "1", "subjects": {SUBJECT_ID: {"metrics": {METRIC_ID: {}}}}}
+            ),
+            Report({}, {"report_uuid": REPORT_ID2, "subjects": {SUBJECT_ID2: {"metrics": {METRIC_ID2: {}}}}}),
+        ]
+        self.database = Mock()
+        self.database.measurement_rollups.find.return_value = [{"metric_uuid": METRIC_ID, "end": "2"}]
+
+    def test_keys(self):
+        """Test that the keys contain the report timestamp and the end of the latest measurement."""
+        keys = summary_keys(self.database, self.reports)
+        today = period_start(iso_timestamp(), "day").isoformat()
+        self.assertEqual((REPORT_ID, "1", today, "2"), keys[REPORT_ID][:2] + keys[REPORT_ID][3:])
+        self.assertEqual((REPORT_ID2, "", today, ""), keys[REPORT_ID2][:2] + keys[REPORT_ID2][3:])
+
+    def test_new_measurement_changes_key(self):
+        """Test that the key changes when a metric of the report has a new measurement."""
+        key = summary_keys(self.database, self.reports)[REPORT_ID]
+        self.database.measurement_rollups.find.return_value = [{"metric_uuid": METRIC_ID, "end": "3"}]
+        self.assertNotEqual(key, summary_keys(self.database, self.reports)[REPORT_ID])
@@ -0,0 +1,42 @@
+"""Unit tests for the report uuids cache."""
+
+import unittest
+from unittest.mock import Mock
+
+from database.report_uuids import ReportUuids
+
+from shared_test_code.fixtures import REPORT_ID, REPORT_ID2
+
+
+class ReportUuidsTest(unittest.TestCase):
+    """Unit tests for the report uuids cache."""
+
+    def setUp(self) -> None:
+        """Override to create a cache and a mock database."""
+        self.report_uuids = ReportUuids()
+        self.database = Mock()
+        self.database.reports.find_one.return_value = {"timestamp": "1"}
+        self.database.reports.distinct.return_value = [REPORT_ID]
+
+    def test_get(self):
+        """Test that the report uuids are returned."""
+        self.assertEqual({REPORT_ID}, self.report_uuids.get(self.database))
+
+    def test_no_reports(self):
+        """Test that the cache is empty if there are no reports."""
+        self.database.reports.find_one.return_value = None
+        self.assertEqual(set(), self.report_uuids.get(self.database))
+
+    def test_unchanged_reports(self):
+        """Test that the report uuids are not read again if no report changed."""
+        self.report_uuids.get(self.database)
+        self.report_uuids.get(self.database)
+        self.database.reports.distinct.assert_called_once()
+
+    def test_changed_reports(self):
+        """Test that only the uuids of reports changed since the last time are read."""
+        self.report_uuids.get(self.database)
+        self.database.reports.find_one.return_value = {"timestamp": "2"}
+        self.database.reports.distinct.return_value = [REPORT_ID2]
+        self.assertEqual({REPORT_ID, REPORT_ID2}, self.report_uuids.get(self.database))
+        self.database.reports.distinct.assert_called_with("report_uuid", {"timestamp": {"$gte": "1"}})
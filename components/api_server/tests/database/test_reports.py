@@ -1,9 +1,11 @@
 """Test the reports collection."""
 
+import os
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from database.reports import insert_new_report, latest_report_for_uuids
+from database.item_index import ITEM_INDEX
+from database.reports import insert_new_report, latest_report_for_uuids, latest_reports_for_uuids
 from model.report import Report
 
 from shared_test_code.fixtures import (
@@ -72,6 +74,45 @@ class LatestReportForUuidsTest(unittest.TestCase):
         self.assertEqual(len(reports), 0)
 
 
+class LatestReportsForUuidsTest(unittest.TestCase):
+    """Unit tests for getting the reports that contain the items with the uuids."""
+
+    def setUp(self) -> None:
+        """Override to create a mock database fixture."""
+        self.report = {"report_uuid": REPORT_ID, "subjects": {SUBJECT_ID: {"metrics": {METRIC_ID: {}}}}}
+        self.report2 = {"report_uuid": REPORT_ID2, "subjects": {SUBJECT_ID2: {"metrics": {}}}}
+        self.database = Mock()
+        self.database.reports.find.return_value = [self.report, self.report2]
+        ITEM_INDEX.clear()
+
+    def test_reports(self):
+        """Test that the reports are returned in the order of the uuids."""
+        reports = latest_reports_for_uuids(self.database, SUBJECT_ID2, METRIC_ID)
+        self.assertEqual([REPORT_ID2, REPORT_ID], [report.uuid for report in reports])
+        self.assertEqual(
+            {"report_uuid": {"$in": [REPORT_ID, REPORT_ID2]}, "last": True, "deleted": {"$exists": False}},
+            self.database.reports.find.call_args.args[0],
+        )
+
+    def test_same_report(self):
+        """Test that the same report instance is returned for uuids in the same report."""
+        reports = latest_reports_for_uuids(self.database, METRIC_ID, SUBJECT_ID)
+        self.assertIs(reports[0], reports[1])
+
+    @patch("database.reports.ITEM_INDEX.paths", Mock(return_value=[(REPORT_ID2, SUBJECT_ID2)]))
+    def test_outdated_index(self):
+        """Test that all reports are loaded if the index is outdated."""
+        reports = latest_reports_for_uuids(self.database, METRIC_ID)
+        self.assertEqual([REPORT_ID], [report.uuid for report in reports])
+        self.assertEqual(
+            {"last": True, "deleted": {"$exists": False}}, self.database.reports.find.call_args.kwargs["filter"]
+        )
+
+    def test_missing_item(self):
+        """Test that no report is returned for an item that doesn't exist."""
+        self.assertEqual([], latest_reports_for_uuids(self.database, "missing"))
+
+
 class ReportsTest(unittest.TestCase):
     """Unit tests for the reports collection."""
 
@@ -89,3 +130,17 @@ class ReportsTest(unittest.TestCase):
         """Test that multiple reports can be inserted into the reports collection."""
         reports = [{"report_uuid": REPORT_ID}, {"report_uuid": REPORT_ID2, "_id": "id"}]
         self.assertEqual({"ok": True}, insert_new_report(self.database, "delta", [REPORT_ID], *reports))
+
+    @patch.dict(os.environ, {"REPORT_SNAPSHOT_INTERVAL": "10"})
+    def test_insert_report_with_history_as_patches(self):
+        """Test that the previous version of a report is replaced with a patch."""
+        previous = {"_id": "id", "report_uuid": REPORT_ID, "timestamp": "1", "title": "Old", "last": True}
+        self.database.reports.find.return_value = [previous]
+        insert_new_report(self.database, "delta", [REPORT_ID], {"report_uuid": REPORT_ID, "title": "New"})
+        self.database.reports.bulk_write.assert_called_once()
+
+    @patch("database.reports.SUMMARY_CACHE")
+    def test_insert_report_invalidates_summaries(self, summary_cache):
+        """Test that inserting a report removes the cached summaries of the report."""
+        insert_new_report(self.database, "delta", [REPORT_ID], {"report_uuid": REPORT_ID})
+        summary_cache.invalidate.assert_called_once_with(self.database, [REPORT_ID])
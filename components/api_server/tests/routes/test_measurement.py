@@ -1,5 +1,6 @@
 """Unit tests for the measurement routes."""
 
+import json
 from datetime import timedelta
 from typing import cast
 from unittest.mock import Mock, patch
@@ -25,9 +26,21 @@ class GetMetricMeasurementsTest(DatabaseTestCase):
         self.database.measurements.find_one.return_value = self.measurements[-1]
         self.database.measurements.find.return_value = self.measurements
 
+    def get_metric_measurements(self) -> dict:
+        """Get the measurements of the metric and parse the streamed JSON."""
+        return json.loads("".join(get_metric_measurements(METRIC_ID, self.database)))
+
     def test_get_measurements(self):
         """Tests that the measurements for the requested metric are returned."""
-        self.assertEqual({"measurements": self.measurements}, get_metric_measurements(METRIC_ID, self.database))
+        self.assertEqual({"measurements": self.measurements}, self.get_metric_measurements())
+
+    @patch("bottle.request")
+    def test_get_measurements_as_ndjson(self, request):
+        """Tests that the measurements for the requested metric can be streamed as newline delimited JSON."""
+        request.get_header.return_value = "application/x-ndjson"
+        request.query = {}
+        ndjson = "".join(get_metric_measurements(METRIC_ID, self.database))
+        self.assertEqual(self.measurements, [json.loads(line) for line in ndjson.splitlines()])
 
     @patch("bottle.request")
     def test_get_old_but_not_new_measurements(self, request):
@@ -38,7 +51,7 @@ class GetMetricMeasurementsTest(DatabaseTestCase):
             {"start": "2026-05-11T03:04:07.123456+00:00"},
         ]
 
-        def find_side_effect(query, projection, sort=None) -> list[dict[str, str]]:  # noqa: ARG001
+        def find_side_effect(query, projection, sort=None, batch_size=None) -> list[dict[str, str]]:  # noqa: ARG001
             """Side effect for mocking the database measurements."""
             min_iso_timestamp = query["end"]["$gte"] if "end" in query else ""
             max_iso_timestamp = query["start"]["$lte"] if "start" in query else ""
@@ -65,13 +78,13 @@ class GetMetricMeasurementsTest(DatabaseTestCase):
                     {"start": "2026-05-11T03:04:06.123456+00:00"},
                 ]
             },
-            get_metric_measurements(METRIC_ID, self.database),
+            self.get_metric_measurements(),
         )
 
     def test_get_measurements_when_there_are_none(self):
         """Tests that the measurements for the requested metric are returned."""
         self.database.measurements.find_one.return_value = None
-        self.assertEqual({"measurements": []}, get_metric_measurements(METRIC_ID, self.database))
+        self.assertEqual({"measurements": []}, self.get_metric_measurements())
 
 
 class GetMeasurementsTest(DatabaseTestCase):
@@ -91,7 +104,7 @@ class GetMeasurementsTest(DatabaseTestCase):
 
     def test_get_measurements(self):
         """Test that measurements are returned."""
-        self.assertEqual({"measurements": [self.measurement]}, get_measurements(self.database))
+        self.assertEqual({"measurements": [self.measurement]}, json.loads("".join(get_measurements(self.database))))
 
 
 class SetEntityAttributeTest(DatabaseTestCase):
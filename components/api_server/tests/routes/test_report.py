@@ -44,7 +44,7 @@ class ReportTestCase(DatabaseWithDataModelTestCase):
         self.database.sessions.find_one.return_value = JENNY
         self.report = Report(self.database.datamodels.find_one(), create_report())
         self.database.reports.find_one.return_value = self.report
-        self.database.reports.aggregate.return_value = [self.report]
+        self.database.reports.find.return_value = [self.report]
         self.database.measurements.find.return_value = []
 
     def assert_report_not_found(self, response):
@@ -381,6 +381,8 @@ class ReportTest(ReportTestCase):
     def setUp(self):
         """Extend to set up a database with a report and a user session."""
         super().setUp()
+        self.report["timestamp"] = "2021-08-01T00:00:00+00:00"
+        self.database.reports.distinct.return_value = [REPORT_ID]
         self.database.measurements.find_one.return_value = {"sources": []}
 
     def test_get_report(self):
@@ -397,6 +399,17 @@ class ReportTest(ReportTestCase):
         request.query = {"report_date": self.PAST_DATE}
         self.assertEqual(1, len(get_report(self.database)["reports"]))
 
+    @patch("bottle.request")
+    def test_get_reports_with_time_travel_per_report(self, request):
+        """Test that the latest version before the report date is looked up per report."""
+        request.query = {"report_date": self.PAST_DATE}
+        self.database.reports.distinct.return_value = [REPORT_ID, REPORT_ID2]
+        get_report(self.database)
+        self.database.reports.find_one.assert_called_with(
+            {"report_uuid": REPORT_ID2, "timestamp": {"$lte": "2021-08-31T23:59:59.000+00:00"}},
+            sort=[("timestamp", -1)],
+        )
+
     @patch("bottle.request")
     def test_ignore_deleted_reports_when_time_traveling(self, request):
         """Test that deleted reports are not retrieved."""
@@ -406,12 +419,12 @@ class ReportTest(ReportTestCase):
 
     def test_get_report_and_info_about_other_reports(self):
         """Test that a report can be retrieved, and that other reports are also returned."""
-        self.database.reports.aggregate.return_value = [{"_id": "id2", "report_uuid": REPORT_ID2}, self.report]
+        self.database.reports.find.return_value = [{"_id": "id2", "report_uuid": REPORT_ID2}, self.report]
         self.assertEqual(2, len(get_report(self.database, REPORT_ID)["reports"]))
 
     def test_get_report_missing(self):
         """Test that a non-existent report can not be retrieved."""
-        self.database.reports.aggregate.return_value = []
+        self.database.reports.find.return_value = []
         self.assertEqual([], get_report(self.database, cast(ReportId, "report does not exist"))["reports"])
 
     @patch("bottle.request")
@@ -524,6 +537,38 @@ class ReportTest(ReportTestCase):
             get_report_metric_status_summary(self.database, REPORT_ID),
         )
 
+    def test_get_cached_report(self):
+        """Test that the summary of an unchanged report is cached and the measurements are not read again."""
+        report = get_report(self.database, REPORT_ID)["reports"][0]
+        self.database.measurements.find.reset_mock()
+        self.assertEqual(report, get_report(self.database, REPORT_ID)["reports"][0])
+        self.assertEqual(report["summary"], get_report(self.database)["reports"][0]["summary"])
+        self.database.measurements.find.assert_not_called()
+
+    def test_get_report_after_new_measurement(self):
+        """Test that the summary of a report is not served from the cache after its metric has a new measurement."""
+        get_report(self.database, REPORT_ID)
+        self.database.measurement_rollups.find.return_value = [{"metric_uuid": METRIC_ID, "end": "2026-10-18"}]
+        self.database.measurements.find.reset_mock()
+        get_report(self.database, REPORT_ID)
+        self.database.measurements.find.assert_called_once()
+
+    @patch("bottle.request")
+    def test_get_old_report_is_not_cached(self, request):
+        """Test that summaries of past reports are not cached."""
+        request.query = {"report_date": self.PAST_DATE}
+        get_report(self.database, REPORT_ID)
+        self.database.measurements.find.reset_mock()
+        get_report(self.database, REPORT_ID)
+        self.database.measurements.find.assert_called_once()
+
+    def test_get_cached_report_metric_status_summary(self):
+        """Test that the metric status summary uses the cached summary."""
+        get_report(self.database, REPORT_ID)
+        self.database.measurements.find.reset_mock()
+        self.assertEqual(1, get_report_metric_status_summary(self.database, REPORT_ID)["white"])
+        self.database.measurements.find.assert_not_called()
+
 
 class ReportImportAndExportTest(ReportTestCase):
     """Unit tests for importing and exporting reports."""
@@ -1,5 +1,6 @@
 """Unit tests for the utils module."""
 
+import json
 import unittest
 from base64 import b64decode
 from datetime import datetime
@@ -16,8 +17,10 @@ from shared.utils.functions import md5_hash
 from utils.functions import (
     asymmetric_decrypt,
     asymmetric_encrypt,
+    measurement_resolution,
     report_date_time,
     sanitize_html,
+    stream_json,
     symmetric_decrypt,
     symmetric_encrypt,
     uuid,
@@ -97,6 +100,54 @@ class ReportDateTimeTest(unittest.TestCase):
         self.assertEqual("2019-03-03T10:04:05.123456+00:00", report_date_time())
 
 
+@patch("utils.functions.bottle.request")
+class MeasurementResolutionTest(unittest.TestCase):
+    """Unit tests for the measurement resolution method."""
+
+    def test_resolution(self, request):
+        """Test that the resolution can be parsed from the HTTP request."""
+        request.query = {"resolution": "week"}
+        self.assertEqual("week", measurement_resolution())
+
+    def test_missing_resolution(self, request):
+        """Test that the resolution is None if it's not present in the request."""
+        request.query = {}
+        self.assertIsNone(measurement_resolution())
+
+    def test_unknown_resolution(self, request):
+        """Test that the resolution is None if it's not a known resolution, so the raw measurements are returned."""
+        request.query = {"resolution": "raw"}
+        self.assertIsNone(measurement_resolution())
+
+
+@patch("utils.functions.bottle.request")
+class StreamJSONTest(unittest.TestCase):
+    """Unit tests for the stream JSON method."""
+
+    def setUp(self):
+        """Override to create the documents."""
+        self.documents = [{"key": index} for index in range(5)]
+
+    def test_stream_json(self, request):
+        """Test that the documents are streamed as JSON in batches."""
+        request.get_header.return_value = "application/json"
+        chunks = list(stream_json("documents", iter(self.documents), batch_size=2))
+        self.assertEqual(5, len(chunks))  # Opening, three batches, and closing
+        self.assertEqual({"documents": self.documents}, json.loads("".join(chunks)))
+
+    def test_stream_json_without_documents(self, request):
+        """Test that an empty list is streamed if there are no documents."""
+        request.get_header.return_value = ""
+        self.assertEqual({"documents": []}, json.loads("".join(stream_json("documents", iter([])))))
+
+    def test_stream_ndjson(self, request):
+        """Test that the documents are streamed as newline delimited JSON if the client accepts it."""
+        request.get_header.return_value = "application/x-ndjson"
+        chunks = list(stream_json("documents", iter(self.documents), batch_size=2))
+        self.assertEqual(3, len(chunks))
+        self.assertEqual(self.documents, [json.loads(line) for line in "".join(chunks).splitlines()])
+
+
 class TestEncryption(unittest.TestCase):
     """Unit tests for the encryption and decryption utility functions."""
 
@@ -0,0 +1,48 @@
+"""Unit tests for the JSON patch module."""
+
+import unittest
+
+from utils.json_patch import apply_patch, create_patch
+
+
+class JSONPatchTest(unittest.TestCase):
+    """Unit tests for creating and applying JSON patches."""
+
+    def assert_patch(self, source: dict, target: dict, expected_patch: list) -> None:
+        """Assert that the patch is as expected and changes the source into the target, without changing the source."""
+        original_source = dict(source)
+        patch = create_patch(source, target)
+        self.assertEqual(expected_patch, patch)
+        patched = apply_patch(source, patch)
+        self.assertEqual(target, patched)
+        self.assertEqual(list(target), list(patched))
+        self.assertEqual(original_source, source)
+
+    def test_no_changes(self):
+        """Test that the patch of equal objects is empty."""
+        self.assert_patch({"a": {"b": [1]}}, {"a": {"b": [1]}}, [])
+
+    def test_add(self):
+        """Test that added keys are added."""
+        self.assert_patch({"a": {}}, {"a": {"b": 1}}, [{"op": "add", "path": "/a/b", "value": 1}])
+
+    def test_remove(self):
+        """Test that removed keys are removed."""
+        self.assert_patch({"a": {"b": 1}}, {"a": {}}, [{"op": "remove", "path": "/a/b"}])
+
+    def test_replace(self):
+        """Test that changed values are replaced."""
+        self.assert_patch({"a": {"b": [1]}}, {"a": {"b": [1, 2]}}, [{"op": "replace", "path": "/a/b", "value": [1, 2]}])
+
+    def test_replace_value_of_different_type(self):
+        """Test that values that are equal but of a different type are replaced."""
+        self.assert_patch({"a": 1}, {"a": True}, [{"op": "replace", "path": "/a", "value": True}])
+
+    def test_changed_key_order(self):
+        """Test that objects whose key order changes are replaced as a whole."""
+        target = {"a": {"c": 2, "b": 1}}
+        self.assert_patch({"a": {"b": 1, "c": 2}}, target, [{"op": "replace", "path": "/a", "value": target["a"]}])
+
+    def test_escape_keys(self):
+        """Test that keys with special characters are escaped."""
+        self.assert_patch({"a/b": {}}, {"a/b": {"~": 1}}, [{"op": "add", "path": "/a~1b/~0", "value": 1}])
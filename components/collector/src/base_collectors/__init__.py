@@ -1,6 +1,7 @@
 """Metric collectors."""
 
 from .api_source_collector import JenkinsPluginCollector, JenkinsPluginSourceUpToDatenessCollector
+from .collection_context import CollectionContext
 from .file_source_collector import (
     CSVFileSourceCollector,
     FileSourceCollector,
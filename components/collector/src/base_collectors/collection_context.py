@@ -0,0 +1,31 @@
+"""Collection context shared by the collectors of one collection round."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .host_limiter import HostLimiter
+from .parse_executor import ParseExecutor
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .lookup_cache import LookupCache
+    from .response_cache import ResponseCache
+    from .validator_cache import ValidatorCache
+
+
+@dataclass(frozen=True)
+class CollectionContext:
+    """The client session and the helpers that the metric and source collectors share.
+
+    The collector creates one context with long-lived helpers. The caches are optional; collectors without a cache
+    retrieve and parse everything themselves. Collectors that only parse, for example in a worker process, have no
+    client session.
+    """
+
+    session: aiohttp.ClientSession | None = None
+    host_limiter: HostLimiter = field(default_factory=HostLimiter)
+    parse_executor: ParseExecutor = field(default_factory=ParseExecutor)
+    response_cache: ResponseCache | None = None
+    lookup_cache: LookupCache | None = None
+    validator_cache: ValidatorCache | None = None
@@ -1,38 +1,53 @@
 """Metrics collector."""
 
 import asyncio
+import dataclasses
 import logging
 import pathlib
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, NoReturn, cast
+from typing import TYPE_CHECKING, NoReturn
 
 import aiohttp
-from dateutil.tz import tzutc
 
-from shared.database.reports import get_reports
-from shared.model.report import get_metrics_from_reports
 from shared.utils.functions import iso_timestamp
 
 from collector_utilities.log import get_logger
-from collector_utilities.type import JSONDict
-from database.measurements import create_measurement
 
 from . import config
+from .collection_context import CollectionContext
+from .host_limiter import HostLimiter
+from .lookup_cache import LookupCache
+from .measurement_writer import MeasurementWriter
 from .metric_collector import MetricCollector
+from .metric_index import MetricIndex
+from .parse_executor import ParseExecutor
+from .response_cache import ResponseCache
+from .scheduler import MetricScheduler
+from .shard import Shard
+from .validator_cache import ValidatorCache
 
 if TYPE_CHECKING:
     from pymongo.database import Database
 
     from shared.model.metric import Metric
+    from shared.utils.type import MetricId
 
 
 class Collector:
     """Collect measurements for all metrics."""
 
     def __init__(self, database: Database) -> None:
-        self.__previous_metrics: dict[str, Any] = {}
-        self.next_fetch: dict[str, datetime] = {}
         self.database: Database = database
+        self.metric_index = MetricIndex(database)
+        self.scheduler = MetricScheduler()
+        self.shard = Shard(database, config.REPLICA_ID, config.LEASE_DURATION) if config.SHARDING else None
+        self.context = CollectionContext(
+            host_limiter=HostLimiter(),
+            parse_executor=ParseExecutor(config.PARSE_PROCESSES, config.PARSE_THRESHOLD),
+            response_cache=ResponseCache(config.RESPONSE_CACHE_TTL),
+            lookup_cache=LookupCache(config.LOOKUP_CACHE_TTL),
+            validator_cache=ValidatorCache(),
+        )
+        self.measurement_writer = MeasurementWriter(database)
         self.running_tasks: set[asyncio.Task] = set()
 
     @staticmethod
@@ -62,54 +77,69 @@ class Collector:
                 self.__log_tasks("Waking up")
                 self.record_health()
                 self.collect_metrics(session)
-                self.__log_tasks(f"Going to sleep for {config.SLEEP_DURATION} seconds", config.MEASUREMENT_LIMIT)
-                await asyncio.sleep(config.SLEEP_DURATION)
+                sleep_duration = self.__sleep_duration()
+                self.__log_tasks(f"Going to sleep for {sleep_duration:.0f} seconds", config.MEASUREMENT_LIMIT)
+                await asyncio.sleep(sleep_duration)
 
     def collect_metrics(self, session: aiohttp.ClientSession) -> None:
-        """Collect measurements for metrics, prioritizing edited metrics."""
-        reports = get_reports(self.database)
-        metrics = get_metrics_from_reports(reports)
-        next_fetch = datetime.now(tz=tzutc()) + timedelta(seconds=config.MEASUREMENT_FREQUENCY)
-        nr_created_tasks = 0
-        for metric_uuid, metric in self.__sorted_by_edit_status(cast(JSONDict, metrics)):
-            if not self.__should_collect(metric_uuid, metric):
-                continue
-            task = asyncio.create_task(self.collect_metric(session, metric_uuid, metric, next_fetch))
+        """Collect measurements for metrics that are due, prioritizing edited metrics."""
+        self.measurement_writer.flush_if_due()
+        changed_metric_uuids = self.metric_index.update()
+        if self.shard:
+            # Schedule the metrics that moved to this replica and don't schedule the metrics of other replicas:
+            moved_metric_uuids = self.shard.update(self.metric_index.metrics)
+            changed_metric_uuids = [
+                metric_uuid
+                for metric_uuid in dict.fromkeys(changed_metric_uuids + moved_metric_uuids)
+                if metric_uuid in self.shard.metrics
+            ]
+        self.scheduler.schedule_now(changed_metric_uuids)
+        metrics = self.__metrics()
+        # Don't start more measurements than the limit allows, counting the measurements still running:
+        for metric_uuid in self.scheduler.pop_due(metrics, self.__capacity()):
+            task = asyncio.create_task(self.collect_metric(session, metric_uuid, metrics[metric_uuid]))
             self.running_tasks.add(task)  # Keep a reference to the task to prevent it from being garbage collected
             task.add_done_callback(self.running_tasks.discard)  # Remove the task from the running tasks when done
-            nr_created_tasks += 1
-            if nr_created_tasks >= config.MEASUREMENT_LIMIT:
-                break
-
-    async def collect_metric(
-        self,
-        session: aiohttp.ClientSession,
-        metric_uuid: str,
-        metric: Metric,
-        next_fetch: datetime,
-    ) -> None:
-        """Collect measurements for the metric and add them to the database."""
-        self.__previous_metrics[metric_uuid] = metric
-        self.next_fetch[metric_uuid] = next_fetch
+        logger = get_logger()
+        if logger.isEnabledFor(logging.INFO):  # The scheduler statistics take time linear in the number of metrics
+            queue_depth, lag = self.scheduler.stats()
+            logger.info("Scheduler: %d metric(s) due, lagging %.0f seconds behind", queue_depth, lag)
+        self.context.host_limiter.log_statistics()
+        self.context.parse_executor.log_statistics()
+        for cache in (self.context.response_cache, self.context.lookup_cache, self.context.validator_cache):
+            if cache:
+                cache.log_statistics()
+
+    async def collect_metric(self, session: aiohttp.ClientSession, metric_uuid: str, metric: Metric) -> None:
+        """Collect measurements for the metric and add them to the batch of measurements to write."""
         metric_collector_class = MetricCollector.get_subclass(metric["type"])
-        metric_collector = metric_collector_class(session, metric)
+        metric_collector = metric_collector_class(metric, dataclasses.replace(self.context, session=session))
         if measurement := await metric_collector.collect():
             measurement.metric_uuid = metric_uuid
             measurement.report_uuid = metric["report_uuid"]
-            create_measurement(self.database, measurement.as_dict())
+            self.measurement_writer.add(measurement.as_dict())
+        if all(task.done() for task in self.running_tasks - {asyncio.current_task()}):
+            self.measurement_writer.flush()  # This is the last running task, no need to wait for more measurements
+
+    def __metrics(self) -> dict[MetricId, Metric]:
+        """Return the metrics to measure: the metrics of this replica if sharding is enabled, else all metrics."""
+        return self.shard.metrics if self.shard else self.metric_index.metrics
 
-    def __sorted_by_edit_status(self, metrics: JSONDict) -> list[tuple[str, Any]]:
-        """First return the edited metrics, then the rest."""
-        return sorted(metrics.items(), key=lambda item: bool(self.__previous_metrics.get(item[0]) == item[1]))
+    def __capacity(self) -> int:
+        """Return the number of measurements that can be started without exceeding the measurement limit."""
+        return max(0, config.MEASUREMENT_LIMIT - len(self.running_tasks))
 
-    def __should_collect(self, metric_uuid: str, metric: dict) -> bool:
-        """Return whether the metric should be collected.
+    def __sleep_duration(self) -> float:
+        """Return how long to sleep: until the next metric is due, but not longer than the maximum sleep duration.
 
-        Metric should be collected when the user changes the configuration or when it has been collected too long ago.
+        If the maximum number of measurements is running, metrics that are due have to wait anyhow, so sleep the
+        maximum sleep duration.
         """
-        metric_edited = self.__previous_metrics.get(metric_uuid) != metric
-        metric_due = self.next_fetch.get(metric_uuid, datetime.min.replace(tzinfo=tzutc())) <= datetime.now(tz=tzutc())
-        return metric_edited or metric_due
+        seconds_until_next_due = self.scheduler.seconds_until_next_due(self.__metrics())
+        if seconds_until_next_due is None or not self.__capacity():
+            return config.SLEEP_DURATION
+        # Sleep at least one second to give the running tasks time to make progress:
+        return min(float(config.SLEEP_DURATION), max(1.0, seconds_until_next_due))
 
     def __log_tasks(self, event: str, warning_threshold: int = 0) -> None:
         """Log the number of running tasks."""
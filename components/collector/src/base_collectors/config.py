@@ -2,6 +2,7 @@
 
 import os
 import pathlib
+import socket
 import tempfile
 
 LOG_LEVEL = os.getenv("COLLECTOR_LOG_LEVEL", "WARNING")
@@ -9,4 +10,14 @@ HEALTH_CHECK_FILE = os.getenv("HEALTH_CHECK_FILE", str(pathlib.Path(tempfile.get
 SLEEP_DURATION = int(os.getenv("COLLECTOR_SLEEP_DURATION", "20"))
 MEASUREMENT_LIMIT = int(os.getenv("COLLECTOR_MEASUREMENT_LIMIT", "30"))
 MEASUREMENT_FREQUENCY = int(os.getenv("COLLECTOR_MEASUREMENT_FREQUENCY", str(15 * 60)))
+MEASUREMENT_JITTER = int(os.getenv("COLLECTOR_MEASUREMENT_JITTER", "60"))
+WRITE_INTERVAL = int(os.getenv("COLLECTOR_WRITE_INTERVAL", "10"))
 MEASUREMENT_TIMEOUT = int(os.getenv("COLLECTOR_MEASUREMENT_TIMEOUT", "120"))
+MAX_REQUESTS_PER_HOST = int(os.getenv("COLLECTOR_MAX_REQUESTS_PER_HOST", "20"))
+RESPONSE_CACHE_TTL = int(os.getenv("COLLECTOR_RESPONSE_CACHE_TTL", "60"))
+LOOKUP_CACHE_TTL = int(os.getenv("COLLECTOR_LOOKUP_CACHE_TTL", str(60 * 60)))
+PARSE_PROCESSES = int(os.getenv("COLLECTOR_PARSE_PROCESSES", "0"))
+PARSE_THRESHOLD = int(os.getenv("COLLECTOR_PARSE_THRESHOLD", str(1024 * 1024)))
+SHARDING = os.getenv("COLLECTOR_SHARDING", "False").lower() == "true"
+REPLICA_ID = os.getenv("COLLECTOR_REPLICA_ID", socket.gethostname())
+LEASE_DURATION = int(os.getenv("COLLECTOR_LEASE_DURATION", "120"))
@@ -1,5 +1,6 @@
 """File source collector base classes."""
 
+import asyncio
 import io
 import zipfile
 from abc import ABC
@@ -11,14 +12,19 @@ from urllib.parse import urlparse
 from bs4 import BeautifulSoup, Tag
 
 from collector_utilities.exceptions import ZipfileError
+from collector_utilities.functions import iterparse_xml
 from collector_utilities.type import JSON, URL, ElementMap, Response, Responses
 from model import Entities, SourceResponses
 
-from .source_collector import SourceCollector
+from .collection_context import CollectionContext
+from .source_collector import SourceCollector, TimeCollector
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
     from xml.etree.ElementTree import Element  # nosec # Element is not available from defusedxml, but only used as type
 
+    from collector_utilities.type import ElementAncestors
+
 
 class FakeResponse:
     """Fake a response because aiohttp.ClientResponse can not easily be instantiated directly."""
@@ -34,6 +40,10 @@ class FakeResponse:
         """Return the JSON version of the contents."""
         return cast(JSON, loads(self.contents))
 
+    async def read(self) -> bytes:
+        """Return the contents."""
+        return self.contents
+
     async def text(self) -> str:
         """Return the text version of the contents."""
         return str(self.contents.decode())
@@ -49,13 +59,21 @@ class FileSourceCollector(SourceCollector, ABC):
         responses = await super()._get_source_responses(*urls)
         unzipped_responses = []
         for url, response in zip(urls, responses, strict=True):
-            if await self.is_zipped(url, response):
+            if response.status != HTTPStatus.NOT_MODIFIED and await self.is_zipped(url, response):
                 unzipped_responses.extend(await self.__unzip(response))
             else:
                 unzipped_responses.append(response)
         responses[:] = unzipped_responses
         return responses
 
+    def _responses_determine_measurement(self) -> bool:
+        """Override to return True, unless the measurement depends on the current time.
+
+        Files are often unchanged between measurements. Source up-to-dateness collectors compare the date of the file
+        with the current date, so their measurement can change even if the file is unchanged.
+        """
+        return not isinstance(self, TimeCollector)
+
     def _headers(self) -> dict[str, str]:
         """Extend to add a private token to the headers, if present in the parameters."""
         headers = super()._headers()
@@ -113,8 +131,11 @@ class JSONFileSourceCollector(FileSourceCollector, ABC):
         entities = Entities()
         for response in responses:
             filename = response.filename if hasattr(response, "filename") else ""  # Zipped responses have a filename
-            json = await response.json(content_type=None)
-            entities.extend(self._parse_json(json, filename))
+            if self._parse_in_worker_process(len(contents := await response.read())):
+                entities.extend(await self._run_in_worker_process(parse_json_file, contents, filename))
+            else:
+                json = await response.json(content_type=None)
+                entities.extend(self._parse_json(json, filename))
         return entities
 
     def _parse_json(self, json: JSON, filename: str) -> Entities:
@@ -122,11 +143,40 @@ class JSONFileSourceCollector(FileSourceCollector, ABC):
         return Entities()  # Override in subclasses that return entities
 
 
+def parse_json_file(collector_class: type[SourceCollector], source: dict, contents: bytes, filename: str) -> Entities:
+    """Parse the entities from the contents of a JSON file. Used to parse big JSON files in a worker process."""
+    # Parsing needs no session or metric:
+    collector = cast(JSONFileSourceCollector, collector_class(None, source, CollectionContext()))
+    return collector._parse_json(loads(contents), filename)  # noqa: SLF001
+
+
 class XMLFileSourceCollector(FileSourceCollector, ABC):
     """Base class for source collectors that retrieve XML files."""
 
     file_extensions: ClassVar[list[str]] = ["xml"]
 
+    @staticmethod
+    async def _iterparse_source_response_xml[T](
+        response: Response,
+        tags: Collection[str],
+        parse_element: Callable[[Element, ElementAncestors], T | None],
+        allowed_root_tags: Collection[str] | None = None,
+    ) -> list[T]:
+        """Parse the XML from the source response incrementally and return the parsed elements with one of the tags.
+
+        The XML is parsed in a worker thread, so parsing big XML files does not block the event loop. The parse element
+        callback is called in the worker thread as well, for each element with one of the tags. Elements for which the
+        callback returns None are skipped.
+        """
+        contents = await response.read()
+
+        def parse() -> list[T]:
+            """Parse the elements."""
+            parsed_elements = (parse_element(*element) for element in iterparse_xml(contents, tags, allowed_root_tags))
+            return [parsed_element for parsed_element in parsed_elements if parsed_element is not None]
+
+        return await asyncio.to_thread(parse)
+
     @staticmethod
     def parent_map(tree: Element) -> ElementMap:
         """Return a map of child to parent relationships."""
@@ -141,3 +191,8 @@ class XMLFileSourceCollector(FileSourceCollector, ABC):
                 names.insert(0, name)
             element = parent
         return separator.join(names)
+
+    @staticmethod
+    def ancestor_names(ancestors: ElementAncestors, separator: str = "/") -> str:
+        """Return the ancestor names as one string in which the names are joined by the separator."""
+        return separator.join(name for ancestor in ancestors if (name := ancestor.attrib.get("name")))
@@ -0,0 +1,123 @@
+"""Limit the number of concurrent requests per source host."""
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from collector_utilities.log import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+@dataclass
+class HostStatistics:
+    """Request statistics of one host."""
+
+    in_flight: int = 0
+    waiting: int = 0
+    requests: int = 0  # Number of requests since the statistics were last logged
+    total_wait: float = 0.0  # Seconds waited since the statistics were last logged
+    max_wait: float = 0.0  # Longest wait in seconds since the statistics were last logged
+
+    def is_active(self) -> bool:
+        """Return whether there was any activity since the statistics were last logged."""
+        return bool(self.in_flight or self.waiting or self.requests)
+
+    def reset(self) -> None:
+        """Reset the statistics collected since the statistics were last logged."""
+        self.requests, self.total_wait, self.max_wait = 0, 0.0, 0.0
+
+
+class HostLimiter:
+    """Limit the number of concurrent requests per source host.
+
+    The collector shares one connection pool between all sources. Without a limit per host, a report with hundreds of
+    metrics for the same source opens hundreds of simultaneous connections to that source, causing the source to
+    throttle the collector or the connections to time out, while other sources have to wait.
+
+    Each request is limited, so collectors that retrieve multiple pages concurrently can't exceed the limit. Collectors
+    are admitted to a host with the same limit, so admitted collectors don't wait long for their requests.
+    """
+
+    def __init__(self) -> None:
+        self.__semaphores: dict[str, asyncio.Semaphore] = {}  # Semaphores to limit the requests per host
+        self.__admissions: dict[str, asyncio.Semaphore] = {}  # Semaphores to limit the collectors per host
+        self.__statistics: dict[str, HostStatistics] = {}
+
+    @contextlib.asynccontextmanager
+    async def admit(self, url: str, max_concurrent_requests: int) -> AsyncIterator[None]:
+        """Wait until a collector can start retrieving from the host of the URL.
+
+        The maximum number of concurrent collectors is determined by the first collector admitted to the host.
+        """
+        if not (host := self.host(url)):
+            yield  # Nothing to limit, for example because the source has no URL
+            return
+        async with self.__semaphore(self.__admissions, host, max_concurrent_requests):
+            yield
+
+    @contextlib.asynccontextmanager
+    async def limit(self, url: str, max_concurrent_requests: int) -> AsyncIterator[None]:
+        """Wait until a request to the host of the URL can be made.
+
+        The maximum number of concurrent requests is determined by the first request to the host.
+        """
+        if not (host := self.host(url)):
+            yield  # Nothing to limit, for example because the source has no URL
+            return
+        semaphore = self.__semaphore(self.__semaphores, host, max_concurrent_requests)
+        statistics = self.__statistics.setdefault(host, HostStatistics())
+        statistics.waiting += 1
+        start = time.monotonic()
+        try:
+            await semaphore.acquire()
+        finally:
+            statistics.waiting -= 1
+        wait = time.monotonic() - start
+        statistics.requests += 1
+        statistics.total_wait += wait
+        statistics.max_wait = max(statistics.max_wait, wait)
+        statistics.in_flight += 1
+        try:
+            yield
+        finally:
+            statistics.in_flight -= 1
+            semaphore.release()
+
+    @staticmethod
+    def __semaphore(semaphores: dict[str, asyncio.Semaphore], host: str, limit: int) -> asyncio.Semaphore:
+        """Return the semaphore of the host, creating it if the host has no semaphore yet."""
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(limit)
+        return semaphores[host]
+
+    @staticmethod
+    def host(url: str) -> str:
+        """Return the host, including the port if any, of the URL, without credentials."""
+        return urlsplit(url).netloc.rpartition("@")[2]
+
+    def statistics(self, host: str) -> HostStatistics:
+        """Return the statistics of the host."""
+        return self.__statistics.get(host, HostStatistics())
+
+    def log_statistics(self) -> None:
+        """Log the statistics per host and reset them."""
+        logger = get_logger()
+        for host, statistics in sorted(self.__statistics.items()):
+            if not statistics.is_active():
+                continue
+            logger.info(
+                "Host %s: %d request(s) in flight, %d waiting, %d started since the previous wake-up "
+                "(wait time: %.1fs average, %.1fs max)",
+                host,
+                statistics.in_flight,
+                statistics.waiting,
+                statistics.requests,
+                statistics.total_wait / statistics.requests if statistics.requests else 0.0,
+                statistics.max_wait,
+            )
+            statistics.reset()
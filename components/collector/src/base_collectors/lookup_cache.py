@@ -0,0 +1,25 @@
+"""Cache for lookups of source metadata."""
+
+from typing import TYPE_CHECKING, Any
+
+from .task_cache import TaskCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Hashable
+
+
+class LookupCache(TaskCache):
+    """Cache the results of lookups of source metadata, such as the fields of a Jira instance, for a longer time.
+
+    Collectors of different metrics often need the same metadata of a source before they can retrieve the actual
+    data, for example the mapping of Jira field names to field ids. Unlike the response cache, the lookup cache keeps
+    the parsed results of lookups, with a time to live that is long enough to span multiple collection cycles. The key
+    of a lookup consists of the URL and the credentials used for the lookup. Collectors must not change the results,
+    as they are shared.
+    """
+
+    NAME = "Lookup cache"
+
+    async def get[T](self, key: Hashable, lookup: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Return the lookup result from the cache or, if the cache has no fresh result, do the lookup."""
+        return await self._get(key, lookup)
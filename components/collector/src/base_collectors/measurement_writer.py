@@ -0,0 +1,51 @@
+"""Write measurements to the database in batches."""
+
+import time
+from typing import TYPE_CHECKING
+
+from collector_utilities.log import get_logger
+from database.measurements import create_measurements
+
+from . import config
+
+if TYPE_CHECKING:
+    from pymongo.database import Database
+
+
+class MeasurementWriter:
+    """Collect new measurements and write them to the database in batches.
+
+    The measurements are written when the batch is full, when the oldest measurement in the batch has waited longer
+    than the write interval, or when the collector asks for the measurements to be written, for example because no
+    more measurements are underway.
+    """
+
+    MAX_BATCH_SIZE = 100
+
+    def __init__(self, database: Database) -> None:
+        self.__database = database
+        self.__batch: list[dict] = []
+        self.__oldest = 0.0  # Monotonic time at which the oldest measurement in the batch was added
+
+    def add(self, measurement_data: dict) -> None:
+        """Add the measurement to the batch and write the batch if it is full or has waited long enough."""
+        if not self.__batch:
+            self.__oldest = time.monotonic()
+        self.__batch.append(measurement_data)
+        if len(self.__batch) >= self.MAX_BATCH_SIZE:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        """Write the batch if the oldest measurement in the batch has waited longer than the write interval."""
+        if self.__batch and time.monotonic() - self.__oldest >= config.WRITE_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the batch to the database."""
+        if not self.__batch:
+            return
+        batch, self.__batch = self.__batch, []
+        create_measurements(self.__database, batch)
+        get_logger().info("Wrote a batch of %d measurement(s)", len(batch))
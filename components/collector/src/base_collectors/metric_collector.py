@@ -12,18 +12,18 @@ from .source_collector import SourceCollector, SourceParameters
 if TYPE_CHECKING:
     from collections.abc import Coroutine
 
-    import aiohttp
-
     from shared.model.metric import Metric
 
+    from .collection_context import CollectionContext
+
 
 class MetricCollector:
     """Collect measurements for a specific metric."""
 
     subclasses: ClassVar[set[type[MetricCollector]]] = set()
 
-    def __init__(self, session: aiohttp.ClientSession, metric: Metric) -> None:
-        self.__session = session
+    def __init__(self, metric: Metric, context: CollectionContext) -> None:
+        self.__context = context
         self._metric = metric
         self._parameters = {
             source_uuid: SourceParameters(source) for source_uuid, source in self._metric["sources"].items()
@@ -63,7 +63,7 @@ class MetricCollector:
         for source in self._metric["sources"].values():
             collector_class = SourceCollector.get_subclass(source["type"], self._metric["type"])
             if collector_class and self.__has_all_mandatory_parameters(source):
-                collectors.append(collector_class(self.__session, self._metric, source))
+                collectors.append(self.__source_collector(collector_class, source))
             else:
                 return []
         return [collector.collect() for collector in collectors]
@@ -75,11 +75,15 @@ class MetricCollector:
         has_tracker = bool(tracker_type and tracker.get("parameters", {}).get("url"))
         if has_tracker and (collector_class := SourceCollector.get_subclass(tracker_type, "issue_status")):
             return [
-                collector_class(self.__session, self._metric, tracker).collect_issue_status(issue_id)
+                self.__source_collector(collector_class, tracker).collect_issue_status(issue_id)
                 for issue_id in self._metric.get("issue_ids", [])
             ]
         return []
 
+    def __source_collector(self, collector_class: type[SourceCollector], source) -> SourceCollector:
+        """Create a source collector for the source."""
+        return collector_class(self._metric, source, self.__context)
+
     def __has_all_mandatory_parameters(self, source) -> bool:
         """Return whether the user has specified all mandatory parameters for the source."""
         parameters = DATA_MODEL.sources[source["type"]].parameters
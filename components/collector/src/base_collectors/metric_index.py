@@ -0,0 +1,89 @@
+"""Index of the metrics in the database."""
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from shared.model.report import Report, get_metrics_from_reports
+from shared_data_model.snapshot import data_model_snapshot
+
+from collector_utilities.log import get_logger
+from database.reports import latest_reports_changed_since
+
+if TYPE_CHECKING:
+    from pymongo.database import Database
+
+    from shared.model.metric import Metric
+    from shared.utils.type import MetricId, ReportId
+
+
+class MetricIndex:
+    """Keep an in-memory index of all metrics, updated incrementally from the reports that changed.
+
+    Deserializing all reports on every wake-up of the collector is expensive. Instead, the index remembers the
+    timestamp of the most recent report it has seen and only loads reports that changed since then.
+    """
+
+    # Reports are inserted shortly after their timestamp is determined. Look back a bit further than the most recent
+    # timestamp seen to not miss reports that were inserted later than reports with a more recent timestamp:
+    LOOK_BACK = timedelta(seconds=60)
+
+    def __init__(self, database: Database) -> None:
+        self.__database = database
+        self.__metrics: dict[MetricId, Metric] = {}
+        self.__metric_uuids_by_report: dict[ReportId, set[MetricId]] = {}
+        self.__report_timestamps: dict[ReportId, str] = {}
+        self.__most_recent_timestamp = ""
+
+    @property
+    def metrics(self) -> dict[MetricId, Metric]:
+        """Return the metrics, indexed by metric uuid."""
+        return self.__metrics
+
+    def update(self) -> list[MetricId]:
+        """Update the index with the reports that changed since the previous update.
+
+        Return the uuids of the metrics that were added or edited since the previous update.
+        """
+        report_dicts_by_uuid: dict[ReportId, list[dict]] = {}
+        for report_dict in latest_reports_changed_since(self.__database, self.__min_timestamp()):
+            report_dicts_by_uuid.setdefault(report_dict["report_uuid"], []).append(report_dict)
+        nr_changed_reports, changed_metric_uuids = 0, []
+        for report_uuid, report_dicts in report_dicts_by_uuid.items():
+            timestamp = max(report_dict.get("timestamp", "") for report_dict in report_dicts)
+            if timestamp and self.__report_timestamps.get(report_uuid) == timestamp:
+                continue  # This version of the report is already in the index
+            changed_metric_uuids.extend(self.__update_report(report_uuid, report_dicts))
+            self.__report_timestamps[report_uuid] = timestamp
+            self.__most_recent_timestamp = max(self.__most_recent_timestamp, timestamp)
+            nr_changed_reports += 1
+        get_logger().info(
+            "Updated the metric index with %d changed report(s) and %d changed metric(s)",
+            nr_changed_reports,
+            len(changed_metric_uuids),
+        )
+        return changed_metric_uuids
+
+    def __min_timestamp(self) -> str:
+        """Return the minimum timestamp of the reports to load. Return an empty string to load all reports."""
+        if not self.__most_recent_timestamp or "" in self.__report_timestamps.values():
+            return ""  # Reports without timestamp can't be loaded incrementally
+        return (datetime.fromisoformat(self.__most_recent_timestamp) - self.LOOK_BACK).isoformat()
+
+    def __update_report(self, report_uuid: ReportId, report_dicts: list[dict]) -> list[MetricId]:
+        """Replace the metrics of the report in the index with the metrics of the new version of the report.
+
+        Return the uuids of the metrics that were added or edited.
+        """
+        old_metrics = {}
+        for metric_uuid in self.__metric_uuids_by_report.pop(report_uuid, set()):
+            # Only remove the metric if it wasn't moved to another report that was already processed:
+            if self.__metrics.get(metric_uuid, {}).get("report_uuid") == report_uuid:
+                old_metrics[metric_uuid] = self.__metrics.pop(metric_uuid)
+        reports = [
+            Report(data_model_snapshot(), report_dict) for report_dict in report_dicts if "deleted" not in report_dict
+        ]
+        metrics = get_metrics_from_reports(reports)
+        self.__metrics.update(metrics)
+        self.__metric_uuids_by_report[report_uuid] = set(metrics)
+        # Note that Metric.__eq__ only compares uuids, but != compares the metrics as dicts:
+        return [metric_uuid for metric_uuid, metric in metrics.items() if old_metrics.get(metric_uuid) != metric]
@@ -0,0 +1,79 @@
+"""Parse big source responses in worker processes."""
+
+import asyncio
+import contextlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from collector_utilities.log import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@dataclass
+class ParseStatistics:
+    """Parse statistics of one collector class."""
+
+    parses: int = 0  # Number of parses since the statistics were last logged
+    offloaded: int = 0  # Number of parses done in a worker process since the statistics were last logged
+    total_duration: float = 0.0  # Seconds spent parsing since the statistics were last logged
+    max_duration: float = 0.0  # Longest parse in seconds since the statistics were last logged
+
+
+class ParseExecutor:
+    """Parse big source responses in worker processes and keep track of the time spent parsing per collector class.
+
+    The collector runs all source collectors on one event loop. Parsing a big response, for example a JSON file with
+    thousands of security warnings, blocks the event loop, delaying the retrieval and parsing of all other sources. If
+    the number of worker processes is larger than zero, collectors can parse responses of at least the size threshold
+    in a worker process, so the event loop is free to do other work and parsing scales with the number of cores.
+    """
+
+    def __init__(self, max_workers: int = 0, size_threshold: int = 0) -> None:
+        self.__pool = ProcessPoolExecutor(max_workers) if max_workers > 0 else None
+        self.__size_threshold = size_threshold
+        self.__statistics: dict[str, ParseStatistics] = {}
+
+    def offloads(self, size: int) -> bool:
+        """Return whether a response of the given size in bytes should be parsed in a worker process."""
+        return self.__pool is not None and size >= self.__size_threshold
+
+    async def run_in_worker_process[*Ts, T](self, collector_name: str, function: Callable[[*Ts], T], *args: *Ts) -> T:
+        """Call the function in a worker process. The function and its arguments and result need to be picklable."""
+        self.__statistics.setdefault(collector_name, ParseStatistics()).offloaded += 1
+        return await asyncio.get_running_loop().run_in_executor(self.__pool, function, *args)
+
+    @contextlib.contextmanager
+    def timed(self, collector_name: str) -> Iterator[None]:
+        """Record the time spent parsing by the collector."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - start
+            statistics = self.__statistics.setdefault(collector_name, ParseStatistics())
+            statistics.parses += 1
+            statistics.total_duration += duration
+            statistics.max_duration = max(statistics.max_duration, duration)
+
+    def statistics(self, collector_name: str) -> ParseStatistics:
+        """Return the statistics of the collector class."""
+        return self.__statistics.get(collector_name, ParseStatistics())
+
+    def log_statistics(self) -> None:
+        """Log the statistics per collector class and reset them."""
+        logger = get_logger()
+        for collector_name, statistics in sorted(self.__statistics.items()):
+            logger.info(
+                "Parser %s: %d response(s) parsed since the previous wake-up, %d in a worker process "
+                "(parse time: %.1fs average, %.1fs max)",
+                collector_name,
+                statistics.parses,
+                statistics.offloaded,
+                statistics.total_duration / statistics.parses if statistics.parses else 0.0,
+                statistics.max_duration,
+            )
+        self.__statistics.clear()
@@ -0,0 +1,40 @@
+"""Short-lived cache for source responses."""
+
+from typing import TYPE_CHECKING
+
+from .task_cache import TaskCache
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from collector_utilities.type import URL, Response
+
+type CacheKey = tuple[URL, tuple[tuple[str, str], ...], aiohttp.BasicAuth | None]
+
+
+class ResponseCache(TaskCache):
+    """Cache responses for identical requests for a short time.
+
+    Many metrics retrieve the same URL from the same source, for example when several SonarQube metrics need the same
+    measures of a component. Requests for the same URL, with the same headers and credentials, share the response.
+    The body of the response is read before the response is shared, so each collector can parse the response.
+    """
+
+    NAME = "Response cache"
+    RESULTS = "response(s)"
+
+    async def get(
+        self, session: aiohttp.ClientSession, url: URL, headers: dict[str, str], auth: aiohttp.BasicAuth | None
+    ) -> Response:
+        """Return the response from the cache or, if the cache has no fresh response, get the URL."""
+        key: CacheKey = (url, tuple(sorted(headers.items())), auth)
+        return await self._get(key, lambda: self.__get(session, url, headers, auth))
+
+    @staticmethod
+    async def __get(
+        session: aiohttp.ClientSession, url: URL, headers: dict[str, str], auth: aiohttp.BasicAuth | None
+    ) -> Response:
+        """Get the URL and read the response body so the response can be parsed multiple times."""
+        response = await session.get(url, allow_redirects=True, headers=headers, auth=auth)
+        await response.read()
+        return response
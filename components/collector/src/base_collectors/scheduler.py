@@ -0,0 +1,116 @@
+"""Deadline scheduler for metrics."""
+
+import heapq
+import itertools
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from dateutil.tz import tzutc
+
+from . import config
+
+if TYPE_CHECKING:
+    from collections.abc import Container, Iterable
+
+    from shared.utils.type import MetricId
+
+
+@dataclass(frozen=True, order=True)
+class ScheduleEntry:
+    """Entry in the schedule. Entries are ordered by priority first, then by due date, then by order of scheduling."""
+
+    priority: int
+    due: datetime
+    sequence_number: int
+    metric_uuid: MetricId
+
+
+class MetricScheduler:
+    """Keep track of when metrics need to be measured, using a heap ordered by the time metrics are due.
+
+    Edited metrics get priority over other metrics. New and rescheduled metrics get a random jitter added to their due
+    date to prevent metrics that were added at the same time, for example when the collector starts, from being
+    measured in bursts forever.
+
+    Rather than removing entries from the heap when metrics are rescheduled, the scheduler keeps the current entry per
+    metric and ignores outdated entries when they reach the top of the heap.
+    """
+
+    EDITED, REGULAR = 0, 1  # Priorities
+
+    def __init__(self) -> None:
+        self.__heap: list[ScheduleEntry] = []
+        self.__entries: dict[MetricId, ScheduleEntry] = {}
+        self.__sequence_numbers = itertools.count()
+
+    def schedule_now(self, metric_uuids: Iterable[MetricId], now: datetime | None = None) -> None:
+        """Schedule the new or edited metrics to be measured as soon as possible.
+
+        Metrics that were already scheduled have been edited and jump the queue. New metrics are spread over the
+        measurement jitter.
+        """
+        now = now or datetime.now(tz=tzutc())
+        for metric_uuid in metric_uuids:
+            if metric_uuid in self.__entries:
+                self.__schedule(metric_uuid, now, self.EDITED)
+            else:
+                self.__schedule(metric_uuid, now + self.__jitter(), self.REGULAR)
+
+    def pop_due(self, metric_uuids: Container[MetricId], limit: int, now: datetime | None = None) -> list[MetricId]:
+        """Return at most limit metrics that are due and reschedule them.
+
+        Metrics that are not in metric_uuids anymore, for example because they were deleted, are dropped.
+        """
+        now = now or datetime.now(tz=tzutc())
+        due_metric_uuids: list[MetricId] = []
+        while len(due_metric_uuids) < limit and (entry := self.__peek(metric_uuids)) and entry.due <= now:
+            due_metric_uuids.append(entry.metric_uuid)
+            self.__schedule(entry.metric_uuid, self.__next_due(now), self.REGULAR)
+        return due_metric_uuids
+
+    def seconds_until_next_due(self, metric_uuids: Container[MetricId], now: datetime | None = None) -> float | None:
+        """Return the number of seconds until the next metric is due, or None if no metrics are scheduled."""
+        if entry := self.__peek(metric_uuids):
+            return max(0.0, (entry.due - (now or datetime.now(tz=tzutc()))).total_seconds())
+        return None
+
+    def stats(self, now: datetime | None = None) -> tuple[int, float]:
+        """Return the number of metrics that are due and the lag, in seconds, of the metric that is overdue longest.
+
+        This takes time linear in the number of scheduled metrics, so only call it when the statistics are logged.
+        """
+        now = now or datetime.now(tz=tzutc())
+        overdue = [entry.due for entry in self.__entries.values() if entry.due <= now]
+        return len(overdue), (now - min(overdue)).total_seconds() if overdue else 0.0
+
+    def __schedule(self, metric_uuid: MetricId, due: datetime, priority: int) -> None:
+        """Schedule the metric, replacing any existing entry of the metric."""
+        entry = ScheduleEntry(priority, due, next(self.__sequence_numbers), metric_uuid)
+        self.__entries[metric_uuid] = entry
+        heapq.heappush(self.__heap, entry)
+
+    def __peek(self, metric_uuids: Container[MetricId]) -> ScheduleEntry | None:
+        """Return the first entry of the heap, after discarding outdated entries and entries of removed metrics."""
+        while self.__heap:
+            entry = self.__heap[0]
+            if self.__entries.get(entry.metric_uuid) is not entry:
+                heapq.heappop(self.__heap)  # Outdated entry, the metric has been rescheduled since
+            elif entry.metric_uuid not in metric_uuids:
+                heapq.heappop(self.__heap)
+                del self.__entries[entry.metric_uuid]
+            else:
+                return entry
+        return None
+
+    @classmethod
+    def __next_due(cls, now: datetime) -> datetime:
+        """Return the next due date, with jitter."""
+        return now + timedelta(seconds=config.MEASUREMENT_FREQUENCY) + cls.__jitter()
+
+    @staticmethod
+    def __jitter() -> timedelta:
+        """Return a random jitter to add to due dates."""
+        jitter = random.uniform(0, config.MEASUREMENT_JITTER)  # noqa: S311 # nosec B311 # Not used for security
+        return timedelta(seconds=jitter)
@@ -0,0 +1,87 @@
+"""Divide the metrics over the collector replicas."""
+
+import bisect
+import hashlib
+from typing import TYPE_CHECKING
+
+from collector_utilities.log import get_logger
+from database.replicas import live_replicas, renew_lease
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pymongo.database import Database
+
+    from shared.model.metric import Metric
+    from shared.utils.type import MetricId
+
+
+class HashRing:
+    """Consistent hash ring that maps keys to nodes.
+
+    Each node is placed on the ring a number of times, at the hashes of its virtual nodes. A key belongs to the first
+    node at or after the hash of the key. When a node joins or leaves the ring, only the keys of the ring segments
+    next to the virtual nodes of that node move to another node.
+    """
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = 100) -> None:
+        ring = sorted((self.__hash(f"{node}-{index}"), node) for node in nodes for index in range(virtual_nodes))
+        self.__hashes = [node_hash for node_hash, _node in ring]
+        self.__nodes = [node for _node_hash, node in ring]
+
+    def node(self, key: str) -> str | None:
+        """Return the node the key belongs to, or None if the ring has no nodes."""
+        if not self.__nodes:
+            return None
+        index = bisect.bisect_left(self.__hashes, self.__hash(key))
+        return self.__nodes[index % len(self.__nodes)]
+
+    @staticmethod
+    def __hash(key: str) -> int:
+        """Return the position of the key on the ring."""
+        return int(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest(), 16)
+
+
+class Shard:
+    """Keep track of the metrics this collector replica measures, if multiple collector replicas share the metrics.
+
+    Each replica has a lease in the database that it renews every time it wakes up. Replicas whose lease has expired,
+    because they were stopped or because they stopped waking up, are considered gone. The metrics are divided over the
+    live replicas with a consistent hash ring on the metric uuid, so when a replica joins or leaves, only the metrics
+    of that replica move to other replicas. Because replicas notice a change in replicas at their next wake-up, a
+    metric may briefly be measured by two replicas, or by none, while the metrics are being rebalanced.
+    """
+
+    def __init__(self, database: Database, replica_id: str, lease_duration: int) -> None:
+        self.__database = database
+        self.__replica_id = replica_id
+        self.__lease_duration = lease_duration
+        self.__replicas: list[str] = []
+        self.__ring = HashRing([])
+        self.__metrics: dict[MetricId, Metric] = {}
+
+    @property
+    def metrics(self) -> dict[MetricId, Metric]:
+        """Return the metrics of this replica, indexed by metric uuid."""
+        return self.__metrics
+
+    def update(self, metrics: dict[MetricId, Metric]) -> list[MetricId]:
+        """Renew the lease of this replica and determine which of the metrics belong to this replica.
+
+        Return the uuids of the metrics that moved to this replica, including new metrics that belong to this replica.
+        """
+        renew_lease(self.__database, self.__replica_id, self.__lease_duration)
+        if (replicas := live_replicas(self.__database)) != self.__replicas:
+            self.__replicas = replicas
+            self.__ring = HashRing(replicas)
+            get_logger().info("Replica %s: %d collector replica(s) live", self.__replica_id, len(replicas))
+        old_metrics, self.__metrics = (
+            self.__metrics,
+            {
+                metric_uuid: metric
+                for metric_uuid, metric in metrics.items()
+                if self.__ring.node(metric_uuid) == self.__replica_id
+            },
+        )
+        get_logger().info("Replica %s: %d of %d metric(s) owned", self.__replica_id, len(self.__metrics), len(metrics))
+        return [metric_uuid for metric_uuid in self.__metrics if metric_uuid not in old_metrics]
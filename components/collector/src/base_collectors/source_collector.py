@@ -1,14 +1,17 @@
 """Source collector base classes."""
 
 import asyncio
+import hashlib
 import re
 import traceback
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, ClassVar, TypedDict, cast
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, cast
 
 import aiohttp
 from packaging.version import InvalidVersion, Version
 
+from shared.utils.functions import md5_hash
 from shared.utils.type import Direction
 from shared_data_model import DATA_MODEL
 
@@ -19,10 +22,15 @@ from collector_utilities.log import get_logger
 from collector_utilities.type import URL, Response, Responses, Value
 from model import Entities, Entity, IssueStatus, SourceMeasurement, SourceParameters, SourceResponses
 
+from .config import MAX_REQUESTS_PER_HOST
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Coroutine, Sequence
+    from contextlib import AbstractAsyncContextManager
     from datetime import datetime
 
+    from .collection_context import CollectionContext
+
 
 class SourceCollector:
     """Base class for source collectors.
@@ -32,19 +40,30 @@ class SourceCollector:
     """
 
     source_type = ""  # The source type is set on the subclass, when the subclass is registered
+    MAX_CONCURRENT_PAGES = 10  # The maximum number of pages of one paginated URL to retrieve concurrently
     subclasses: ClassVar[set[type[SourceCollector]]] = set()
 
-    def __init__(self, session: aiohttp.ClientSession, metric, source) -> None:
-        self._session = session
+    def __init__(self, metric, source, context: CollectionContext) -> None:
         self._metric = metric
         self._issue_id = ""
+        self.__source = source
         self.__parameters = SourceParameters(source)
+        self.__context = context
+        self.__validators: dict[URL, dict[str, str]] = {}  # Validators of the responses of the current collection
 
     def __init_subclass__(cls) -> None:
         """Register the subclass as source collector."""
         SourceCollector.subclasses.add(cls)
         super().__init_subclass__()
 
+    @property
+    def _session(self) -> aiohttp.ClientSession:
+        """Return the client session to retrieve the source responses with."""
+        if self.__context.session is None:
+            error_message = f"{self.__class__.__name__} has no client session to retrieve source responses with"
+            raise CollectorError(error_message)
+        return self.__context.session
+
     @classmethod
     def get_subclass(cls, source_type: str, metric_type: str) -> type[SourceCollector] | None:
         """Return the subclass registered for the source/metric name.
@@ -65,9 +84,14 @@ class SourceCollector:
     async def collect(self) -> SourceMeasurement:
         """Return the measurement from this source."""
         responses = await self.__safely_get_source_responses()
+        if self.__context.validator_cache and self.__not_modified(responses):
+            return self.__context.validator_cache.measurement(self.__validator_cache_key())
         measurement = await self.__safely_parse_source_responses(responses)
         measurement.api_url = responses.api_url
         measurement.landing_url = await self.__safely_parse_landing_url(responses)
+        if self._responses_determine_measurement() and not measurement.has_error:
+            measurement.payload_hash = await self.__payload_hash(responses)
+        self.__cache_validators(measurement)
         return measurement
 
     async def collect_issue_status(self, issue_id: str) -> IssueStatus:
@@ -98,9 +122,12 @@ class SourceCollector:
         try:
             api_url = await self._api_url()
             safe_api_url = tokenless(api_url) or class_name
-            logger.info("%s retrieving %s", class_name, safe_api_url)
-            responses = await asyncio.wait_for(self._get_source_responses(api_url), timeout=self._session.timeout.total)
-            logger.info("%s retrieved %s", class_name, safe_api_url)
+            # Wait for the host to admit the collector before starting the time-out:
+            async with self.__context.host_limiter.admit(api_url, self.__max_concurrent_requests()):
+                logger.info("%s retrieving %s", class_name, safe_api_url)
+                timeout = self._session.timeout.total
+                responses = await asyncio.wait_for(self._get_source_responses(api_url), timeout=timeout)
+                logger.info("%s retrieved %s", class_name, safe_api_url)
         except (TimeoutError, CollectorError, aiohttp.ClientError) as reason:
             error = self.__logsafe_exception(reason)
             logger.warning("%s failed to retrieve %s: %s", class_name, safe_api_url, error)
@@ -112,21 +139,70 @@ class SourceCollector:
             responses = SourceResponses(api_url=URL(api_url), connection_error=error)
         return responses
 
+    def __max_concurrent_requests(self) -> int:
+        """Return the maximum number of concurrent requests to the host of the source."""
+        source = DATA_MODEL.sources.get(self.source_type)
+        source_maximum = source.max_concurrent_requests if source else None
+        return min(MAX_REQUESTS_PER_HOST, source_maximum or MAX_REQUESTS_PER_HOST)
+
+    def _limit_host(self, url: str) -> AbstractAsyncContextManager[None]:
+        """Return a context manager that waits until a request to the host of the URL can be made.
+
+        Collectors that use the client session directly, instead of via _get_source_responses(), should make their
+        requests in this context.
+        """
+        return self.__context.host_limiter.limit(url, self.__max_concurrent_requests())
+
+    def _max_concurrent_pages(self) -> int:
+        """Return the maximum number of pages of one paginated URL to retrieve concurrently."""
+        return min(self.MAX_CONCURRENT_PAGES, self.__max_concurrent_requests())
+
     @staticmethod
     def __logsafe_exception(exception: Exception) -> str:
         """Return a log-safe version of the exception."""
         return tokenless(str(exception)) if str(exception) else exception.__class__.__name__
 
     async def _get_source_responses(self, *urls: URL) -> SourceResponses:
-        """Open the url(s). Can be overridden if a post request is needed or serial requests need to be made."""
+        """Open the url(s). Can be overridden if a post request is needed or serial requests need to be made.
+
+        If the collector makes conditional requests and some, but not all, URLs turn out to be not modified, the
+        responses need to be parsed anyway, so get the URLs that were not modified again, unconditionally.
+        """
+        urls_to_get = [url for url in urls if url]
+        responses = await self.__get(urls_to_get, conditional=True)
+        not_modified = [self.__is_not_modified(url, resp) for url, resp in zip(urls_to_get, responses, strict=True)]
+        if any(not_modified) and not all(not_modified):
+            urls_to_get_again = [url for url, unchanged in zip(urls_to_get, not_modified, strict=True) if unchanged]
+            responses_again = iter(await self.__get(urls_to_get_again, conditional=False))
+            responses = [
+                next(responses_again) if unchanged else response
+                for response, unchanged in zip(responses, not_modified, strict=True)
+            ]
+        if self.__context.validator_cache and self._responses_determine_measurement():
+            for url, response in zip(urls_to_get, responses, strict=True):
+                self.__validators[url] = self.__response_validators(response)
+        return SourceResponses(responses=responses, api_url=urls[0])
+
+    async def __get(self, urls: Sequence[URL], *, conditional: bool) -> Responses:
+        """Get the urls, conditionally if the validator cache has validators for the URLs and conditional is True."""
         auth = aiohttp.BasicAuth(*credentials) if (credentials := self._basic_auth_credentials()) else None
         headers = self._headers()
-        tasks = [self._session.get(url, allow_redirects=True, headers=headers, auth=auth) for url in urls if url]
+        tasks = [
+            self.__get_url(url, headers | self.__conditional_headers(url) if conditional else headers, auth)
+            for url in urls
+        ]
         responses = await asyncio.gather(*tasks, return_exceptions=True)
         for response in responses:
             if isinstance(response, Exception):
                 raise response
-        return SourceResponses(responses=cast(Responses, responses), api_url=urls[0])
+        return cast(Responses, responses)
+
+    async def __get_url(self, url: URL, headers: dict[str, str], auth: aiohttp.BasicAuth | None) -> Response:
+        """Get the url, via the response cache if there is one."""
+        async with self._limit_host(url):
+            if self.__context.response_cache:
+                return await self.__context.response_cache.get(self._session, url, headers, auth)
+            return await self._session.get(url, allow_redirects=True, headers=headers, auth=auth)
 
     def _basic_auth_credentials(self) -> tuple[str, str] | None:
         """Return the basic authentication credentials, if any."""
@@ -139,6 +215,77 @@ class SourceCollector:
         """Return the headers for the get request."""
         return {}
 
+    async def _cached_lookup[T](
+        self, url: URL, lookup: Callable[[], Coroutine[Any, Any, T]], credentials: tuple[str, ...] | None = None
+    ) -> T:
+        """Return the result of the lookup of metadata at the URL, from the lookup cache if possible.
+
+        The lookup cache is shared by all source collectors, so collectors that look up the same URL with the same
+        credentials share the result. The credentials default to the credentials and headers of the source.
+        """
+        if self.__context.lookup_cache is None:
+            return await lookup()
+        if credentials is None:
+            headers = tuple(f"{name}: {value}" for name, value in sorted(self._headers().items()))
+            credentials = (*(self._basic_auth_credentials() or ()), *headers)
+        return await self.__context.lookup_cache.get((url, credentials), lookup)
+
+    def _responses_determine_measurement(self) -> bool:
+        """Return whether the measurement depends on nothing but the responses, given the same source parameters.
+
+        If so, unchanged responses result in an unchanged measurement. The collector then makes conditional requests,
+        reusing the previous measurement if the source is not modified, and adds a hash of the responses to the
+        measurement, so the database doesn't need to compare the new measurement with the previous one.
+        """
+        return False
+
+    def __conditional_headers(self, url: URL) -> dict[str, str]:
+        """Return the headers to make the request for the URL conditional, if possible."""
+        if self.__context.validator_cache and self._responses_determine_measurement():
+            return self.__context.validator_cache.conditional_headers(self.__validator_cache_key(), url)
+        return {}
+
+    def __is_not_modified(self, url: URL, response: Response) -> bool:
+        """Return whether the response is a 304 Not Modified response to a conditional request."""
+        return bool(self.__conditional_headers(url)) and response.status == HTTPStatus.NOT_MODIFIED
+
+    def __not_modified(self, responses: SourceResponses) -> bool:
+        """Return whether the responses are all 304 Not Modified responses to conditional requests."""
+        if responses.connection_error or not responses or not self._responses_determine_measurement():
+            return False
+        return all(response.status == HTTPStatus.NOT_MODIFIED for response in responses)
+
+    @staticmethod
+    def __response_validators(response: Response) -> dict[str, str]:
+        """Return the headers for a conditional request based on the validators of the response, if any."""
+        validators = {}
+        if etag := response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+    def __cache_validators(self, measurement: SourceMeasurement) -> None:
+        """Cache the measurement with the validators of the responses, if all responses had validators."""
+        if not self.__context.validator_cache or not self._responses_determine_measurement():
+            return
+        key = self.__validator_cache_key()
+        if self.__validators and all(self.__validators.values()) and not measurement.has_error:
+            self.__context.validator_cache.store(key, self.__validators, measurement)
+        else:
+            self.__context.validator_cache.remove(key)
+
+    async def __payload_hash(self, responses: SourceResponses) -> str:
+        """Return a hash of the collector class and the bodies of the responses."""
+        payload_hash = hashlib.md5(self.__class__.__name__.encode(), usedforsecurity=False)
+        for response in responses:
+            payload_hash.update(await response.read())
+        return payload_hash.hexdigest()
+
+    def __validator_cache_key(self) -> str:
+        """Return the key for the validator cache. Changing the metric or the source results in a new key."""
+        return md5_hash(str([self.__class__.__name__, self._metric, self.__source]))
+
     async def __safely_parse_source_responses(self, responses: SourceResponses) -> SourceMeasurement:
         """Parse the data from the responses, without failing.
 
@@ -148,13 +295,33 @@ class SourceCollector:
         if responses.connection_error:
             return SourceMeasurement(connection_error=responses.connection_error)
         try:
-            return await self._parse_source_responses(responses)
+            with self.__context.parse_executor.timed(self.__class__.__name__):
+                return await self._parse_source_responses(responses)
         except CollectorError as reason:
             error = self.__logsafe_exception(reason)
             return SourceMeasurement(parse_error=error)
         except Exception:
             return SourceMeasurement(parse_error=stable_traceback(traceback.format_exc()))
 
+    def _parse_in_worker_process(self, size: int) -> bool:
+        """Return whether a response of the given size in bytes should be parsed in a worker process."""
+        return self.__context.parse_executor.offloads(size)
+
+    async def _run_in_worker_process[*Ts, T](
+        self, function: Callable[[type[SourceCollector], dict, *Ts], T], *args: *Ts
+    ) -> T:
+        """Call the function in a worker process, passing the collector class and the source as first arguments.
+
+        The collector itself can't be passed to the worker process because it has a reference to the client session.
+        The function can create a new collector from the collector class, the source, and an empty collection context
+        to do the parsing, without session and metric. The other arguments and the result of the function need to be
+        picklable.
+        """
+        collector_class, source = self.__class__, dict(self.__source)
+        return await self.__context.parse_executor.run_in_worker_process(
+            collector_class.__name__, function, collector_class, source, *args
+        )
+
     async def _parse_source_responses(self, responses: SourceResponses) -> SourceMeasurement:
         """Parse the responses to get the measurement value, the total value, and the entities for the metric.
 
@@ -413,8 +580,8 @@ class TimeRemainingCollector(TimeCollector):
 class VersionCollector(SourceCollector):
     """Base class for version collectors."""
 
-    def __init__(self, session: aiohttp.ClientSession, metric, source) -> None:
-        super().__init__(session, metric, source)
+    def __init__(self, metric, source, context: CollectionContext) -> None:
+        super().__init__(metric, source, context)
         self.latest_version = Version("0.0")
 
     async def _get_source_responses(self, *urls: URL) -> SourceResponses:
@@ -427,27 +594,35 @@ class VersionCollector(SourceCollector):
         repository_url = DATA_MODEL.sources[self.source_type].repository_url
         if not repository_url:
             return Version("0.0")
-        logger = get_logger()
-        class_name = self.__class__.__name__
-        logger.info("Checking latest %s at %s", class_name, repository_url)
         organization, repository = str(repository_url).rstrip("/").split("/")[-2:]
-        url = f"https://api.github.com/repos/{organization}/{repository}/releases/latest"
-        headers = {"Authorization": f"Bearer {token}"} if (token := self._parameter("github_pat")) else {}
-        response = await self._session.get(url, allow_redirects=True, headers=headers)
-        json = await response.json(content_type=None)
-        latest_version = json.get("tag_name", "").lstrip("v")
-        logger.info("Latest %s according to %s is %s", class_name, repository_url, latest_version)
+        url = URL(f"https://api.github.com/repos/{organization}/{repository}/releases/latest")
+        token = str(self._parameter("github_pat"))
+        latest_version = await self._cached_lookup(
+            url, lambda: self.__get_latest_version(url, str(repository_url), token), credentials=(token,)
+        )
         try:
             return Version(latest_version)
         except InvalidVersion:
-            logger.warning(
+            get_logger().warning(
                 "Latest %s according to %s is %s, which is an invalid version",
-                class_name,
+                self.__class__.__name__,
                 repository_url,
                 latest_version,
             )
         return Version("0.0")
 
+    async def __get_latest_version(self, url: URL, repository_url: str, token: str) -> str:
+        """Get the latest release of the repository from GitHub."""
+        logger = get_logger()
+        class_name = self.__class__.__name__
+        logger.info("Checking latest %s at %s", class_name, repository_url)
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        response = await self._session.get(url, allow_redirects=True, headers=headers)
+        json = await response.json(content_type=None)
+        latest_version = str(json.get("tag_name", "")).lstrip("v")
+        logger.info("Latest %s according to %s is %s", class_name, repository_url, latest_version)
+        return latest_version
+
     async def _parse_source_responses(self, responses: SourceResponses) -> SourceMeasurement:
         """Override to get the version from the parse version method that subclasses should implement."""
         version = min(await self._parse_source_response_versions(responses))
@@ -502,9 +677,9 @@ class TransactionEntity(Entity):
 class SlowTransactionsCollector(SourceCollector):
     """Base class for slow transactions collectors."""
 
-    def __init__(self, session: aiohttp.ClientSession, metric, source) -> None:
+    def __init__(self, metric, source, context: CollectionContext) -> None:
         """Extend to set up the parameters."""
-        super().__init__(session, metric, source)
+        super().__init__(metric, source, context)
         self._response_time_to_evaluate = cast(str, self._parameter("response_time_to_evaluate"))
         self.__target_response_time = float(cast(int, self._parameter("target_response_time")))
         self.__transaction_specific_target_response_times = cast(
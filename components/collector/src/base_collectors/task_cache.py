@@ -0,0 +1,63 @@
+"""Cache for the results of tasks."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from collector_utilities.log import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Hashable
+
+
+class TaskCache:
+    """Cache the results of tasks for a limited time.
+
+    Gets with the same key that are made while an earlier task is still in flight or less than the time to live ago,
+    share the result of the earlier task. Failed tasks are not cached. Subclasses decide what the keys and tasks are.
+    """
+
+    NAME = "Task cache"  # Name of the cache in the logged statistics
+    RESULTS = "result(s)"  # Name of the cached results in the logged statistics
+
+    def __init__(self, time_to_live: float) -> None:
+        self.__time_to_live = time_to_live
+        self.__entries: dict[Hashable, tuple[float, asyncio.Task[Any]]] = {}
+        self.hits = self.misses = 0
+
+    async def _get[T](self, key: Hashable, coroutine_function: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Return the result from the cache or, if the cache has no fresh result, run the task to get the result."""
+        now = time.monotonic()
+        if (entry := self.__entries.get(key)) and now - entry[0] < self.__time_to_live:
+            self.hits += 1
+            task = entry[1]
+        else:
+            self.misses += 1
+            task = asyncio.create_task(coroutine_function())
+            self.__entries[key] = (now, task)
+        try:
+            # Shield the task so that if one of the collectors waiting for the result times out, the other
+            # collectors still get the result:
+            return await asyncio.shield(task)
+        except Exception:
+            if (entry := self.__entries.get(key)) and entry[1] is task:
+                del self.__entries[key]  # Don't cache failed tasks
+            raise
+
+    def log_statistics(self) -> None:
+        """Log the hits and misses, reset them, and remove expired results from the cache."""
+        now = time.monotonic()
+        for key, (timestamp, task) in list(self.__entries.items()):
+            if now - timestamp >= self.__time_to_live and task.done():
+                del self.__entries[key]
+        gets = self.hits + self.misses
+        get_logger().info(
+            "%s: %d hit(s), %d miss(es) since the previous wake-up (hit rate %.0f%%), %d %s cached",
+            self.NAME,
+            self.hits,
+            self.misses,
+            100 * self.hits / gets if gets else 0,
+            len(self.__entries),
+            self.RESULTS,
+        )
+        self.hits = self.misses = 0
@@ -0,0 +1,71 @@
+"""Cache for the validators of source responses and the measurements parsed from them."""
+
+import dataclasses
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from collector_utilities.log import get_logger
+
+if TYPE_CHECKING:
+    from collector_utilities.type import URL
+    from model import SourceMeasurement
+
+
+@dataclass
+class CachedMeasurement:
+    """Source measurement with the validators of the responses it was parsed from."""
+
+    validators: dict[URL, dict[str, str]]  # The conditional request headers per URL
+    measurement: SourceMeasurement
+    last_used: float  # Monotonic time at which the measurement was stored or reused
+
+
+class ValidatorCache:
+    """Remember the validators of source responses and the measurements parsed from them for conditional requests.
+
+    The validators are the ETag and Last-Modified headers of the responses. Files such as test reports and security
+    scans are usually unchanged between measurements. If the source collector sends the validators of the previous
+    responses as If-None-Match and If-Modified-Since headers and the source responds with 304 Not Modified for all
+    URLs, the collector reuses the previous measurement instead of downloading and parsing the files again.
+    Measurements are cached per collector class, metric, and source.
+    """
+
+    def __init__(self, max_age: float = 24 * 60 * 60) -> None:
+        self.__max_age = max_age  # Remove measurements that have not been used for this long, e.g. of deleted metrics
+        self.__entries: dict[str, CachedMeasurement] = {}
+        self.hits = self.misses = 0
+
+    def conditional_headers(self, key: str, url: URL) -> dict[str, str]:
+        """Return the headers to make the request for the URL conditional, if the cache has validators for it."""
+        return entry.validators.get(url, {}) if (entry := self.__entries.get(key)) else {}
+
+    def measurement(self, key: str) -> SourceMeasurement:
+        """Return a copy of the cached measurement. Only call this if the source responded with 304 Not Modified."""
+        self.hits += 1
+        entry = self.__entries[key]
+        entry.last_used = time.monotonic()
+        return dataclasses.replace(entry.measurement)
+
+    def store(self, key: str, validators: dict[URL, dict[str, str]], measurement: SourceMeasurement) -> None:
+        """Store the measurement and the validators of the responses it was parsed from."""
+        self.misses += 1
+        self.__entries[key] = CachedMeasurement(validators, dataclasses.replace(measurement), time.monotonic())
+
+    def remove(self, key: str) -> None:
+        """Remove the measurement from the cache, if present."""
+        self.__entries.pop(key, None)
+
+    def log_statistics(self) -> None:
+        """Log the hits and misses, reset them, and remove measurements that have not been used for a long time."""
+        now = time.monotonic()
+        for key, entry in list(self.__entries.items()):
+            if now - entry.last_used >= self.__max_age:
+                del self.__entries[key]
+        get_logger().info(
+            "Validator cache: %d hit(s), %d miss(es) since the previous wake-up, %d measurement(s) cached",
+            self.hits,
+            self.misses,
+            len(self.__entries),
+        )
+        self.hits = self.misses = 0
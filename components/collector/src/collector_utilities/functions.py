@@ -1,6 +1,7 @@
 """Utility functions."""
 
 import hashlib
+import io
 import re
 import urllib.parse
 from decimal import ROUND_HALF_UP, Decimal
@@ -10,10 +11,10 @@ from typing import TYPE_CHECKING, Literal
 from defusedxml import ElementTree
 
 from .exceptions import XMLRootElementError
-from .type import URL, Namespaces, Response
+from .type import URL, ElementAncestors, Namespaces, Response
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterable
+    from collections.abc import Collection, Iterable, Iterator
     from xml.etree.ElementTree import Element  # nosec # Element is not available from defusedxml, but only used as type
 
     from packaging.version import Version
@@ -33,9 +34,43 @@ async def parse_source_response_xml_with_namespace(
 ) -> tuple[Element, Namespaces]:
     """Parse the XML with namespace from the source response."""
     tree = await parse_source_response_xml(response, allowed_root_tags)
+    return tree, xml_namespaces(tree)
+
+
+def xml_namespaces(root: Element) -> Namespaces:
+    """Return the namespace of the root element, using "ns" as prefix."""
     # ElementTree has no API to get the namespace so we extract it from the root tag:
-    namespaces = {"ns": tree.tag.split("}")[0][1:]}
-    return tree, namespaces
+    return {"ns": root.tag.split("}")[0][1:]}
+
+
+def iterparse_xml(
+    contents: bytes, tags: Collection[str], allowed_root_tags: Collection[str] | None = None
+) -> Iterator[tuple[Element, ElementAncestors]]:
+    """Parse the XML incrementally and yield the elements with one of the tags, together with their ancestors.
+
+    Tags are matched without namespace. The elements are yielded when their end tag has been parsed, so their children
+    are available. The ancestors are ordered from the root element down and have their attributes, but not their
+    children. To limit memory use, elements are removed from the tree as soon as they have been yielded and processed,
+    or, if they are not part of an element with one of the tags, as soon as they have been parsed. Callers should not
+    keep references to the yielded elements. Like parse_source_response_xml(), this forbids entities and external
+    references.
+    """
+    ancestors: list[Element] = []
+    nr_open_tagged_elements = 0  # The number of elements with one of the tags that are being parsed
+    for event, element in ElementTree.iterparse(io.BytesIO(contents), events=("start", "end"), forbid_dtd=False):
+        tagged = element.tag.split("}")[-1] in tags
+        if event == "start":
+            if not ancestors and allowed_root_tags and element.tag not in allowed_root_tags:
+                raise XMLRootElementError(allowed_root_tags, element.tag)
+            ancestors.append(element)
+            nr_open_tagged_elements += tagged
+            continue
+        ancestors.pop()
+        if tagged:
+            nr_open_tagged_elements -= 1
+            yield element, tuple(ancestors)
+        if ancestors and (tagged or nr_open_tagged_elements == 0):
+            ancestors[-1].remove(element)
 
 
 Substitution = tuple[re.Pattern[str], str]
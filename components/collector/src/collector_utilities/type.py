@@ -5,6 +5,7 @@ from xml.etree.ElementTree import Element  # nosec # Element is not available fr
 
 import aiohttp
 
+type ElementAncestors = tuple[Element, ...]  # Ancestors of an element, ordered from the root element down
 type ElementMap = dict[Element, Element]
 
 type ErrorMessage = str | None
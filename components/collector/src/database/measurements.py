@@ -2,33 +2,190 @@
 
 from typing import TYPE_CHECKING, NewType
 
-from pymongo import DESCENDING
+from bson import ObjectId
+from pymongo import DESCENDING, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
 
-from shared.database.measurements import insert_new_measurement, latest_measurement
+from shared.database.measurement_rollups import rollup_operations
+from shared.database.measurements import (
+    LATEST_MEASUREMENT_ID,
+    LATEST_SUCCESSFUL_MEASUREMENT_ID,
+    latest_measurement,
+    latest_measurement_ids_operation,
+)
 from shared.model.measurement import Measurement
 from shared.utils.functions import iso_timestamp
 
-from database.reports import latest_metric
+from collector_utilities.log import get_logger
+from database.reports import latest_metric, latest_reports_by_uuid
 
 if TYPE_CHECKING:
     from pymongo.database import Database
 
+    from shared.model.metric import Metric
+    from shared.utils.type import MetricId
+
 
 MeasurementId = NewType("MeasurementId", str)
 
 
-def create_measurement(database: Database, measurement_data: dict) -> None:
-    """Put the measurement in the database."""
-    metric_uuid = measurement_data["metric_uuid"]
-    report_uuid = measurement_data["report_uuid"]
-    if (metric := latest_metric(database, report_uuid, metric_uuid)) is None:
-        return  # Metric does not exist, must've been deleted while being measured
-    latest = latest_measurement(database, metric)
+class LatestMeasurements:
+    """The latest measurements and the latest successful measurements of a batch of metrics.
+
+    The latest measurements are retrieved via the latest measurements collection with a few queries per batch and kept
+    up to date while the batch is processed, so a batch can contain more than one measurement of the same metric.
+    """
+
+    def __init__(self, database: Database, metrics: dict[MetricId, Metric]) -> None:
+        self.__latest: dict[MetricId, Measurement] = {}
+        self.__latest_successful: dict[MetricId, Measurement] = {}
+        self.__new_measurements: list[tuple[Measurement, Measurement | None]] = []  # New and previous measurements
+        self.__retrieve(database, metrics)
+
+    def latest(self, metric_uuid: MetricId) -> Measurement | None:
+        """Return the latest measurement of the metric."""
+        return self.__latest.get(metric_uuid)
+
+    def latest_successful(self, metric_uuid: MetricId) -> Measurement | None:
+        """Return the latest measurement without errors of the metric."""
+        return self.__latest_successful.get(metric_uuid)
+
+    def add(self, measurement: Measurement) -> None:
+        """Add a new measurement."""
+        self.__new_measurements.append((measurement, self.__latest.get(measurement.metric.uuid)))
+        self.__latest[measurement.metric.uuid] = measurement
+        if measurement.get("has_error") is False:
+            self.__latest_successful[measurement.metric.uuid] = measurement
+
+    def discard(self, positions: set[int]) -> None:
+        """Discard the new measurements at the positions, because they could not be written to the database.
+
+        The previous measurement of a discarded measurement becomes the previous or latest measurement again.
+        """
+        replacements: dict[ObjectId, Measurement | None] = {}  # Ids of discarded measurements and their replacement
+        new_measurements: list[tuple[Measurement, Measurement | None]] = []
+        for position, (measurement, previous) in enumerate(self.__new_measurements):
+            replacement = replacements.get(previous["_id"], previous) if previous else None
+            if position in positions:
+                replacements[measurement["_id"]] = replacement
+            else:
+                new_measurements.append((measurement, replacement))
+        self.__new_measurements = new_measurements
+        for metric_uuid, latest in list(self.__latest.items()):
+            if latest["_id"] in replacements:
+                if replacement := replacements[latest["_id"]]:
+                    self.__latest[metric_uuid] = replacement
+                else:
+                    del self.__latest[metric_uuid]
+
+    def operations(self) -> list[UpdateOne]:
+        """Return the operations to update the latest measurements collection with the new measurements."""
+        return [
+            latest_measurement_ids_operation(measurement, previous) for measurement, previous in self.__new_measurements
+        ]
+
+    def __retrieve(self, database: Database, metrics: dict[MetricId, Metric]) -> None:
+        """Retrieve the latest measurement and the latest successful measurement of each metric."""
+        ids: dict[MetricId, dict] = {
+            latest_measurement_ids["metric_uuid"]: latest_measurement_ids
+            for latest_measurement_ids in database.latest_measurements.find({"metric_uuid": {"$in": list(metrics)}})
+        }
+        measurement_ids = [
+            measurement_id
+            for latest_measurement_ids in ids.values()
+            for field in (LATEST_MEASUREMENT_ID, LATEST_SUCCESSFUL_MEASUREMENT_ID)
+            if (measurement_id := latest_measurement_ids.get(field)) is not None
+        ]
+        measurements = {
+            measurement["_id"]: measurement
+            for measurement in database.measurements.find({"_id": {"$in": measurement_ids}})
+        }
+        for metric_uuid, metric in metrics.items():
+            for field, latest in (
+                (LATEST_MEASUREMENT_ID, self.__latest),
+                (LATEST_SUCCESSFUL_MEASUREMENT_ID, self.__latest_successful),
+            ):
+                latest_measurement_ids = ids.get(metric_uuid, {})
+                if field in latest_measurement_ids:
+                    measurement = measurements.get(latest_measurement_ids[field])
+                    if measurement is not None:
+                        latest[metric_uuid] = Measurement(metric, measurement)
+                elif measurement := latest_measurement(
+                    database, metric, skip_measurements_with_error=field == LATEST_SUCCESSFUL_MEASUREMENT_ID
+                ):
+                    # The metric has no latest measurement ids yet, latest_measurement() looks them up and stores them
+                    latest[metric_uuid] = measurement
+
+
+def create_measurements(database: Database, measurements_data: list[dict]) -> None:
+    """Put the measurements in the database.
+
+    To limit the number of round trips to the database, the latest reports and measurements are retrieved for the
+    whole batch at once and the new measurements are written with one bulk write. The rollups of the measured metrics
+    are updated with the latest measurement of each metric.
+    """
+    reports = latest_reports_by_uuid(database, [data["report_uuid"] for data in measurements_data])
+    metrics = {
+        data["metric_uuid"]: metric
+        for data in measurements_data
+        if (report := reports.get(data["report_uuid"])) and (metric := report.metrics_dict.get(data["metric_uuid"]))
+    }
+    latest_measurements = LatestMeasurements(database, metrics)
+    operations: list[InsertOne | UpdateOne] = []
+    measured_metric_uuids: set[MetricId] = set()
+    for measurement_data in measurements_data:
+        if (metric := metrics.get(measurement_data["metric_uuid"])) is None:
+            continue  # Metric does not exist, must've been deleted while being measured
+        if measurement_operations := create_measurement_operations(
+            database, metric, measurement_data, latest_measurements
+        ):
+            operations.extend(measurement_operations)
+            measured_metric_uuids.add(metric.uuid)
+    if failed := write_measurements(database, operations):
+        # Don't make measurements that were not inserted the latest measurements of their metrics:
+        inserts = [index for index, operation in enumerate(operations) if isinstance(operation, InsertOne)]
+        latest_measurements.discard({position for position, index in enumerate(inserts) if index in failed})
+    if latest_measurement_ids_operations := latest_measurements.operations():
+        # Update the latest measurements collection after the new measurements have been written, so the ids in the
+        # latest measurements collection always refer to existing measurements:
+        database.latest_measurements.bulk_write(latest_measurement_ids_operations)
+    measured = [latest_measurements.latest(metric_uuid) for metric_uuid in measured_metric_uuids]
+    if rollups := [operation for latest in measured if latest for operation in rollup_operations(latest)]:
+        database.measurement_rollups.bulk_write(rollups)
+
+
+def write_measurements(database: Database, operations: list[InsertOne | UpdateOne]) -> set[int]:
+    """Write the operations to the measurements collection and return the indices of the operations that failed.
+
+    The operations are unordered, so one failing operation doesn't prevent the operations of other metrics.
+    """
+    if not operations:
+        return set()
+    try:
+        database.measurements.bulk_write(operations, ordered=False)
+    except BulkWriteError as error:
+        write_errors = error.details.get("writeErrors", [])
+        for write_error in write_errors:
+            get_logger().error("Writing a measurement failed: %s", write_error["errmsg"])
+        return {write_error["index"] for write_error in write_errors}
+    return set()
+
+
+def create_measurement_operations(
+    database: Database, metric: Metric, measurement_data: dict, latest_measurements: LatestMeasurements
+) -> list[InsertOne | UpdateOne]:
+    """Return the database operations needed to put the measurement in the database."""
+    latest = latest_measurements.latest(metric.uuid)
     measurement = Measurement(metric, measurement_data, previous_measurement=latest)
     if not measurement.sources_exist():
-        return  # Measurement has sources that the metric does not have, must've been deleted while being measured
+        return []  # Measurement has sources that the metric does not have, must've been deleted while being measured
+    if latest and payload_unchanged(metric, measurement_data, latest) and no_measurement_requested_after(latest):
+        # The sources returned the same responses as for the latest measurement, so the new measurement is equal to
+        # the latest one. Skip the comparison of the measurements and merge the two measurements together:
+        latest["end"] = iso_timestamp()
+        return [update_measurement_end_operation(latest["_id"], latest["end"])]
     if latest:
-        if latest_successful := latest_measurement(database, metric, skip_measurements_with_error=True):
+        if latest_successful := latest_measurements.latest_successful(metric.uuid):
             measurement.copy_entity_first_seen_timestamps(latest_successful)
         measurement.copy_entity_user_data(latest if latest_successful is None else latest_successful)
         measurement.update_measurement()  # Update the scales so we can compare the two measurements
@@ -37,8 +194,11 @@ def create_measurement(database: Database, measurement_data: dict) -> None:
             # two measurements together. Don't merge the measurements together when a measurement was requested,
             # even if the new measurement value did not change, so that the frontend gets a new measurement count
             # via the number of measurements server-sent events endpoint and knows the requested measurement was done.
-            update_measurement_end(database, latest["_id"])
-            return
+            latest["end"] = iso_timestamp()
+            if payload_hash := measurement_data.get("payload_hash"):
+                # Remember the payload hash, so the next measurement with the same payload can skip the comparison:
+                latest["payload_hash"] = payload_hash
+            return [update_measurement_end_operation(latest["_id"], latest["end"], payload_hash)]
     elif original_metric_uuid := metric.get("copied_from"):
         # This is the first measurement for a copied metric, copy the entity user data from the original metric:
         query = {"filter": {"metric_uuid": original_metric_uuid}, "sort": [("start", DESCENDING)]}
@@ -46,12 +206,42 @@ def create_measurement(database: Database, measurement_data: dict) -> None:
             original_metric := latest_metric(database, original_measurement["report_uuid"], original_metric_uuid)
         ):
             measurement.copy_entity_user_data(Measurement(original_metric, original_measurement))
-    insert_new_measurement(database, measurement)
+    operations: list[InsertOne | UpdateOne] = []
+    if latest:  # pragma: no feature-test-cover
+        # No need to keep hashes around. This update is ignored if the latest measurement has no hashes.
+        operations.append(
+            UpdateOne({"_id": latest["_id"]}, {"$unset": {"source_parameter_hash": "", "payload_hash": ""}})
+        )
+    measurement.update_measurement()
+    measurement["_id"] = ObjectId()  # Set the id so that measurements later in the batch can refer to this measurement
+    operations.append(InsertOne(measurement))
+    latest_measurements.add(measurement)
+    return operations
+
+
+def update_measurement_end_operation(
+    measurement_id: MeasurementId, end: str, payload_hash: str | None = None
+) -> UpdateOne:
+    """Return the operation to set the end date and time, and optionally the payload hash, of the measurement."""
+    fields = {"end": end} | ({"payload_hash": payload_hash} if payload_hash else {})
+    return UpdateOne(filter={"_id": measurement_id}, update={"$set": fields})
+
 
+def payload_unchanged(metric: Metric, measurement_data: dict, latest: Measurement) -> bool:
+    """Return whether the new measurement is based on the same source responses as the latest measurement.
 
-def update_measurement_end(database: Database, measurement_id: MeasurementId) -> None:  # pragma: no feature-test-cover
-    """Set the end date and time of the measurement to the current date and time."""
-    database.measurements.update_one(filter={"_id": measurement_id}, update={"$set": {"end": iso_timestamp()}})
+    The measurement data only has a payload hash if the measurement depends on nothing but the source responses. If
+    the source parameters are unchanged too, the new measurement equals the latest measurement, unless the issue
+    status changed or the technical debt of the latest measurement expired since it was measured.
+    """
+    return (
+        bool(payload_hash := measurement_data.get("payload_hash"))
+        and payload_hash == latest.get("payload_hash")
+        and measurement_data.get("source_parameter_hash") == metric.source_parameter_hash()
+        and metric.source_parameter_hash() == latest.source_parameter_hash()
+        and measurement_data.get("issue_status") == latest.get("issue_status")
+        and not latest.debt_target_expired()
+    )
 
 
 def no_measurement_requested_after(measurement: Measurement) -> bool:
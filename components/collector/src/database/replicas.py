@@ -0,0 +1,22 @@
+"""Collector replicas collection."""
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from dateutil.tz import tzutc
+
+if TYPE_CHECKING:
+    from pymongo.database import Database
+
+
+def renew_lease(database: Database, replica_id: str, lease_duration: int) -> None:
+    """Create or extend the lease of the collector replica."""
+    expiration = (datetime.now(tz=tzutc()) + timedelta(seconds=lease_duration)).isoformat()
+    database.collector_replicas.update_one({"_id": replica_id}, {"$set": {"expiration": expiration}}, upsert=True)
+
+
+def live_replicas(database: Database) -> list[str]:
+    """Remove the expired leases and return the ids of the collector replicas with a lease, sorted by id."""
+    now = datetime.now(tz=tzutc()).isoformat()
+    database.collector_replicas.delete_many({"expiration": {"$lt": now}})
+    return sorted(replica["_id"] for replica in database.collector_replicas.find({}, {"_id": True}))
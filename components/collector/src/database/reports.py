@@ -4,9 +4,11 @@ from typing import TYPE_CHECKING
 
 from shared.database.filters import DOES_NOT_EXIST
 from shared.model.report import Report
-from shared_data_model import DATA_MODEL
+from shared_data_model.snapshot import data_model_snapshot
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pymongo.database import Database
 
     from shared.model.metric import Metric
@@ -16,4 +18,24 @@ if TYPE_CHECKING:
 def latest_metric(database: Database, report_uuid: ReportId, metric_uuid: MetricId) -> Metric | None:
     """Return the latest metric with the specified metric uuid."""
     report_dict = database.reports.find_one({"report_uuid": report_uuid, "last": True, "deleted": DOES_NOT_EXIST})
-    return Report(DATA_MODEL.model_dump(), report_dict).metrics_dict.get(metric_uuid) if report_dict else None
+    return Report(data_model_snapshot(), report_dict).metrics_dict.get(metric_uuid) if report_dict else None
+
+
+def latest_reports_by_uuid(database: Database, report_uuids: Iterable[ReportId]) -> dict[ReportId, Report]:
+    """Return the latest, undeleted, reports with the specified report uuids, indexed by report uuid."""
+    report_filter = {"report_uuid": {"$in": list(set(report_uuids))}, "last": True, "deleted": DOES_NOT_EXIST}
+    reports: dict[ReportId, Report] = {}
+    for report_dict in database.reports.find(report_filter):
+        reports.setdefault(report_dict["report_uuid"], Report(data_model_snapshot(), report_dict))
+    return reports
+
+
+def latest_reports_changed_since(database: Database, min_iso_timestamp: str = "") -> list[dict]:
+    """Return the latest version of the reports that changed at or after the timestamp, including deleted reports.
+
+    If no timestamp is given, return the latest version of all reports.
+    """
+    report_filter: dict[str, bool | dict[str, str]] = {"last": True}
+    if min_iso_timestamp:
+        report_filter["timestamp"] = {"$gte": min_iso_timestamp}
+    return list(database.reports.find(report_filter))
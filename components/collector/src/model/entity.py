@@ -43,6 +43,10 @@ class Entities(list[Entity]):
         """Override to return an Entities slice or an Entity."""
         return self.__class__(super().__getitem__(item)) if isinstance(item, slice) else super().__getitem__(item)
 
+    def __reduce__(self) -> tuple[type[Entities], tuple[list[Entity]]]:
+        """Override to pickle the entities as list, so the keys of the entities are restored when unpickling."""
+        return self.__class__, (list(self),)
+
     def append(self, entity: Entity) -> None:
         """Extend to only append the entity if it's not already in the list."""
         if (key := entity["key"]) not in self.__keys:
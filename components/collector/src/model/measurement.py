@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
+from shared.utils.functions import md5_hash
+
 from collector_utilities.type import URL, ErrorMessage, InfoMessage, JSONList, Value
 
 from .entity import Entities
@@ -30,6 +32,7 @@ class SourceMeasurement:
     api_url: URL | None = None
     landing_url: URL | None = None
     source_uuid: str | None = None
+    payload_hash: str | None = None  # Hash of the responses, if the measurement depends on nothing but the responses
 
     def __post_init__(self):
         """Initialize fields that depend on other fields."""
@@ -94,6 +97,8 @@ class MetricMeasurement:
             "report_uuid": self.report_uuid,
             "source_parameter_hash": self.metric.source_parameter_hash(),
         }
+        if self.sources and all(source.payload_hash for source in self.sources):
+            measurement["payload_hash"] = md5_hash("".join(str(source.payload_hash) for source in self.sources))
         if self.issue_statuses:
             measurement["issue_status"] = [issue_status.as_dict() for issue_status in self.issue_statuses]
         return measurement
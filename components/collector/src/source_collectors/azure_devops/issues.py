@@ -45,21 +45,19 @@ class AzureDevopsIssues(SourceCollector):
         """Separately get each work item from the API."""
         api_url = await self._api_wit_url(endpoint="workitemsbatch")
         id_iter = iterable_to_batches(self._issue_ids_to_fetch, self.MAX_IDS_PER_WORK_ITEMS_API_CALL)
-        responses = [
-            await self._session.post(
-                api_url,
-                auth=auth,
-                json={"ids": id_batch, "fields": self._item_select_fields(), "$expand": "links"},
-            )
-            for id_batch in id_iter
-        ]
+        responses = []
+        for id_batch in id_iter:
+            async with self._limit_host(api_url):
+                json = {"ids": id_batch, "fields": self._item_select_fields(), "$expand": "links"}
+                responses.append(await self._session.post(api_url, auth=auth, json=json))
         return SourceResponses(responses=responses, api_url=api_url)
 
     async def _get_source_responses(self, *urls: URL) -> SourceResponses:
         """Override because we need to do a post request and need to separately get the entities."""
         api_url = urls[0]
         auth = aiohttp.BasicAuth(str(self._parameter("private_token")))
-        response = await self._session.post(api_url, auth=auth, json=self._api_list_query())
+        async with self._limit_host(api_url):
+            response = await self._session.post(api_url, auth=auth, json=self._api_list_query())
         self._issue_ids_to_fetch = [work_item["id"] for work_item in (await response.json()).get("workItems", [])]
         if not self._issue_ids_to_fetch:
             return SourceResponses(responses=[response], api_url=api_url)
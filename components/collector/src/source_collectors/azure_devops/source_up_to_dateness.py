@@ -13,7 +13,7 @@ from .base import AzureDevopsJobs, AzureDevopsRepositoryBase
 if TYPE_CHECKING:
     from datetime import datetime
 
-    import aiohttp
+    from base_collectors import CollectionContext
 
 
 class AzureDevopsFileUpToDateness(TimePassedCollector, AzureDevopsRepositoryBase):
@@ -55,11 +55,11 @@ class AzureDevopsJobUpToDateness(TimePassedCollector, AzureDevopsJobs):
 class AzureDevopsSourceUpToDateness(SourceCollector, ABC):
     """Factory class to create a collector to get the up-to-dateness of either jobs or files."""
 
-    def __new__(cls, session: aiohttp.ClientSession, metric, source) -> Self:
+    def __new__(cls, metric, source, context: CollectionContext) -> Self:
         """Create an instance of either the file up-to-dateness collector or the jobs up-to-dateness collector."""
         file_path = source.get("parameters", {}).get("file_path")
         collector_class = AzureDevopsFileUpToDateness if file_path else AzureDevopsJobUpToDateness
-        instance = collector_class(session, metric, source)
+        instance = collector_class(metric, source, context)
         instance.source_type = cls.source_type
         return cast(Self, instance)
 
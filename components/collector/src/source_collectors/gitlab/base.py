@@ -3,6 +3,7 @@
 from abc import ABC
 from datetime import datetime, timedelta
 from typing import cast
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from shared.utils.date_time import now
 
@@ -21,10 +22,46 @@ class GitLabBase(LinkPaginationSourceCollector, TokenAuthenticationSourceCollect
     PAGE_SIZE = "per_page=100"
     AUTH_HEADER = "Private-Token"
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__pages_requested: set[tuple[str, int]] = set()  # URLs without page number and page numbers requested
+
     def _basic_auth_credentials(self) -> tuple[str, str] | None:
         """Override to return None, as the private token is passed as header."""
         return None
 
+    async def _next_urls(self, responses: SourceResponses) -> list[URL]:
+        """Override to return the links to several next pages at once, if GitLab reports the total number of pages.
+
+        GitLab only reports the total number of pages if there are at most 10,000 items, see
+        https://docs.gitlab.com/ee/api/rest/#pagination-response-headers. Pages that are retrieved concurrently link
+        to pages that have been requested already, so skip links to pages that have been requested.
+        """
+        next_urls = []
+        for response in responses:
+            if not (next_url := response.links.get("next", {}).get("url")):
+                continue
+            url_without_page, next_page = self.__split_page(URL(next_url))
+            if (url_without_page, next_page) in self.__pages_requested:
+                continue
+            next_urls.append(URL(next_url))
+            self.__pages_requested.add((url_without_page, next_page))
+            if next_page and (total_pages := int(response.headers.get("X-Total-Pages") or 0)):
+                last_page = min(total_pages, next_page + self._max_concurrent_pages() - 1)
+                for page in range(next_page + 1, last_page + 1):
+                    next_urls.append(add_query(URL(url_without_page), f"page={page}"))
+                    self.__pages_requested.add((url_without_page, page))
+        return next_urls
+
+    @staticmethod
+    def __split_page(url: URL) -> tuple[str, int]:
+        """Split the URL into the URL without page number and the page number. Return 0 if the URL has no page."""
+        scheme, netloc, path, query, fragment = urlsplit(url)
+        parameters = parse_qsl(query, keep_blank_values=True)
+        page = next((int(value) for key, value in parameters if key == "page" and value.isdigit()), 0)
+        query = urlencode([(key, value) for key, value in parameters if key != "page"])
+        return urlunsplit((scheme, netloc, path, query, fragment)), page
+
 
 class GitLabProjectBase(GitLabBase, ABC):
     """Base class for GitLab collectors for a specific project."""
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from datetime import datetime
 
+    from base_collectors import CollectionContext
+
 
 class GitLabFileUpToDateness(GitLabProjectBase):
     """Collector class to measure the up-to-dateness of a repo or folder/file in a repo."""
@@ -76,7 +78,8 @@ class GitLabFileUpToDateness(GitLabProjectBase):
         files_api_url = await self._gitlab_api_url(
             f"repository/files/{file_path}?ref={self._parameter('branch', quote=True)}",
         )
-        response = await self._session.head(files_api_url, headers=self._headers())
+        async with self._limit_host(files_api_url):
+            response = await self._session.head(files_api_url, headers=self._headers())
         last_commit_id = response.headers["X-Gitlab-Last-Commit-Id"]
         commit_api_url = await self._gitlab_api_url(f"repository/commits/{last_commit_id}")
         return await super()._get_source_responses(commit_api_url)
@@ -107,11 +110,11 @@ class GitLabPipelineUpToDateness(TimePassedCollector, GitLabPipelineBase):
 class GitLabSourceUpToDateness(SourceCollector, ABC):
     """Factory class to create a collector to get the up-to-dateness of either pipelines or files."""
 
-    def __new__(cls, session: aiohttp.ClientSession, metric, source) -> Self:
+    def __new__(cls, metric, source, context: CollectionContext) -> Self:
         """Create an instance of either the file up-to-dateness collector or the jobs up-to-dateness collector."""
         file_path = source.get("parameters", {}).get("file_path")
         collector_class = GitLabFileUpToDateness if file_path else GitLabPipelineUpToDateness
-        instance = collector_class(session, metric, source)
+        instance = collector_class(metric, source, context)
         instance.source_type = cls.source_type
         return cast(Self, instance)
 
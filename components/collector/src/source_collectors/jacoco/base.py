@@ -1,9 +1,15 @@
 """Base classes for Jacoco coverage report unit tests."""
 
+from typing import TYPE_CHECKING
+
 from base_collectors import XMLFileSourceCollector
-from collector_utilities.functions import parse_source_response_xml
 from model import SourceMeasurement, SourceResponses
 
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element  # nosec # Element is not available from defusedxml, but only used as type
+
+    from collector_utilities.type import ElementAncestors
+
 
 class JacocoCoverageBaseClass(XMLFileSourceCollector):
     """Base class for Jacoco coverage collectors."""
@@ -14,9 +20,14 @@ class JacocoCoverageBaseClass(XMLFileSourceCollector):
         """Override to parse the coverage from the JaCoCo XML."""
         missed, covered = 0, 0
         for response in responses:
-            tree = await parse_source_response_xml(response)
-            counters = [c for c in tree.findall("counter") if c.get("type", "").lower() == self.coverage_type]
+            counters = await self._iterparse_source_response_xml(response, ["counter"], self.__counter)
             if counters:
-                missed += int(counters[0].get("missed", 0))
-                covered += int(counters[0].get("covered", 0))
+                missed += counters[0][0]
+                covered += counters[0][1]
         return SourceMeasurement(value=str(missed), total=str(missed + covered))
+
+    def __counter(self, counter: Element, ancestors: ElementAncestors) -> tuple[int, int] | None:
+        """Return the missed and covered count of the report counter for the coverage type, if the counter is one."""
+        if len(ancestors) != 1 or counter.get("type", "").lower() != self.coverage_type:
+            return None  # Only the counters of the report itself count, not those of packages, classes, etc.
+        return int(counter.get("missed", 0)), int(counter.get("covered", 0))
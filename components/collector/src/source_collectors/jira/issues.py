@@ -1,8 +1,8 @@
 """Jira issues collector."""
 
-import itertools
 import re
 
+from collector_utilities.functions import iterable_to_batches
 from collector_utilities.type import URL, Value
 from model import Entities, Entity, SourceMeasurement, SourceResponses
 
@@ -27,14 +27,19 @@ class JiraIssues(JiraBase):
         return await self._search_url(api_url)
 
     async def _get_fields(self, url: URL) -> None:
-        """Retrieve the available fields."""
+        """Retrieve the available fields. Use the lookup cache, as the fields are the same for all Jira metrics."""
         fields_url = URL(f"{url}/field")
+        self._field_ids = await self._cached_lookup(fields_url, lambda: self.__get_field_ids(fields_url))
+
+    async def __get_field_ids(self, fields_url: URL) -> dict[str, str]:
+        """Retrieve the available fields and create a field name to field id mapping."""
         response = (await super()._get_source_responses(fields_url))[0]
-        self._field_ids = {}
+        field_ids = {}
         for field in await response.json():
             field_name, field_id = field["name"].lower(), field["id"]
-            self._field_ids[field_name] = field_id
-            self._field_ids[field_id] = field_id  # Include ids too so we get a key error if a field doesn't exist
+            field_ids[field_name] = field_id
+            field_ids[field_id] = field_id  # Include ids too so we get a key error if a field doesn't exist
+        return field_ids
 
     async def _search_url(self, url: URL) -> URL:
         """Return the search endpoint, depending on whether Jira is the cloud deployment or not."""
@@ -60,17 +65,35 @@ class JiraIssues(JiraBase):
         return parameter_value
 
     async def _get_source_responses(self, *urls: URL) -> SourceResponses:
-        """Extend to implement pagination."""
+        """Extend to implement pagination.
+
+        If Jira reports the total number of issues, retrieve the remaining pages concurrently after the first page.
+        If not, retrieve the pages one by one until a page has fewer than the maximum number of issues per page.
+        """
         all_responses = SourceResponses(api_url=urls[0])
         max_results = await self._determine_max_results()
-        for start_at in itertools.count(0, max_results):  # pragma: no cover
-            responses = await super()._get_source_responses(URL(f"{urls[0]}&startAt={start_at}"))
-            if issues := await self._issues(responses):
+        responses = await self.__get_pages(urls[0], 0)
+        json = await responses[0].json()
+        if isinstance(total := json.get("total"), int):
+            all_responses.extend(responses)
+            for start_ats in iterable_to_batches(range(max_results, total, max_results), self._max_concurrent_pages()):
+                all_responses.extend(await self.__get_pages(urls[0], *start_ats))
+            return all_responses
+        issues, start_at = json.get("issues", []), 0
+        while True:
+            if issues:
                 all_responses.extend(responses)
             if len(issues) < max_results:
                 break  # We got fewer than the maximum number of issues per page, so we know we're done
+            start_at += max_results
+            responses = await self.__get_pages(urls[0], start_at)
+            issues = await self._issues(responses)
         return all_responses
 
+    async def __get_pages(self, url: URL, *start_ats: int) -> SourceResponses:
+        """Get the pages of issues starting at the start positions."""
+        return await super()._get_source_responses(*[URL(f"{url}&startAt={start_at}") for start_at in start_ats])
+
     async def _parse_source_responses(self, responses: SourceResponses) -> SourceMeasurement:
         """Override to get the issues from the responses."""
         url = URL(str(self._parameter("url")))
@@ -141,6 +164,10 @@ class JiraIssues(JiraBase):
             return self.max_results
         api_url = URL(f"{await super()._api_url()}/rest/api/{self._rest_api_version}")
         preference_url = URL(f"{api_url}/mypreferences?key=jira.search.views.default.max")
-        result_value = await (await super()._get_source_responses(preference_url))[0].json()
-        self.max_results = result_value if isinstance(result_value, int) else self.DEFAULT_MAX_RESULTS
+        self.max_results = await self._cached_lookup(preference_url, lambda: self.__get_max_results(preference_url))
         return self.max_results
+
+    async def __get_max_results(self, preference_url: URL) -> int:
+        """Retrieve the maximum number of issues per page from the user preferences."""
+        result_value = await (await super()._get_source_responses(preference_url))[0].json()
+        return result_value if isinstance(result_value, int) else self.DEFAULT_MAX_RESULTS
@@ -3,13 +3,12 @@
 from typing import TYPE_CHECKING, ClassVar, cast
 
 from base_collectors import XMLFileSourceCollector
-from collector_utilities.functions import parse_source_response_xml
 from model import Entities, Entity, SourceMeasurement, SourceResponses
 
 if TYPE_CHECKING:
     from xml.etree.ElementTree import Element  # nosec # Element is not available from defusedxml, but only used as type
 
-    from collector_utilities.type import ElementMap
+    from collector_utilities.type import ElementAncestors
 
 
 class JUnitTests(XMLFileSourceCollector):
@@ -22,18 +21,9 @@ class JUnitTests(XMLFileSourceCollector):
         entities = Entities()
         total = 0
         for response in responses:
-            tree = await parse_source_response_xml(response)
-            parent_map = self.parent_map(tree)
-            for test_case in tree.findall(".//testcase"):
-                test_case_test_result = "passed"
-                for test_result, junit_status_node in self.JUNIT_STATUS_NODES.items():
-                    if test_case.find(junit_status_node) is not None:
-                        test_case_test_result = test_result
-                        break
-                parsed_entity = self.__entity(test_case, test_case_test_result, parent_map)
-                if self._include_entity(parsed_entity):
-                    entities.append(parsed_entity)
-                total += 1
+            test_cases = await self._iterparse_source_response_xml(response, ["testcase"], self.__entity)
+            entities.extend(test_case for test_case in test_cases if self._include_entity(test_case))
+            total += len(test_cases)
         return SourceMeasurement(entities=entities, total=str(total))
 
     def _include_entity(self, entity: Entity) -> bool:
@@ -42,18 +32,22 @@ class JUnitTests(XMLFileSourceCollector):
         return entity["test_result"] in test_statuses_to_count
 
     @classmethod
-    def __entity(cls, case_node: Element, case_result: str, parent_map: ElementMap) -> Entity:
+    def __entity(cls, case_node: Element, ancestors: ElementAncestors) -> Entity:
         """Transform a test case into a test case entity."""
+        case_result = "passed"
+        for test_result, junit_status_node in cls.JUNIT_STATUS_NODES.items():
+            if case_node.find(junit_status_node) is not None:
+                case_result = test_result
+                break
         class_name = case_node.get("classname", "")
         host_name = case_node.get("hostname", "")
         name = case_node.get("name", "unknown")
         key = f"{class_name}:{host_name}:{name}"
-        suite_names = cls.parent_names(case_node, parent_map)
         return Entity(
             key=key,
             name=name,
             class_name=class_name,
             host_name=host_name,
-            suite_names=suite_names,
+            suite_names=cls.ancestor_names(ancestors),
             test_result=case_result,
         )
@@ -1,16 +1,19 @@
 """OWASP Dependency-Check XML dependencies collector."""
 
+from functools import partial
+from itertools import count
 from typing import TYPE_CHECKING, cast
 
-from collector_utilities.functions import parse_source_response_xml_with_namespace, sha1_hash, stabilize
+from collector_utilities.functions import sha1_hash, stabilize, xml_namespaces
 from model import Entities, Entity, SourceResponses
 
 from .base import OWASPDependencyCheckXMLBase
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from xml.etree.ElementTree import Element  # nosec # Element is not available from defusedxml, but only used as type
 
-    from collector_utilities.type import Namespaces
+    from collector_utilities.type import ElementAncestors, Namespaces
 
 
 class OWASPDependencyCheckXMLDependencies(OWASPDependencyCheckXMLBase):
@@ -21,18 +24,26 @@ class OWASPDependencyCheckXMLDependencies(OWASPDependencyCheckXMLBase):
         landing_url = await self._landing_url(responses)
         entities = Entities()
         for response in responses:
-            tree, namespaces = await parse_source_response_xml_with_namespace(response, self.allowed_root_tags)
+            parse_dependency = partial(self.__parse_dependency, landing_url=landing_url, indices=count())
             entities.extend(
-                [
-                    self._parse_entity(dependency, index, namespaces, landing_url)
-                    for (index, dependency) in enumerate(self._dependencies(tree, namespaces))
-                ],
+                await self._iterparse_source_response_xml(
+                    response, ["dependency"], parse_dependency, self.allowed_root_tags
+                )
             )
         return entities
 
-    def _dependencies(self, tree: Element, namespaces: Namespaces) -> list[Element]:
-        """Return the dependencies."""
-        return tree.findall(".//ns:dependency", namespaces)
+    def __parse_dependency(
+        self, dependency: Element, ancestors: ElementAncestors, landing_url: str, indices: Iterator[int]
+    ) -> Entity | None:
+        """Parse the entity from the dependency, if the dependency should be included."""
+        namespaces = xml_namespaces(ancestors[0])
+        if not self._include_dependency(dependency, namespaces):
+            return None
+        return self._parse_entity(dependency, next(indices), namespaces, landing_url)
+
+    def _include_dependency(self, dependency: Element, namespaces: Namespaces) -> bool:
+        """Return whether to include the dependency."""
+        return True
 
     def _parse_entity(
         self,
@@ -14,13 +14,9 @@ if TYPE_CHECKING:
 class OWASPDependencyCheckXMLSecurityWarnings(OWASPDependencyCheckXMLDependencies):
     """Collector to get security warnings from the OWASP Dependency-Check XML report."""
 
-    def _dependencies(self, tree: Element, namespaces: Namespaces) -> list[Element]:
-        """Override to return vulnerable dependencies only."""
-        return [
-            dependency
-            for dependency in tree.findall(".//ns:dependency", namespaces)
-            if self.__vulnerabilities(dependency, namespaces)
-        ]
+    def _include_dependency(self, dependency: Element, namespaces: Namespaces) -> bool:
+        """Override to include vulnerable dependencies only."""
+        return bool(self.__vulnerabilities(dependency, namespaces))
 
     def _parse_entity(
         self,
@@ -0,0 +1,5 @@
+"""Unit tests."""
+
+from shared_test_code.mongomock_shim import accept_bulk_write_sort
+
+accept_bulk_write_sort()
@@ -25,10 +25,11 @@ if TYPE_CHECKING:
 
 
 @patch("model.entity.iso_timestamp", new=Mock(return_value="2023-01-01"))
+@patch.object(config, "MEASUREMENT_JITTER", 0)
 class CollectorTest(unittest.IsolatedAsyncioTestCase):
     """Unit tests for the collection methods."""
 
-    create_measurement = "base_collectors.collector.create_measurement"
+    create_measurements = "base_collectors.measurement_writer.create_measurements"
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -105,25 +106,29 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
         self,
         *,
         source_parameter_hash: str = "0f6df164677525409f6269ec97e4118d",
+        payload_hash: str | None = "36c9c9acf6ed19cf0c0a9b7b05e5e6f2",
         metric_uuid: str = "metric_uuid",
         **expected_source_kwargs,
     ) -> dict[str, bool | list | str | None]:
         """Create an expected inserted measurement."""
-        return {
+        measurement: dict[str, bool | list | str | None] = {
             "has_error": "connection_error" in expected_source_kwargs,
             "sources": [self.expected_source(**expected_source_kwargs)],
             "metric_uuid": metric_uuid,
             "report_uuid": "report1",
             "source_parameter_hash": source_parameter_hash,
         }
+        if payload_hash and "connection_error" not in expected_source_kwargs:
+            measurement["payload_hash"] = payload_hash  # Measurements based on source responses have a payload hash
+        return measurement
 
     async def test_fetch_successful(self):
         """Test fetching a test metric."""
         mock_async_get_request = AsyncMock()
         mock_async_get_request.json.side_effect = [self.pip_json]
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             await self._fetch_measurements(mock_async_get_request)
-        post.assert_called_once_with(self.database, self.expected_measurement())
+        post.assert_called_once_with(self.database, [self.expected_measurement()])
 
     async def test_fetch_successful_with_landing_url(self):
         """Test fetching a test metric with a landing URL."""
@@ -133,15 +138,17 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
         )
         mock_async_get_request = AsyncMock()
         mock_async_get_request.json.side_effect = [self.pip_json]
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             self.client["quality_time_db"]["reports"].insert_one(report)
             await self._fetch_measurements(mock_async_get_request)
         post.assert_called_once_with(
             self.database,
-            self.expected_measurement(
-                source_parameter_hash="86ca213b598583330e2290438f2417a2",
-                landing_url="https://example.org",
-            ),
+            [
+                self.expected_measurement(
+                    source_parameter_hash="86ca213b598583330e2290438f2417a2",
+                    landing_url="https://example.org",
+                ),
+            ],
         )
 
     async def test_fetch_without_sources(self):
@@ -149,7 +156,7 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
         report_with_no_source = create_report()
         report_with_no_source["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]["sources"] = {}
         mock_async_get_request = AsyncMock()
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             self.client["quality_time_db"]["reports"].insert_one(report_with_no_source)
             await self._fetch_measurements(mock_async_get_request)
         post.assert_not_called()
@@ -161,7 +168,7 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
             "type": "unsupported_source",
         }
         mock_async_get_request = AsyncMock()
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             self.client["quality_time_db"]["reports"].insert_one(report_with_unsupported_source)
             await self._fetch_measurements(mock_async_get_request)
         post.assert_not_called()
@@ -169,12 +176,8 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
     async def test_fetch_with_get_error(self):
         """Test fetching measurement when getting the metrics fails."""
         with (
-            patch(self.create_measurement) as post,
-            patch(
-                "base_collectors.collector.get_metrics_from_reports",
-                return_value={},
-                side_effect=RuntimeError,
-            ) as _,
+            patch(self.create_measurements) as post,
+            patch("base_collectors.metric_index.latest_reports_changed_since", side_effect=RuntimeError),
             self.assertRaises(RuntimeError),
         ):
             await self._fetch_measurements(AsyncMock())
@@ -182,26 +185,26 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_fetch_with_client_error(self):
         """Test fetching measurement when getting measurements fails."""
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             await self._fetch_measurements(None, side_effect=[aiohttp.ClientConnectionError("error")])
-        post.assert_called_once_with(self.database, self.expected_measurement(connection_error="error"))
+        post.assert_called_once_with(self.database, [self.expected_measurement(connection_error="error")])
 
     async def test_fetch_with_empty_client_error(self):
         """Test fetching measurement when getting measurements fails with an 'empty' exception.
 
         This can happen when an exception returns an empty string when converted to string.
         """
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             await self._fetch_measurements(None, side_effect=[aiohttp.ClientPayloadError()])
-        post.assert_called_once_with(self.database, self.expected_measurement(connection_error="ClientPayloadError"))
+        post.assert_called_once_with(self.database, [self.expected_measurement(connection_error="ClientPayloadError")])
 
     async def test_fetch_with_post_error(self):
         """Test fetching measurement when posting fails."""
         mock_async_get_request = AsyncMock()
         mock_async_get_request.json.side_effect = [self.pip_json]
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             await self._fetch_measurements(mock_async_get_request)
-        post.assert_called_once_with(self.database, self.expected_measurement())
+        post.assert_called_once_with(self.database, [self.expected_measurement()])
 
     @patch("asyncio.sleep", AsyncMock(side_effect=[RuntimeError]))
     async def test_collect(self):
@@ -220,9 +223,117 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
         """Test that the metric is skipped on the second fetch."""
         mock_async_get_request = AsyncMock()
         mock_async_get_request.json.side_effect = [self.pip_json, self.pip_json]
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             await self._fetch_measurements(mock_async_get_request, number=2)
-        post.assert_called_once_with(self.database, self.expected_measurement())
+        post.assert_called_once_with(self.database, [self.expected_measurement()])
+
+    async def test_fetch_edited_metric_again(self):
+        """Test that an edited metric is measured again, even if it is not due yet."""
+        mock_async_get_request = AsyncMock()
+        mock_async_get_request.json.side_effect = [self.pip_json, self.pip_json]
+        with patch(self.create_measurements) as post:
+            await self._fetch_measurements(mock_async_get_request)
+            edited_report = create_report()
+            edited_url = "https://edited_url"
+            edited_report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]["sources"][SOURCE_ID]["parameters"]["url"] = (
+                edited_url
+            )
+            self.database["reports"].update_many({}, {"$unset": {"last": ""}})
+            self.database["reports"].insert_one(edited_report)
+            await self._fetch_measurements(mock_async_get_request)
+        self.assertEqual(2, post.call_count)
+
+    @patch.object(config, "SHARDING", True)
+    async def test_fetch_metrics_of_replica(self):
+        """Test that a collector replica measures the metrics that belong to it."""
+        self.collector = Collector(self.database)
+        mock_async_get_request = AsyncMock()
+        mock_async_get_request.json.return_value = self.pip_json
+        with patch(self.create_measurements) as post:
+            await self._fetch_measurements(mock_async_get_request)
+        post.assert_called_once_with(self.database, [self.expected_measurement()])
+
+    @patch.object(config, "SHARDING", True)
+    async def test_skip_metrics_of_other_replicas(self):
+        """Test that a collector replica does not measure the metrics that belong to other replicas."""
+        self.collector = Collector(self.database)
+        with (
+            patch("base_collectors.shard.HashRing.node", return_value="other replica"),
+            patch(self.create_measurements) as post,
+        ):
+            await self._fetch_measurements(AsyncMock())
+        post.assert_not_called()
+
+    @patch("asyncio.sleep", AsyncMock(side_effect=[RuntimeError]))
+    @patch.object(config, "SLEEP_DURATION", 20)
+    async def test_sleep_until_next_metric_is_due(self):
+        """Test that the collector sleeps no longer than needed for the next metric to become due."""
+        with (
+            patch.object(self.collector.scheduler, "seconds_until_next_due", return_value=5.0),
+            patch.object(self.collector, "collect_metrics"),
+            self.assertRaises(RuntimeError),
+        ):
+            await self.collector.start()
+        asyncio.sleep.assert_called_once_with(5.0)
+
+    @patch("asyncio.sleep", AsyncMock(side_effect=[RuntimeError]))
+    @patch.object(config, "SLEEP_DURATION", 20)
+    @patch.object(config, "MEASUREMENT_LIMIT", 1)
+    async def test_sleep_when_measurement_limit_is_reached(self):
+        """Test that the collector sleeps the maximum sleep duration if the maximum number of tasks is running."""
+        self.collector.running_tasks.add(Mock())
+        with (
+            patch.object(self.collector.scheduler, "seconds_until_next_due", return_value=0.0),
+            patch.object(self.collector, "collect_metrics"),
+            self.assertRaises(RuntimeError),
+        ):
+            await self.collector.start()
+        asyncio.sleep.assert_called_once_with(20)
+
+    @patch.object(config, "MEASUREMENT_LIMIT", 1)
+    async def test_limit_running_tasks(self):
+        """Test that no metrics are measured if the maximum number of tasks is running."""
+        self.collector.running_tasks.add(Mock())
+        with patch.object(self.collector, "collect_metric") as collect_metric:
+            self.collector.collect_metrics(Mock())
+        collect_metric.assert_not_called()
+
+    @patch("base_collectors.collector.get_logger")
+    async def test_log_scheduler_statistics(self, get_logger: Mock):
+        """Test that the scheduler statistics are logged if info messages are logged."""
+        get_logger.return_value.isEnabledFor.return_value = True
+        with (
+            patch.object(self.collector.scheduler, "pop_due", return_value=[]),
+            patch.object(self.collector.scheduler, "stats", return_value=(2, 10.0)),
+        ):
+            self.collector.collect_metrics(Mock())
+        get_logger.return_value.info.assert_any_call(
+            "Scheduler: %d metric(s) due, lagging %.0f seconds behind", 2, 10.0
+        )
+
+    @patch("base_collectors.collector.get_logger")
+    async def test_skip_scheduler_statistics(self, get_logger: Mock):
+        """Test that the scheduler statistics are not determined if info messages are not logged."""
+        get_logger.return_value.isEnabledFor.return_value = False
+        with (
+            patch.object(self.collector.scheduler, "pop_due", return_value=[]),
+            patch.object(self.collector.scheduler, "stats") as stats,
+        ):
+            self.collector.collect_metrics(Mock())
+        stats.assert_not_called()
+
+    async def test_share_responses_between_metrics(self):
+        """Test that metrics with the same source URL share the response."""
+        mock_async_get_request = AsyncMock()
+        mock_async_get_request.json.side_effect = [self.pip_json, self.pip_json]
+        self.database["reports"].insert_one(create_report(metric_id=METRIC_ID2))
+        with patch(self.create_measurements) as post, self._patched_get(mock_async_get_request) as get:
+            mock_async_get_request.read = AsyncMock(return_value=b"")
+            async with aiohttp.ClientSession() as session:
+                self.collector.collect_metrics(session)
+                await asyncio.gather(*self.collector.running_tasks)
+        get.assert_awaited_once()
+        self.assertEqual(2, len(post.call_args.args[1]))
 
     @patch.object(config, "MEASUREMENT_LIMIT", 1)
     async def test_fetch_in_batches(self):
@@ -230,11 +341,11 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
         mock_async_get_request = AsyncMock()
         mock_async_get_request.json.side_effect = [self.pip_json, self.pip_json]
 
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             self.client["quality_time_db"]["reports"].insert_one(create_report(metric_id=METRIC_ID2))
             await self._fetch_measurements(mock_async_get_request, number=2)
-        expected_call1 = call(self.database, self.expected_measurement())
-        expected_call2 = call(self.database, self.expected_measurement(metric_uuid="metric_uuid2"))
+        expected_call1 = call(self.database, [self.expected_measurement()])
+        expected_call2 = call(self.database, [self.expected_measurement(metric_uuid="metric_uuid2")])
         post.assert_has_calls(calls=[expected_call1, expected_call2])
 
     @patch.object(config, "MEASUREMENT_LIMIT", 1)
@@ -247,20 +358,22 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
 
         mock_async_get_request = AsyncMock()
         mock_async_get_request.json.side_effect = [self.pip_json, self.pip_json]
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             self.client["quality_time_db"]["reports"].insert_one(report1)
             self.client["quality_time_db"]["reports"].insert_one(report2)
             await self._fetch_measurements(mock_async_get_request, number=2)
 
-        expected_call1 = call(self.database, self.expected_measurement())
+        expected_call1 = call(self.database, [self.expected_measurement()])
         expected_call2 = call(
             self.database,
-            self.expected_measurement(
-                source_parameter_hash="ebfcffc74dc017799cb4da33090a9867",
-                metric_uuid="metric_uuid2",
-                api_url=edited_url,
-                landing_url=edited_url,
-            ),
+            [
+                self.expected_measurement(
+                    source_parameter_hash="ebfcffc74dc017799cb4da33090a9867",
+                    metric_uuid="metric_uuid2",
+                    api_url=edited_url,
+                    landing_url=edited_url,
+                ),
+            ],
         )
         post.assert_has_calls(calls=[expected_call1, expected_call2])
 
@@ -271,7 +384,7 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
             "url"
         ] = ""
         mock_async_get_request = AsyncMock()
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             self.client["quality_time_db"]["reports"].insert_one(report_without_url_parameter)
             await self._fetch_measurements(mock_async_get_request)
         post.assert_not_called()
@@ -284,19 +397,22 @@ class CollectorTest(unittest.IsolatedAsyncioTestCase):
             "type": "manual_number",
         }
         mock_async_get_request = AsyncMock()
-        with patch(self.create_measurement) as post:
+        with patch(self.create_measurements) as post:
             self.client["quality_time_db"]["reports"].insert_one(report_without_mandatory_parameter)
             await self._fetch_measurements(mock_async_get_request)
         post.assert_called_once_with(
             self.database,
-            self.expected_measurement(
-                source_parameter_hash="8c3b464958e9ad0f20fb2e3b74c80519",
-                value="0",
-                total="100",
-                entities=[],
-                api_url="",
-                landing_url="",
-            ),
+            [
+                self.expected_measurement(
+                    source_parameter_hash="8c3b464958e9ad0f20fb2e3b74c80519",
+                    payload_hash=None,
+                    value="0",
+                    total="100",
+                    entities=[],
+                    api_url="",
+                    landing_url="",
+                ),
+            ],
         )
 
     @patch("pathlib.Path.open", new_callable=mock_open)
@@ -0,0 +1,86 @@
+"""Unit tests for the lookup cache."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from base_collectors.lookup_cache import LookupCache
+from collector_utilities.type import URL
+
+
+class LookupCacheTest(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the lookup cache."""
+
+    def setUp(self) -> None:
+        """Override to create the cache and the lookup."""
+        self.cache = LookupCache(time_to_live=3600)
+        self.lookup = AsyncMock(return_value={"summary": "summary"})
+        self.key = (URL("https://jira/rest/api/2/field"), ("jadoe", "secret"))
+
+    async def get(self, key=None) -> dict[str, str]:
+        """Do the lookup via the cache."""
+        return await self.cache.get(key or self.key, self.lookup)
+
+    async def test_miss(self):
+        """Test that the lookup is done on a cache miss."""
+        self.assertEqual({"summary": "summary"}, await self.get())
+        self.lookup.assert_awaited_once()
+        self.assertEqual((0, 1), (self.cache.hits, self.cache.misses))
+
+    async def test_hit(self):
+        """Test that the lookup result is reused for the same key."""
+        await self.get()
+        self.assertEqual({"summary": "summary"}, await self.get())
+        self.lookup.assert_awaited_once()
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    async def test_coalesce_lookups_in_flight(self):
+        """Test that concurrent lookups with the same key result in one lookup."""
+        results = await asyncio.gather(self.get(), self.get(), self.get())
+        self.assertEqual([{"summary": "summary"}] * 3, results)
+        self.lookup.assert_awaited_once()
+
+    async def test_different_credentials(self):
+        """Test that lookups with different credentials are not shared."""
+        await self.get()
+        await self.get((self.key[0], ("other", "secret")))
+        self.assertEqual(2, self.lookup.await_count)
+
+    async def test_expired(self):
+        """Test that the lookup is done again after the time to live."""
+        with patch("base_collectors.task_cache.time", Mock(monotonic=Mock(side_effect=[0, 3601]))):
+            await self.get()
+            await self.get()
+        self.assertEqual(2, self.lookup.await_count)
+
+    async def test_failed_lookups_are_not_cached(self):
+        """Test that failed lookups are retried."""
+        self.lookup.side_effect = [ValueError, {"summary": "summary"}]
+        with self.assertRaises(ValueError):
+            await self.get()
+        self.assertEqual({"summary": "summary"}, await self.get())
+
+    @patch("base_collectors.task_cache.get_logger")
+    async def test_log_statistics(self, get_logger: Mock):
+        """Test that the statistics are logged and reset."""
+        await self.get()
+        await self.get()
+        self.cache.log_statistics()
+        get_logger.return_value.info.assert_called_once_with(
+            "%s: %d hit(s), %d miss(es) since the previous wake-up (hit rate %.0f%%), %d %s cached",
+            "Lookup cache",
+            1,
+            1,
+            50,
+            1,
+            "result(s)",
+        )
+        self.assertEqual((0, 0), (self.cache.hits, self.cache.misses))
+
+    @patch("base_collectors.task_cache.get_logger")
+    async def test_remove_expired_results(self, get_logger: Mock):
+        """Test that expired results are removed when the statistics are logged."""
+        with patch("base_collectors.task_cache.time", Mock(monotonic=Mock(side_effect=[0, 3601]))):
+            await self.get()
+            self.cache.log_statistics()
+        self.assertEqual(0, get_logger.return_value.info.call_args.args[-2])
@@ -0,0 +1,46 @@
+"""Unit tests for the measurement writer."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from base_collectors.measurement_writer import MeasurementWriter
+
+
+@patch("base_collectors.measurement_writer.create_measurements")
+class MeasurementWriterTest(unittest.TestCase):
+    """Unit tests for the measurement writer."""
+
+    def setUp(self) -> None:
+        """Override to create the measurement writer."""
+        self.database = Mock()
+        self.writer = MeasurementWriter(self.database)
+
+    def test_flush(self, create_measurements: Mock):
+        """Test that the batch is written when flushed."""
+        self.writer.add({"metric_uuid": "metric_uuid"})
+        create_measurements.assert_not_called()
+        self.writer.flush()
+        create_measurements.assert_called_once_with(self.database, [{"metric_uuid": "metric_uuid"}])
+
+    def test_flush_empty_batch(self, create_measurements: Mock):
+        """Test that nothing is written if the batch is empty."""
+        self.writer.flush()
+        create_measurements.assert_not_called()
+
+    def test_flush_full_batch(self, create_measurements: Mock):
+        """Test that the batch is written as soon as it is full."""
+        for index in range(MeasurementWriter.MAX_BATCH_SIZE):
+            self.writer.add({"metric_uuid": f"metric_uuid{index}"})
+        create_measurements.assert_called_once()
+        self.assertEqual(MeasurementWriter.MAX_BATCH_SIZE, len(create_measurements.call_args.args[1]))
+        self.writer.flush()
+        create_measurements.assert_called_once()
+
+    def test_flush_if_due(self, create_measurements: Mock):
+        """Test that the batch is written when the oldest measurement has waited longer than the write interval."""
+        with patch("base_collectors.measurement_writer.time", Mock(monotonic=Mock(side_effect=[0, 0, 5, 10]))):
+            self.writer.add({"metric_uuid": "metric_uuid"})  # Time is 0 when adding and when checking whether to write
+            self.writer.flush_if_due()  # Time is 5
+            create_measurements.assert_not_called()
+            self.writer.flush_if_due()  # Time is 10
+        create_measurements.assert_called_once()
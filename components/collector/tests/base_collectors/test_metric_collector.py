@@ -8,7 +8,8 @@ import aiohttp
 
 from shared.model.metric import Metric
 
-from base_collectors import MetricCollector
+from base_collectors import CollectionContext, MetricCollector
+from base_collectors.host_limiter import HostLimiter
 from model.measurement import MetricMeasurement
 
 from shared_test_code.fixtures import METRIC_ID
@@ -32,6 +33,22 @@ class MetricCollectorTest(unittest.IsolatedAsyncioTestCase):
         mock_async_get_request.json.side_effect = [{}]
         with patch("aiohttp.ClientSession.get", AsyncMock(return_value=mock_async_get_request)):
             async with aiohttp.ClientSession() as session:
-                metric_measurement = cast(MetricMeasurement, await MetricCollector(session, metric).collect())
+                metric_measurement = cast(
+                    MetricMeasurement, await MetricCollector(metric, CollectionContext(session)).collect()
+                )
         self.assertEqual("FOO-21", metric_measurement.issue_statuses[0].issue_id)
         self.assertEqual([], metric_measurement.sources)
+
+    @patch("base_collectors.source_collector.MAX_REQUESTS_PER_HOST", 20)
+    async def test_limit_concurrent_requests_per_host(self):
+        """Test that the source collectors use the maximum number of concurrent requests from the data model."""
+        sources = {"source_uuid": {"type": "jira", "parameters": {"url": "https://jira"}}}
+        metric = Metric({}, {"type": "source_version", "sources": sources}, METRIC_ID)
+        host_limiter = HostLimiter()
+        with (
+            patch.object(host_limiter, "limit", wraps=host_limiter.limit) as limit,
+            patch("aiohttp.ClientSession.get", AsyncMock(side_effect=aiohttp.ClientError)),
+        ):
+            async with aiohttp.ClientSession() as session:
+                await MetricCollector(metric, CollectionContext(session, host_limiter)).collect()
+        self.assertEqual(5, limit.call_args.args[1])
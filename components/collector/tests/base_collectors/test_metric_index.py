@@ -0,0 +1,112 @@
+"""Unit tests for the metric index."""
+
+import unittest
+from unittest.mock import patch
+
+import mongomock
+
+from shared.model.report import Report
+
+from base_collectors.metric_index import MetricIndex
+
+from shared_test_code.fixtures import METRIC_ID, METRIC_ID2, SUBJECT_ID
+
+from tests.fixtures import create_report
+
+
+class MetricIndexTest(unittest.TestCase):
+    """Unit tests for the metric index."""
+
+    def setUp(self) -> None:
+        """Override to set up the database and the metric index."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+        self.metric_index = MetricIndex(self.database)
+
+    def insert_report(self, timestamp: str, report_uuid: str = "report1", **kwargs) -> dict:
+        """Insert a new version of the report in the database."""
+        self.database["reports"].update_many({"report_uuid": report_uuid}, {"$unset": {"last": ""}})
+        report = create_report(report_uuid=report_uuid, **kwargs)
+        report["timestamp"] = timestamp
+        self.database["reports"].insert_one(report)
+        return report
+
+    def test_empty_database(self):
+        """Test that the index is empty if the database has no reports."""
+        self.assertEqual([], self.metric_index.update())
+        self.assertEqual({}, self.metric_index.metrics)
+
+    def test_initial_update(self):
+        """Test that the first update loads all reports."""
+        self.insert_report("2026-01-01T00:00:00+00:00")
+        self.assertEqual([METRIC_ID], self.metric_index.update())
+        self.assertEqual([METRIC_ID], list(self.metric_index.metrics))
+        self.assertEqual("report1", self.metric_index.metrics[METRIC_ID]["report_uuid"])
+
+    def test_update_without_changes(self):
+        """Test that an update without changed reports does not change the index."""
+        self.insert_report("2026-01-01T00:00:00+00:00")
+        self.metric_index.update()
+        metric = self.metric_index.metrics[METRIC_ID]
+        self.assertEqual([], self.metric_index.update())
+        self.assertIs(metric, self.metric_index.metrics[METRIC_ID])
+
+    def test_update_only_loads_changed_reports(self):
+        """Test that an update only loads the reports that changed since the previous update."""
+        self.insert_report("2026-01-01T00:00:00+00:00")
+        self.insert_report("2026-01-01T00:00:00+00:00", report_uuid="report2", metric_id=METRIC_ID2)
+        self.metric_index.update()
+        self.insert_report("2026-01-02T00:00:00+00:00", title="New title")
+        with patch("base_collectors.metric_index.Report", wraps=Report) as report:
+            self.assertEqual([], self.metric_index.update())
+        report.assert_called_once()
+        self.assertEqual({METRIC_ID, METRIC_ID2}, set(self.metric_index.metrics))
+
+    def test_edited_metric(self):
+        """Test that an edited metric replaces the old version of the metric."""
+        self.insert_report("2026-01-01T00:00:00+00:00")
+        self.metric_index.update()
+        report = create_report()
+        report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]["target"] = "10"
+        report["timestamp"] = "2026-01-02T00:00:00+00:00"
+        self.database["reports"].update_many({}, {"$unset": {"last": ""}})
+        self.database["reports"].insert_one(report)
+        self.assertEqual([METRIC_ID], self.metric_index.update())
+        self.assertEqual("10", self.metric_index.metrics[METRIC_ID]["target"])
+
+    def test_deleted_report(self):
+        """Test that the metrics of a deleted report are removed from the index."""
+        self.insert_report("2026-01-01T00:00:00+00:00")
+        self.metric_index.update()
+        self.insert_report("2026-01-02T00:00:00+00:00", deleted="true")
+        self.assertEqual([], self.metric_index.update())
+        self.assertEqual({}, self.metric_index.metrics)
+
+    def test_moved_metric(self):
+        """Test that a metric moved to another report stays in the index, regardless of the order of processing."""
+        self.insert_report("2026-01-01T00:00:00+00:00")
+        self.metric_index.update()
+        self.insert_report("2026-01-02T00:00:00+00:00", report_uuid="report2")
+        self.insert_report("2026-01-02T00:00:01+00:00", deleted="true")
+        self.metric_index.update()
+        self.assertEqual("report2", self.metric_index.metrics[METRIC_ID]["report_uuid"])
+
+    def test_report_inserted_late(self):
+        """Test that a report with an older timestamp than the most recent one seen is still picked up."""
+        self.insert_report("2026-01-01T00:01:00+00:00")
+        self.metric_index.update()
+        self.insert_report("2026-01-01T00:00:30+00:00", report_uuid="report2", metric_id=METRIC_ID2)
+        self.assertEqual([METRIC_ID2], self.metric_index.update())
+        self.assertEqual({METRIC_ID, METRIC_ID2}, set(self.metric_index.metrics))
+
+    def test_reports_without_timestamp(self):
+        """Test that reports without timestamp are loaded on every update."""
+        self.database["reports"].insert_one(create_report())
+        self.metric_index.update()
+        with patch("base_collectors.metric_index.Report", wraps=Report) as report:
+            self.assertEqual([], self.metric_index.update())
+        report.assert_called_once()
+
+    def test_multiple_latest_documents_of_one_report(self):
+        """Test that the metrics of all latest documents of a report are indexed."""
+        self.database["reports"].insert_many([create_report(), create_report(metric_id=METRIC_ID2)])
+        self.assertEqual([METRIC_ID, METRIC_ID2], self.metric_index.update())
@@ -0,0 +1,58 @@
+"""Unit tests for the parse executor."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from base_collectors.parse_executor import ParseExecutor
+
+
+class ParseExecutorTest(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the parse executor."""
+
+    def setUp(self) -> None:
+        """Override to create a parse executor that uses threads instead of processes to speed up the tests."""
+        with patch("base_collectors.parse_executor.ProcessPoolExecutor", ThreadPoolExecutor):
+            self.parse_executor = ParseExecutor(max_workers=1, size_threshold=100)
+
+    def test_offloads_big_responses(self):
+        """Test that responses of at least the size threshold are parsed in a worker process."""
+        self.assertFalse(self.parse_executor.offloads(99))
+        self.assertTrue(self.parse_executor.offloads(100))
+
+    def test_does_not_offload_without_workers(self):
+        """Test that responses are not parsed in a worker process if there are no workers."""
+        self.assertFalse(ParseExecutor().offloads(1_000_000))
+
+    async def test_run_in_worker_process(self):
+        """Test that the function is run in a worker and that this is counted."""
+        self.assertEqual(6, await self.parse_executor.run_in_worker_process("Collector", sum, [1, 2, 3]))
+        self.assertEqual(1, self.parse_executor.statistics("Collector").offloaded)
+
+    def test_timed(self):
+        """Test that the parse time is recorded."""
+        with patch("base_collectors.parse_executor.time", Mock(monotonic=Mock(side_effect=[0, 2, 10, 11]))):
+            with self.parse_executor.timed("Collector"):
+                pass
+            with self.parse_executor.timed("Collector"):
+                pass
+        statistics = self.parse_executor.statistics("Collector")
+        self.assertEqual((2, 3.0, 2.0), (statistics.parses, statistics.total_duration, statistics.max_duration))
+
+    def test_timed_exception(self):
+        """Test that the parse time is recorded if parsing fails."""
+        with self.assertRaises(ValueError), self.parse_executor.timed("Collector"):
+            raise ValueError
+        self.assertEqual(1, self.parse_executor.statistics("Collector").parses)
+
+    @patch("base_collectors.parse_executor.get_logger")
+    def test_log_statistics(self, get_logger: Mock):
+        """Test that the statistics are logged and reset."""
+        with self.parse_executor.timed("Collector"):
+            pass
+        self.parse_executor.log_statistics()
+        get_logger.return_value.info.assert_called_once()
+        self.assertEqual(0, self.parse_executor.statistics("Collector").parses)
+        get_logger.return_value.info.reset_mock()
+        self.parse_executor.log_statistics()
+        get_logger.return_value.info.assert_not_called()
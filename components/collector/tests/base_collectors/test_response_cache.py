@@ -0,0 +1,91 @@
+"""Unit tests for the response cache."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+
+from base_collectors.response_cache import ResponseCache
+from collector_utilities.type import URL
+
+
+class ResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the response cache."""
+
+    def setUp(self) -> None:
+        """Override to create the cache and the session."""
+        self.cache = ResponseCache(time_to_live=60)
+        self.response = AsyncMock()
+        self.session = Mock(get=AsyncMock(return_value=self.response))
+        self.url = URL("https://sonarqube/api/measures/component")
+
+    async def get(self, url: URL | None = None, headers: dict[str, str] | None = None, auth=None) -> Mock:
+        """Get the URL via the cache."""
+        return await self.cache.get(self.session, url or self.url, headers or {}, auth)
+
+    async def test_miss(self):
+        """Test that the URL is retrieved and the body is read on a cache miss."""
+        self.assertEqual(self.response, await self.get())
+        self.session.get.assert_awaited_once_with(self.url, allow_redirects=True, headers={}, auth=None)
+        self.response.read.assert_awaited_once()
+        self.assertEqual((0, 1), (self.cache.hits, self.cache.misses))
+
+    async def test_hit(self):
+        """Test that the response is reused for the same request."""
+        await self.get()
+        self.assertEqual(self.response, await self.get())
+        self.session.get.assert_awaited_once()
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    async def test_coalesce_requests_in_flight(self):
+        """Test that concurrent requests for the same URL result in one get."""
+        responses = await asyncio.gather(self.get(), self.get(), self.get())
+        self.assertEqual([self.response] * 3, responses)
+        self.session.get.assert_awaited_once()
+
+    async def test_different_credentials(self):
+        """Test that requests with different credentials or headers are not shared."""
+        await self.get(auth=aiohttp.BasicAuth("jadoe", "secret"))
+        await self.get(auth=aiohttp.BasicAuth("other", "secret"))
+        await self.get(headers={"Private-Token": "token"})
+        self.assertEqual(3, self.session.get.await_count)
+
+    async def test_expired(self):
+        """Test that the URL is retrieved again after the time to live."""
+        with patch("base_collectors.task_cache.time", Mock(monotonic=Mock(side_effect=[0, 61]))):
+            await self.get()
+            await self.get()
+        self.assertEqual(2, self.session.get.await_count)
+
+    async def test_failed_requests_are_not_cached(self):
+        """Test that failed requests are retried."""
+        self.session.get.side_effect = [aiohttp.ClientError, self.response]
+        with self.assertRaises(aiohttp.ClientError):
+            await self.get()
+        self.assertEqual(self.response, await self.get())
+
+    @patch("base_collectors.task_cache.get_logger")
+    async def test_log_statistics(self, get_logger: Mock):
+        """Test that the statistics are logged and reset."""
+        await self.get()
+        await self.get()
+        self.cache.log_statistics()
+        get_logger.return_value.info.assert_called_once_with(
+            "%s: %d hit(s), %d miss(es) since the previous wake-up (hit rate %.0f%%), %d %s cached",
+            "Response cache",
+            1,
+            1,
+            50,
+            1,
+            "response(s)",
+        )
+        self.assertEqual((0, 0), (self.cache.hits, self.cache.misses))
+
+    @patch("base_collectors.task_cache.get_logger")
+    async def test_remove_expired_responses(self, get_logger: Mock):
+        """Test that expired responses are removed when the statistics are logged."""
+        with patch("base_collectors.task_cache.time", Mock(monotonic=Mock(side_effect=[0, 61]))):
+            await self.get()
+            self.cache.log_statistics()
+        self.assertEqual(0, get_logger.return_value.info.call_args.args[-2])
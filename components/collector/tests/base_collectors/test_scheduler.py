@@ -0,0 +1,87 @@
+"""Unit tests for the metric scheduler."""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from dateutil.tz import tzutc
+
+from base_collectors.scheduler import MetricScheduler, config
+
+
+@patch.object(config, "MEASUREMENT_FREQUENCY", 900)
+@patch.object(config, "MEASUREMENT_JITTER", 0)
+class MetricSchedulerTest(unittest.TestCase):
+    """Unit tests for the metric scheduler."""
+
+    def setUp(self) -> None:
+        """Override to set up the scheduler."""
+        self.scheduler = MetricScheduler()
+        self.now = datetime(2026, 1, 1, tzinfo=tzutc())
+        self.metric_uuids = {"m1", "m2", "m3"}
+
+    def pop_due(self, limit: int = 10, seconds_later: int = 0) -> list[str]:
+        """Pop the due metrics."""
+        return self.scheduler.pop_due(self.metric_uuids, limit, self.now + timedelta(seconds=seconds_later))
+
+    def test_empty_schedule(self):
+        """Test that nothing is due if no metrics are scheduled."""
+        self.assertEqual([], self.pop_due())
+        self.assertIsNone(self.scheduler.seconds_until_next_due(self.metric_uuids, self.now))
+
+    def test_new_metrics_are_due_in_order(self):
+        """Test that new metrics are due immediately, in the order they were scheduled."""
+        self.scheduler.schedule_now(["m2", "m1"], self.now)
+        self.assertEqual(["m2", "m1"], self.pop_due())
+
+    def test_limit(self):
+        """Test that at most limit metrics are returned and that the rest remains due."""
+        self.scheduler.schedule_now(["m1", "m2"], self.now)
+        self.assertEqual(["m1"], self.pop_due(limit=1))
+        self.assertEqual(0, self.scheduler.seconds_until_next_due(self.metric_uuids, self.now))
+        self.assertEqual(["m2"], self.pop_due(limit=1))
+
+    def test_metrics_are_rescheduled(self):
+        """Test that metrics are due again after the measurement frequency."""
+        self.scheduler.schedule_now(["m1"], self.now)
+        self.pop_due()
+        self.assertEqual([], self.pop_due(seconds_later=899))
+        self.assertEqual(900, self.scheduler.seconds_until_next_due(self.metric_uuids, self.now))
+        self.assertEqual(["m1"], self.pop_due(seconds_later=900))
+
+    @patch.object(config, "MEASUREMENT_JITTER", 60)
+    def test_jitter(self):
+        """Test that a random jitter is added to the due date of rescheduled metrics."""
+        self.scheduler.schedule_now(["m1"], self.now)
+        with patch("random.uniform", return_value=30.0):
+            self.pop_due()
+        self.assertEqual(930, self.scheduler.seconds_until_next_due(self.metric_uuids, self.now))
+
+    @patch.object(config, "MEASUREMENT_JITTER", 60)
+    def test_new_metrics_are_spread(self):
+        """Test that a random jitter is added to the due date of new metrics, but not of edited metrics."""
+        with patch("random.uniform", return_value=30.0):
+            self.scheduler.schedule_now(["m1"], self.now)
+        self.assertEqual(30, self.scheduler.seconds_until_next_due(self.metric_uuids, self.now))
+        self.scheduler.schedule_now(["m1"], self.now)  # Edit m1
+        self.assertEqual(0, self.scheduler.seconds_until_next_due(self.metric_uuids, self.now))
+
+    def test_edited_metrics_jump_the_queue(self):
+        """Test that edited metrics are due before metrics that are overdue."""
+        self.scheduler.schedule_now(["m1", "m2", "m3"], self.now)
+        self.pop_due(limit=1)  # Measure m1
+        self.scheduler.schedule_now(["m1"], self.now)  # Edit m1
+        self.assertEqual(["m1", "m2", "m3"], self.pop_due())
+
+    def test_removed_metrics_are_dropped(self):
+        """Test that metrics that no longer exist are not returned."""
+        self.scheduler.schedule_now(["m1", "m2"], self.now)
+        self.metric_uuids.remove("m1")
+        self.assertEqual(["m2"], self.pop_due())
+
+    def test_stats(self):
+        """Test the number of due metrics and the lag."""
+        self.scheduler.schedule_now(["m1", "m2"], self.now)
+        self.assertEqual((2, 10.0), self.scheduler.stats(self.now + timedelta(seconds=10)))
+        self.pop_due(limit=1, seconds_later=10)
+        self.assertEqual((1, 10.0), self.scheduler.stats(self.now + timedelta(seconds=10)))
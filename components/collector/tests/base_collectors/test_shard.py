@@ -0,0 +1,82 @@
+"""Unit tests for dividing the metrics over the collector replicas."""
+
+import unittest
+from typing import cast
+
+import mongomock
+
+from shared.model.metric import Metric
+from shared.utils.type import MetricId
+
+from base_collectors.shard import HashRing, Shard
+
+
+class HashRingTest(unittest.TestCase):
+    """Unit tests for the consistent hash ring."""
+
+    def setUp(self) -> None:
+        """Override to create keys."""
+        self.keys = [f"metric{index}" for index in range(1000)]
+
+    def test_empty_ring(self):
+        """Test that keys belong to no node if the ring has no nodes."""
+        self.assertIsNone(HashRing([]).node("metric"))
+
+    def test_one_node(self):
+        """Test that all keys belong to the node if the ring has one node."""
+        self.assertEqual({"a"}, {HashRing(["a"]).node(key) for key in self.keys})
+
+    def test_keys_are_spread_over_nodes(self):
+        """Test that each node gets a reasonable share of the keys."""
+        ring = HashRing(["a", "b", "c"])
+        nodes = [ring.node(key) for key in self.keys]
+        for node in "abc":
+            self.assertGreater(nodes.count(node), 200)
+
+    def test_only_keys_of_leaving_node_move(self):
+        """Test that only the keys of a node that leaves the ring move to other nodes."""
+        ring, smaller_ring = HashRing(["a", "b", "c"]), HashRing(["a", "b"])
+        for key in self.keys:
+            if (node := ring.node(key)) != "c":
+                self.assertEqual(node, smaller_ring.node(key))
+
+
+class ShardTest(unittest.TestCase):
+    """Unit tests for the shard."""
+
+    def setUp(self) -> None:
+        """Override to create a database and metrics."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+        self.metrics = {cast(MetricId, f"metric{index}"): cast(Metric, {}) for index in range(100)}
+
+    def shard(self, replica_id: str = "a") -> Shard:
+        """Create a shard."""
+        return Shard(self.database, replica_id, 120)
+
+    def test_one_replica(self):
+        """Test that a single replica owns all metrics."""
+        shard = self.shard()
+        self.assertEqual(list(self.metrics), shard.update(self.metrics))
+        self.assertEqual(self.metrics, shard.metrics)
+        self.assertEqual([], shard.update(self.metrics))
+
+    def test_replica_joins(self):
+        """Test that the metrics are divided when another replica joins."""
+        shard_a, shard_b = self.shard("a"), self.shard("b")
+        shard_a.update(self.metrics)
+        shard_b.update(self.metrics)
+        self.assertEqual([], shard_a.update(self.metrics))
+        self.assertEqual(self.metrics, shard_a.metrics | shard_b.metrics)
+        self.assertFalse(shard_a.metrics.keys() & shard_b.metrics.keys())
+
+    def test_replica_leaves(self):
+        """Test that the metrics of a replica whose lease expired move to the remaining replicas."""
+        shard_a, shard_b = self.shard("a"), self.shard("b")
+        shard_a.update(self.metrics)
+        shard_b.update(self.metrics)
+        shard_a.update(self.metrics)
+        metrics_b = list(shard_b.metrics)
+        self.database.collector_replicas.update_one({"_id": "b"}, {"$set": {"expiration": "2000-01-01T00:00:00"}})
+        self.assertEqual(sorted(metrics_b), sorted(shard_a.update(self.metrics)))
+        self.assertEqual(self.metrics, shard_a.metrics)
+        self.assertEqual(["a"], [replica["_id"] for replica in self.database.collector_replicas.find()])
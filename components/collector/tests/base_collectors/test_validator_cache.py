@@ -0,0 +1,64 @@
+"""Unit tests for the validator cache."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from base_collectors.validator_cache import ValidatorCache
+from collector_utilities.type import URL
+from model import SourceMeasurement
+
+
+class ValidatorCacheTest(unittest.TestCase):
+    """Unit tests for the validator cache."""
+
+    def setUp(self) -> None:
+        """Override to create the cache and a measurement."""
+        self.cache = ValidatorCache(max_age=3600)
+        self.url = URL("https://jenkins/job/artifact/report.json")
+        self.validators = {self.url: {"If-None-Match": '"1"'}}
+        self.measurement = SourceMeasurement(value="1")
+
+    def test_no_conditional_headers_without_measurement(self):
+        """Test that there are no conditional headers if the cache has no measurement."""
+        self.assertEqual({}, self.cache.conditional_headers("key", self.url))
+
+    def test_conditional_headers(self):
+        """Test that the conditional headers are returned if the cache has a measurement."""
+        self.cache.store("key", self.validators, self.measurement)
+        self.assertEqual({"If-None-Match": '"1"'}, self.cache.conditional_headers("key", self.url))
+        self.assertEqual({}, self.cache.conditional_headers("key", URL("https://jenkins/other.json")))
+        self.assertEqual({}, self.cache.conditional_headers("other key", self.url))
+
+    def test_measurement(self):
+        """Test that a copy of the measurement is returned."""
+        self.cache.store("key", self.validators, self.measurement)
+        measurement = self.cache.measurement("key")
+        self.assertEqual(self.measurement, measurement)
+        self.assertIsNot(self.measurement, measurement)
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    def test_remove(self):
+        """Test that a measurement can be removed."""
+        self.cache.store("key", self.validators, self.measurement)
+        self.cache.remove("key")
+        self.cache.remove("key")
+        self.assertEqual({}, self.cache.conditional_headers("key", self.url))
+
+    @patch("base_collectors.validator_cache.get_logger")
+    def test_log_statistics(self, get_logger: Mock):
+        """Test that the statistics are logged and reset."""
+        self.cache.store("key", self.validators, self.measurement)
+        self.cache.measurement("key")
+        self.cache.log_statistics()
+        get_logger.return_value.info.assert_called_once_with(
+            "Validator cache: %d hit(s), %d miss(es) since the previous wake-up, %d measurement(s) cached", 1, 1, 1
+        )
+        self.assertEqual((0, 0), (self.cache.hits, self.cache.misses))
+
+    @patch("base_collectors.validator_cache.get_logger")
+    def test_remove_unused_measurements(self, get_logger: Mock):
+        """Test that measurements that have not been used for a long time are removed."""
+        with patch("base_collectors.validator_cache.time", Mock(monotonic=Mock(side_effect=[0, 3600]))):
+            self.cache.store("key", self.validators, self.measurement)
+            self.cache.log_statistics()
+        self.assertEqual(0, get_logger.return_value.info.call_args.args[-1])
@@ -5,14 +5,17 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 from dateutil.tz import tzutc
+from defusedxml import EntitiesForbidden
 
 from collector_utilities.date_time import days_ago
+from collector_utilities.exceptions import XMLRootElementError
 from collector_utilities.functions import (
     add_query,
     decimal_round_half_up,
     hashless,
     is_regexp,
     iterable_to_batches,
+    iterparse_xml,
     matches_filter,
     stable_traceback,
     tokenless,
@@ -201,3 +204,52 @@ class DecimalRoundHalfUpTest(unittest.TestCase):
         self.assertEqual(1, decimal_round_half_up(1.1))
         self.assertEqual(2, decimal_round_half_up(1.5))
         self.assertEqual(2, decimal_round_half_up(Decimal("1.5")))
+
+
+class IterparseXMLTest(unittest.TestCase):
+    """Unit tests for the iterparse XML function."""
+
+    XML = b"""<?xml version="1.0"?>
+    <testsuites>
+        <testsuite name="ts1">
+            <properties><property name="p1"/></properties>
+            <testcase name="tc1"><failure/></testcase>
+            <testcase name="tc2"/>
+        </testsuite>
+        <testsuite name="ts2">
+            <testsuite name="ts3"><testcase name="tc3"/></testsuite>
+        </testsuite>
+    </testsuites>"""
+
+    def test_elements_and_ancestors(self):
+        """Test that the elements with the tag are yielded with their children and ancestors."""
+        elements = [
+            (element.get("name"), len(element), [ancestor.get("name") for ancestor in ancestors])
+            for element, ancestors in iterparse_xml(self.XML, ["testcase"])
+        ]
+        self.assertEqual(
+            [("tc1", 1, [None, "ts1"]), ("tc2", 0, [None, "ts1"]), ("tc3", 0, [None, "ts2", "ts3"])], elements
+        )
+
+    def test_parsed_elements_are_removed(self):
+        """Test that elements are removed from the tree after they have been parsed."""
+        root = [ancestors[0] for _, ancestors in iterparse_xml(self.XML, ["testcase"])][-1]
+        self.assertEqual([], list(root.iter("testcase")))
+        self.assertEqual([], list(root.iter("property")))
+
+    def test_namespaces(self):
+        """Test that tags are matched without namespace."""
+        xml = b'<analysis xmlns="https://ns"><dependencies><dependency/></dependencies></analysis>'
+        elements = [element.tag for element, _ in iterparse_xml(xml, ["dependency"])]
+        self.assertEqual(["{https://ns}dependency"], elements)
+
+    def test_allowed_root_tags(self):
+        """Test that an exception is raised if the root element is not allowed."""
+        with self.assertRaises(XMLRootElementError):
+            list(iterparse_xml(self.XML, ["testcase"], ["testsuite"]))
+
+    def test_entities_are_forbidden(self):
+        """Test that entities are forbidden."""
+        xml = b'<!DOCTYPE foo [<!ENTITY xxe SYSTEM "file:///etc/passwd">]><foo>&xxe;</foo>'
+        with self.assertRaises(EntitiesForbidden):
+            list(iterparse_xml(xml, ["foo"]))
@@ -2,10 +2,14 @@
 
 import unittest
 from typing import cast
+from unittest.mock import Mock, patch
 
 import mongomock
+from bson import ObjectId
 
-from database.measurements import create_measurement
+from shared.model.metric import Metric
+
+from database.measurements import create_measurements
 
 from shared_test_code.fixtures import METRIC_ID, METRIC_ID2, REPORT_ID, SOURCE_ID, SOURCE_ID2, SUBJECT_ID
 
@@ -26,11 +30,12 @@ class TestMeasurements(unittest.TestCase):
         source_parameter_hash: str = "hash",
         metric_uuid: str = METRIC_ID,
         source_uuid: str = SOURCE_ID,
+        payload_hash: str | None = None,
     ) -> dict:
         """Create the measurement data."""
-        return {
-            "start": "2023-07-19T16:50:47+00:000",
-            "end": "2023-07-19T16:50:47+00:001",
+        measurement_data = {
+            "start": "2023-07-19T16:50:47+00:00",
+            "end": "2023-07-19T16:50:48+00:00",
             "has_error": False,
             "sources": [
                 {
@@ -49,11 +54,20 @@ class TestMeasurements(unittest.TestCase):
             "report_uuid": REPORT_ID,
             "source_parameter_hash": source_parameter_hash,
         }
+        if payload_hash:
+            measurement_data["payload_hash"] = payload_hash
+        return measurement_data
+
+    @staticmethod
+    def source_parameter_hash() -> str:
+        """Return the source parameter hash of the metric."""
+        metric = create_report(report_uuid=REPORT_ID)["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]
+        return Metric({}, metric, METRIC_ID).source_parameter_hash()
 
     def test_create_measurement_without_latest_measurement(self):
         """Test that create_measurement without a latest measurement inserts a new measurement."""
         self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
-        create_measurement(self.database, self.measurement_data())
+        create_measurements(self.database, [self.measurement_data()])
         self.assertEqual(1, len(list(self.database.measurements.find())))
 
     def test_create_measurement_with_latest_measurement(self):
@@ -67,12 +81,12 @@ class TestMeasurements(unittest.TestCase):
                 ],
             },
         )
-        create_measurement(self.database, self.measurement_data())
+        create_measurements(self.database, [self.measurement_data()])
         self.assertEqual(2, len(list(self.database.measurements.find())))
 
     def test_create_measurement_with_no_latest_metric(self):
         """Test that create_measurement does not insert new measurement when the metric does not exist."""
-        create_measurement(self.database, self.measurement_data())
+        create_measurements(self.database, [self.measurement_data()])
         self.assertEqual(0, len(list(self.database.measurements.find())))
 
     def test_create_measurement_without_source(self):
@@ -80,28 +94,87 @@ class TestMeasurements(unittest.TestCase):
         report = create_report(report_uuid=REPORT_ID)
         del report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]["sources"][SOURCE_ID]
         self.database["reports"].insert_one(report)
-        create_measurement(self.database, self.measurement_data())
+        create_measurements(self.database, [self.measurement_data()])
         self.assertEqual(0, len(list(self.database.measurements.find())))
 
     def test_create_measurement_when_its_equal(self):
         """Test that create_measurement with equal measurement does not insert new measurement."""
         self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
-        create_measurement(self.database, self.measurement_data())
-        create_measurement(self.database, self.measurement_data())
+        create_measurements(self.database, [self.measurement_data()])
+        create_measurements(self.database, [self.measurement_data()])
         self.assertEqual(1, len(list(self.database.measurements.find())))
 
     def test_create_measurement_with_changed_source_parameter(self):
         """Test that create_measurement create a new measurement if the source parameters changed."""
         self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
-        create_measurement(self.database, self.measurement_data())
-        create_measurement(self.database, self.measurement_data(source_parameter_hash="new hash"))
+        create_measurements(self.database, [self.measurement_data()])
+        create_measurements(self.database, [self.measurement_data(source_parameter_hash="new hash")])
+        self.assertEqual(2, len(list(self.database.measurements.find())))
+
+    def test_skip_comparison_when_payload_is_unchanged(self):
+        """Test that the end of the latest measurement is updated without comparison if the payload is unchanged."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        source_parameter_hash = self.source_parameter_hash()
+        create_measurements(
+            self.database, [self.measurement_data("2023-07-18", source_parameter_hash, payload_hash="p")]
+        )
+        measurement_data = self.measurement_data("2023-07-18", source_parameter_hash, payload_hash="p")
+        # Change the value to prove that the new measurement is not compared with the latest measurement:
+        measurement_data["sources"][0]["value"] = "11"
+        create_measurements(self.database, [measurement_data])
+        measurements = list(self.database.measurements.find())
+        self.assertEqual(1, len(measurements))
+        self.assertEqual("10", measurements[0]["sources"][0]["value"])
+
+    def test_skip_measurement_of_deleted_source_when_payload_is_unchanged(self):
+        """Test that the latest measurement is not extended with a measurement of a source that no longer exists."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        source_parameter_hash = self.source_parameter_hash()
+        create_measurements(
+            self.database, [self.measurement_data("2023-07-18", source_parameter_hash, payload_hash="p")]
+        )
+        end = self.database.measurements.find_one()["end"]
+        measurement_data = self.measurement_data(
+            "2023-07-18", source_parameter_hash, source_uuid=SOURCE_ID2, payload_hash="p"
+        )
+        create_measurements(self.database, [measurement_data])
+        self.assertEqual(end, self.database.measurements.find_one()["end"])
+
+    def test_create_measurement_when_payload_is_changed(self):
+        """Test that a new measurement is created if the payload changed."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        source_parameter_hash = self.source_parameter_hash()
+        create_measurements(
+            self.database, [self.measurement_data("2023-07-18", source_parameter_hash, payload_hash="p")]
+        )
+        measurement_data = self.measurement_data("2023-07-18", source_parameter_hash, payload_hash="q")
+        measurement_data["sources"][0]["value"] = "11"
+        create_measurements(self.database, [measurement_data])
+        measurements = list(self.database.measurements.find())
+        self.assertEqual(2, len(measurements))
+        self.assertNotIn("payload_hash", measurements[0])
+
+    def test_create_measurement_when_payload_is_unchanged_but_source_parameter_is_changed(self):
+        """Test that a new measurement is created if the payload is unchanged, but the source parameters changed."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        create_measurements(self.database, [self.measurement_data(payload_hash="p")])
+        create_measurements(self.database, [self.measurement_data(source_parameter_hash="new hash", payload_hash="p")])
         self.assertEqual(2, len(list(self.database.measurements.find())))
 
+    def test_remember_payload_hash_of_equal_measurement(self):
+        """Test that the payload hash is added to the latest measurement if the new measurement is equal."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        create_measurements(self.database, [self.measurement_data()])
+        create_measurements(self.database, [self.measurement_data(payload_hash="p")])
+        measurements = list(self.database.measurements.find())
+        self.assertEqual(1, len(measurements))
+        self.assertEqual("p", measurements[0]["payload_hash"])
+
     def test_copy_first_seen_timestamps(self):
         """Test that the first seen timestamps are copied from the latest successful measurement."""
         self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
-        create_measurement(self.database, self.measurement_data())
-        create_measurement(self.database, self.measurement_data(first_seen="2023-07-19"))
+        create_measurements(self.database, [self.measurement_data()])
+        create_measurements(self.database, [self.measurement_data(first_seen="2023-07-19")])
         self.assertEqual(
             "2023-07-18",
             next(self.database.measurements.find())["sources"][0]["entities"][0]["first_seen"],
@@ -110,10 +183,10 @@ class TestMeasurements(unittest.TestCase):
     def test_create_measurement_after_measurement_was_requested(self):
         """Test that a new measurement is added after a measurement request, even if the measurement is unchanged."""
         self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
-        create_measurement(self.database, self.measurement_data())
+        create_measurements(self.database, [self.measurement_data()])
         self.database["reports"].update_one({"report_uuid": REPORT_ID}, {"$set": {"last": False}})
         self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID, measurement_requested="3000-01-01"))
-        create_measurement(self.database, self.measurement_data())
+        create_measurements(self.database, [self.measurement_data()])
         self.assertEqual(2, len(list(self.database.measurements.find())))
 
     def test_create_measurement_for_copied_metric(self):
@@ -142,7 +215,7 @@ class TestMeasurements(unittest.TestCase):
                 ],
             },
         )
-        create_measurement(self.database, self.measurement_data(metric_uuid=METRIC_ID2, source_uuid=SOURCE_ID2))
+        create_measurements(self.database, [self.measurement_data(metric_uuid=METRIC_ID2, source_uuid=SOURCE_ID2)])
         inserted_measurement = self.database.measurements.find_one(filter={"metric_uuid": METRIC_ID2})
         self.assertEqual(entity_user_data, cast(dict, inserted_measurement)["sources"][0]["entity_user_data"])
 
@@ -155,7 +228,7 @@ class TestMeasurements(unittest.TestCase):
             "sources": {SOURCE_ID2: {"type": "pip", "copied_from": SOURCE_ID}},
         }
         self.database["reports"].insert_one(report)
-        create_measurement(self.database, self.measurement_data(metric_uuid=METRIC_ID2, source_uuid=SOURCE_ID2))
+        create_measurements(self.database, [self.measurement_data(metric_uuid=METRIC_ID2, source_uuid=SOURCE_ID2)])
         inserted_measurement = self.database.measurements.find_one(filter={"metric_uuid": METRIC_ID2})
         self.assertNotIn("entity_user_data", cast(dict, inserted_measurement)["sources"][0])
 
@@ -169,6 +242,96 @@ class TestMeasurements(unittest.TestCase):
         }
         del report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]
         self.database["reports"].insert_one(report)
-        create_measurement(self.database, self.measurement_data(metric_uuid=METRIC_ID2, source_uuid=SOURCE_ID2))
+        create_measurements(self.database, [self.measurement_data(metric_uuid=METRIC_ID2, source_uuid=SOURCE_ID2)])
         inserted_measurement = self.database.measurements.find_one(filter={"metric_uuid": METRIC_ID2})
         self.assertNotIn("entity_user_data", cast(dict, inserted_measurement)["sources"][0])
+
+    def test_create_measurements_in_one_batch(self):
+        """Test that measurements of different metrics are written with one bulk write."""
+        report = create_report(report_uuid=REPORT_ID)
+        report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID2] = report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]
+        self.database["reports"].insert_one(report)
+        with patch.object(
+            self.database.measurements, "bulk_write", wraps=self.database.measurements.bulk_write
+        ) as bulk:
+            create_measurements(self.database, [self.measurement_data(), self.measurement_data(metric_uuid=METRIC_ID2)])
+        bulk.assert_called_once()
+        self.assertEqual(2, len(list(self.database.measurements.find())))
+
+    def test_create_equal_measurements_of_the_same_metric_in_one_batch(self):
+        """Test that equal measurements of the same metric in one batch are merged."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        create_measurements(self.database, [self.measurement_data(), self.measurement_data()])
+        self.assertEqual(1, len(list(self.database.measurements.find())))
+
+    def test_create_different_measurements_of_the_same_metric_in_one_batch(self):
+        """Test that the first seen timestamps are copied between measurements of the same metric in one batch."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        create_measurements(
+            self.database,
+            [self.measurement_data(), self.measurement_data(first_seen="2023-07-19", source_parameter_hash="new")],
+        )
+        measurements = list(self.database.measurements.find())
+        self.assertEqual(2, len(measurements))
+        self.assertEqual("2023-07-18", measurements[1]["sources"][0]["entities"][0]["first_seen"])
+        self.assertNotIn("source_parameter_hash", measurements[0])
+
+    def test_create_measurements_without_metrics(self):
+        """Test that nothing is written if none of the metrics exist."""
+        with patch.object(self.database.measurements, "bulk_write") as bulk:
+            create_measurements(self.database, [self.measurement_data()])
+        bulk.assert_not_called()
+
+    def test_create_measurements_updates_latest_measurements(self):
+        """Test that the latest measurements collection refers to the new measurements."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        create_measurements(
+            self.database,
+            [self.measurement_data(), self.measurement_data(first_seen="2023-07-19", source_parameter_hash="new")],
+        )
+        latest_measurement_ids = cast(dict, self.database.latest_measurements.find_one({"metric_uuid": METRIC_ID}))
+        latest = cast(
+            dict, self.database.measurements.find_one({"_id": latest_measurement_ids["latest_measurement_id"]})
+        )
+        self.assertEqual("new", latest["source_parameter_hash"])
+        self.assertEqual(latest["_id"], latest_measurement_ids["latest_successful_measurement_id"])
+        previous = cast(dict, self.database.measurements.find_one({"_id": {"$ne": latest["_id"]}}))
+        self.assertEqual(previous["_id"], latest_measurement_ids["previous_measurement_id"])
+
+    def test_create_measurements_updates_rollups(self):
+        """Test that the daily and weekly rollups of the measured metrics are updated."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        create_measurements(self.database, [self.measurement_data()])
+        rollups = list(self.database.measurement_rollups.find({"metric_uuid": METRIC_ID}))
+        self.assertEqual(["day", "week"], sorted(rollup["resolution"] for rollup in rollups))
+
+    @patch("database.measurements.get_logger")
+    def test_failing_measurement_does_not_prevent_other_measurements(self, get_logger: Mock):
+        """Test that a measurement that can't be inserted doesn't prevent writing the other measurements."""
+        report = create_report(report_uuid=REPORT_ID)
+        report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID2] = report["subjects"][SUBJECT_ID]["metrics"][METRIC_ID]
+        self.database["reports"].insert_one(report)
+        self.database.measurements.insert_one({"_id": (duplicate_id := ObjectId())})
+        with patch("database.measurements.ObjectId", Mock(side_effect=[duplicate_id, new_id := ObjectId()])):
+            create_measurements(self.database, [self.measurement_data(), self.measurement_data(metric_uuid=METRIC_ID2)])
+        self.assertEqual(new_id, cast(dict, self.database.measurements.find_one({"metric_uuid": METRIC_ID2}))["_id"])
+        latest_ids = {ids["metric_uuid"]: ids for ids in self.database.latest_measurements.find()}
+        self.assertIsNone(latest_ids[METRIC_ID]["latest_measurement_id"])
+        self.assertEqual(new_id, latest_ids[METRIC_ID2]["latest_measurement_id"])
+        rollups = self.database.measurement_rollups.find()
+        self.assertEqual({METRIC_ID2}, {rollup["metric_uuid"] for rollup in rollups})
+        get_logger.return_value.error.assert_called_once()
+
+    @patch("database.measurements.get_logger", Mock())
+    def test_failing_measurement_is_not_the_previous_measurement(self):
+        """Test that a measurement that can't be inserted doesn't become the previous measurement of its metric."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID))
+        self.database.measurements.insert_one({"_id": (duplicate_id := ObjectId())})
+        with patch("database.measurements.ObjectId", Mock(side_effect=[duplicate_id, new_id := ObjectId()])):
+            create_measurements(
+                self.database,
+                [self.measurement_data(), self.measurement_data(first_seen="2023-07-19", source_parameter_hash="new")],
+            )
+        latest_measurement_ids = cast(dict, self.database.latest_measurements.find_one({"metric_uuid": METRIC_ID}))
+        self.assertEqual(new_id, latest_measurement_ids["latest_measurement_id"])
+        self.assertIsNone(latest_measurement_ids["previous_measurement_id"])
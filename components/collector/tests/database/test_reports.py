@@ -8,7 +8,7 @@ import mongomock
 from shared.model.metric import Metric
 from shared.utils.type import MetricId
 
-from database.reports import latest_metric
+from database.reports import latest_metric, latest_reports_by_uuid, latest_reports_changed_since
 
 from shared_test_code.fixtures import METRIC_ID, REPORT_ID, SOURCE_ID
 
@@ -46,3 +46,62 @@ class TestLatestMetric(unittest.TestCase):
     def test_no_latest_report(self):
         """Test that None is returned for missing metrics."""
         self.assertIsNone(latest_metric(self.database, REPORT_ID, METRIC_ID))
+
+
+class TestLatestReportsChangedSince(unittest.TestCase):
+    """Unit tests for the latest reports changed since a timestamp."""
+
+    def setUp(self) -> None:
+        """Extend to create a database fixture."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+        old_report = create_report(report_uuid="old", last=False)
+        old_report["timestamp"] = "2026-01-01T00:00:00+00:00"
+        report = create_report(report_uuid="old")
+        report["timestamp"] = "2026-01-02T00:00:00+00:00"
+        new_report = create_report(report_uuid="new")
+        new_report["timestamp"] = "2026-01-03T00:00:00+00:00"
+        self.database["reports"].insert_many([old_report, report, new_report])
+
+    def test_all_reports(self):
+        """Test that the latest version of all reports is returned if no timestamp is given."""
+        reports = latest_reports_changed_since(self.database)
+        self.assertEqual(["old", "new"], [report["report_uuid"] for report in reports])
+
+    def test_changed_reports(self):
+        """Test that only the reports changed at or after the timestamp are returned."""
+        reports = latest_reports_changed_since(self.database, "2026-01-03T00:00:00+00:00")
+        self.assertEqual(["new"], [report["report_uuid"] for report in reports])
+
+    def test_deleted_reports(self):
+        """Test that deleted reports are returned, so the collector can remove their metrics."""
+        deleted_report = create_report(report_uuid="deleted", deleted="true")
+        deleted_report["timestamp"] = "2026-01-04T00:00:00+00:00"
+        self.database["reports"].insert_one(deleted_report)
+        reports = latest_reports_changed_since(self.database, "2026-01-04T00:00:00+00:00")
+        self.assertEqual(["deleted"], [report["report_uuid"] for report in reports])
+
+
+class TestLatestReportsByUUID(unittest.TestCase):
+    """Unit tests for the latest reports by report uuid."""
+
+    def setUp(self) -> None:
+        """Extend to create a database fixture."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+
+    def test_latest_reports(self):
+        """Test that the latest versions of the reports are returned."""
+        self.database["reports"].insert_many(
+            [
+                create_report(title="Old", report_uuid=REPORT_ID, last=False),
+                create_report(title="New", report_uuid=REPORT_ID),
+                create_report(report_uuid="other"),
+            ]
+        )
+        reports = latest_reports_by_uuid(self.database, [REPORT_ID, REPORT_ID])
+        self.assertEqual([REPORT_ID], list(reports))
+        self.assertEqual("New", reports[REPORT_ID]["title"])
+
+    def test_deleted_reports(self):
+        """Test that deleted reports are not returned."""
+        self.database["reports"].insert_one(create_report(report_uuid=REPORT_ID, deleted="true"))
+        self.assertEqual({}, latest_reports_by_uuid(self.database, [REPORT_ID]))
@@ -10,7 +10,7 @@ from dateutil.tz import tzlocal, tzutc
 
 from shared.model.metric import Metric
 
-from base_collectors import config
+from base_collectors import CollectionContext, config
 from base_collectors.metric_collector import MetricCollector
 from model import MetricMeasurement
 from source_collectors.jira.change_failure_rate import JiraChangeFailureRate
@@ -126,7 +126,7 @@ class ChangeFailureRateTest(unittest.IsolatedAsyncioTestCase):
             ) as mock_dt,
         ):
             mock_dt.now.return_value = self.COLLECT_DT  # this shifts the perspective of `days_ago`
-            measurement = await change_failure_rate_collector_class(self.session, metric).collect()
+            measurement = await change_failure_rate_collector_class(metric, CollectionContext(self.session)).collect()
 
         if side_effects:
             self.assertEqual(len(side_effects), self.response.json.call_count)
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, patch
 
 from shared.model.metric import Metric
 
-from base_collectors import config
+from base_collectors import CollectionContext, config
 from base_collectors.metric_collector import MetricCollector
 from model import MetricMeasurement
 from source_collectors.jira.issues import JiraIssues
@@ -98,7 +98,7 @@ class TestCasesTest(unittest.IsolatedAsyncioTestCase):
         # to get full coverage:
         test_cases_collector_class = MetricCollector.get_subclass(metric["type"])
         with patch.object(JiraIssues, "max_results", 500):
-            return await test_cases_collector_class(self.session, metric).collect()
+            return await test_cases_collector_class(metric, CollectionContext(self.session)).collect()
 
     async def collect_measurement(self, sources) -> MetricMeasurement:
         """Collect the measurement."""
@@ -116,7 +116,7 @@ class TestCasesTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_no_test_cases(self):
         """Test missing test cases."""
-        self.response.text = AsyncMock(return_value=self.JUNIT_XML)
+        self.response.read = AsyncMock(return_value=self.JUNIT_XML.encode())
         junit = {"type": "junit", "parameters": {"url": self.test_report_url}}
         measurement = await self.collect_measurement({"junit": junit})
         self.assertEqual("No test case keys found in this source", measurement.sources[0].parse_error)
@@ -145,7 +145,7 @@ class TestCasesTest(unittest.IsolatedAsyncioTestCase):
 
     async def test_matching_test_case_junit(self):
         """Test one matching test case."""
-        self.response.text = AsyncMock(return_value=self.JUNIT_XML)
+        self.response.read = AsyncMock(return_value=self.JUNIT_XML.encode())
         jira = {"type": "jira", "parameters": {"url": self.jira_url, "jql": "jql"}}
         junit = {"type": "junit", "parameters": {"url": self.test_report_url}}
         measurement = await self.collect_measurement({"jira": jira, "junit": junit})
@@ -1,5 +1,6 @@
 """Unit tests for the Entity model class."""
 
+import pickle
 import unittest
 
 from model.entity import Entities, Entity
@@ -13,6 +14,14 @@ class EntityTest(unittest.TestCase):
         entities = Entities([Entity(key="1"), Entity(key="2"), Entity(key="2")])
         self.assertEqual(2, len(entities))
 
+    def test_pickle(self):
+        """Test that entities can be pickled, so they can be returned by worker processes."""
+        entities = Entities([Entity(key="1", name="one"), Entity(key="2")])
+        unpickled_entities = pickle.loads(pickle.dumps(entities))  # noqa: S301
+        self.assertEqual(entities, unpickled_entities)
+        unpickled_entities.append(Entity(key="1"))
+        self.assertEqual(2, len(unpickled_entities))
+
     def test_entity_key(self):
         """Test that unsafe characters are replaced."""
         self.assertEqual("_", Entity(".")["key"])
@@ -1,16 +1,18 @@
-"""Unit tests for the SourceMeasurement model class."""
+"""Unit tests for the measurement model classes."""
 
 import unittest
 from datetime import datetime
 
 from dateutil.tz import tzutc
 
+from shared.model.metric import Metric
+
 from model.entity import Entities, Entity
-from model.measurement import SourceMeasurement
+from model.measurement import MetricMeasurement, SourceMeasurement
 
 
 class SourceMeasurementTest(unittest.TestCase):
-    """Unit tests for the SourceMeasurement model class."""
+    """Unit tests for the measurement model classes."""
 
     def test_entity_value_attributes(self):
         """Test that only Value type attributes are stored."""
@@ -19,3 +21,26 @@ class SourceMeasurementTest(unittest.TestCase):
         )
         measurement_dict = SourceMeasurement(entities=entities).as_dict()
         self.assertEqual([{"key": "1", "first_seen": "2023-04-02"}], measurement_dict["entities"])
+
+    def test_payload_hash_is_not_stored_per_source(self):
+        """Test that the payload hash is not part of the source measurement, so it doesn't affect comparisons."""
+        self.assertNotIn("payload_hash", SourceMeasurement(payload_hash="hash").as_dict())
+
+
+class MetricMeasurementTest(unittest.TestCase):
+    """Unit tests for the MetricMeasurement model class."""
+
+    def setUp(self) -> None:
+        """Override to create a metric."""
+        self.metric = Metric({}, {"type": "violations", "sources": {}}, "metric_uuid")
+
+    def test_payload_hash(self):
+        """Test that the measurement has a payload hash if all sources have a payload hash."""
+        sources = [SourceMeasurement(payload_hash="hash1"), SourceMeasurement(payload_hash="hash2")]
+        measurement_dict = MetricMeasurement(self.metric, sources, []).as_dict()
+        self.assertEqual(32, len(measurement_dict["payload_hash"]))
+
+    def test_no_payload_hash_if_a_source_has_no_payload_hash(self):
+        """Test that the measurement has no payload hash if one of the sources has no payload hash."""
+        sources = [SourceMeasurement(payload_hash="hash1"), SourceMeasurement()]
+        self.assertNotIn("payload_hash", MetricMeasurement(self.metric, sources, []).as_dict())
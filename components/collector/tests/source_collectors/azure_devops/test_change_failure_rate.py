@@ -7,7 +7,7 @@ from unittest.mock import AsyncMock, PropertyMock, patch
 
 import aiohttp
 
-from base_collectors import MetricCollector
+from base_collectors import CollectionContext, MetricCollector
 from model.measurement import MetricMeasurement
 
 from .base import AzureDevopsPipelinesTestCase
@@ -95,7 +95,7 @@ class AzureDevopsChangeFailureRateTest(AzureDevopsPipelinesTestCase):
         post_mock = AsyncMock(return_value=post_response)
         with patch("aiohttp.ClientSession.get", get_mock), patch("aiohttp.ClientSession.post", post_mock):
             async with aiohttp.ClientSession() as session:
-                return cast(MetricMeasurement, await MetricCollector(session, self.metric).collect())
+                return cast(MetricMeasurement, await MetricCollector(self.metric, CollectionContext(session)).collect())
 
     async def test_collect(self):
         """Smoke test for modified collect in test class."""
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, patch
 
 import aiohttp
 
-from base_collectors import MetricCollector
+from base_collectors import CollectionContext, MetricCollector
 
 from .base import GitHubTestCase
 
@@ -137,7 +137,7 @@ class GitHubMergeRequestsTest(GitHubTestCase):
         """Return the source responses."""
         with patch("aiogqlc.GraphQLClient.execute", execute_mock):
             async with aiohttp.ClientSession() as session:
-                collector = MetricCollector(session, self.metric)
+                collector = MetricCollector(self.metric, CollectionContext(session))
                 return await collector.collect()
 
     async def test_merge_requests(self):
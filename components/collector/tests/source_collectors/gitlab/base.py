@@ -11,9 +11,10 @@ from tests.source_collectors.source_collector_test_case import SourceCollectorTe
 class FakeResponse:
     """Fake GitLab response."""
 
-    def __init__(self, fake_json, links=None) -> None:
+    def __init__(self, fake_json, links=None, headers=None) -> None:
         self.fake_json = fake_json
         self.links = links or {}
+        self.headers = headers or {}
 
     async def json(self):
         """Return the fake JSON."""
@@ -135,6 +135,20 @@ class GitLabInactiveBranchesTest(GitLabTestCase):
         measurement = await self.collect_measurement(get_request_side_effect=responses)
         self.assert_measurement(measurement, value="2", entities=self.entities, landing_url=self.project_landing_url)
 
+    async def test_project_concurrent_pagination(self):
+        """Test that the remaining pages are retrieved at once if GitLab reports the total number of pages."""
+        next_page = "https://gitlab/branches?per_page=2&page={0}"
+        headers = {"X-Total-Pages": "3"}
+        page1 = FakeResponse(self.branches[:2], links={"next": {"url": next_page.format(2)}}, headers=headers)
+        page2 = FakeResponse(self.branches[2:4], links={"next": {"url": next_page.format(3)}}, headers=headers)
+        page3 = FakeResponse(self.branches[4:], headers=headers)
+        responses = [self.group_does_not_exist(), page1, page2, page3, self.group_does_not_exist()]
+        measurement, get_mock, _ = await self.collect_measurement_and_mocks(get_request_side_effect=responses)
+        self.assert_measurement(measurement, value="2", entities=self.entities, landing_url=self.project_landing_url)
+        requested_urls = [str(call.args[0]) for call in get_mock.call_args_list]
+        self.assertEqual([next_page.format(2), next_page.format(3)], requested_urls[2:4])
+        self.assertEqual(5, get_mock.call_count)
+
     async def test_group_pagination(self):
         """Test that pagination works when getting the branches of a group of projects."""
         page1 = FakeResponse(self.branches[:3], links={"next": {"url": "https://gitlab/next_page"}})
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 
-from base_collectors import MetricCollector
+from base_collectors import CollectionContext, MetricCollector
 
 from .base import GitLabTestCase
 
@@ -86,7 +86,7 @@ class GitLabMergeRequestsTest(GitLabTestCase):
         """Return the source responses."""
         with patch("aiogqlc.GraphQLClient.execute", execute_mock):
             async with aiohttp.ClientSession() as session:
-                collector = MetricCollector(session, self.metric)
+                collector = MetricCollector(self.metric, CollectionContext(session))
                 return await collector.collect()
 
     @staticmethod
@@ -22,7 +22,19 @@ class JiraIssuesTest(JiraTestCase):
         JiraIssues.max_results = 1
         issues_json1 = {"total": 2, "issues": [self.issue()]}
         issues_json2 = {"total": 2, "issues": [self.issue(key="2")]}
-        issues_json3 = {"total": 2, "issues": []}
+        side_effect = [[], issues_json1, issues_json1, issues_json2]
+        measurement, get_mock, _ = await self.collect_measurement_and_mocks(get_request_json_side_effect=side_effect)
+        JiraIssues.max_results = previous_max_results
+        self.assert_measurement(measurement, value="2", entities=[self.entity(), self.entity(key="2")])
+        self.assertEqual(3, get_mock.call_count)
+
+    async def test_pagination_without_total(self):
+        """Test that multiple pages of issues are returned if Jira does not report the total number of issues."""
+        previous_max_results = JiraIssues.max_results
+        JiraIssues.max_results = 1
+        issues_json1 = {"issues": [self.issue()]}
+        issues_json2 = {"issues": [self.issue(key="2")]}
+        issues_json3 = {"issues": []}
         side_effect = [[], issues_json1, issues_json2, issues_json3, issues_json1, issues_json2]
         measurement = await self.collect_measurement(get_request_json_side_effect=side_effect)
         JiraIssues.max_results = previous_max_results
@@ -12,7 +12,7 @@ import aiohttp
 
 from shared.model.metric import Metric
 
-from base_collectors import MetricCollector
+from base_collectors import CollectionContext, MetricCollector
 from model import MetricMeasurement
 
 from shared_test_code.fixtures import METRIC_ID
@@ -69,9 +69,13 @@ class SourceCollectorTestCase(unittest.IsolatedAsyncioTestCase):
         post = AsyncMock(return_value=post_response, side_effect=post_request_side_effect)
         with patch("aiohttp.ClientSession.get", get), patch("aiohttp.ClientSession.post", post):
             async with aiohttp.ClientSession() as session:
-                result = await MetricCollector(session, self.metric).collect()
+                result = await MetricCollector(self.metric, self.collection_context(session)).collect()
                 return (result, get, post) if return_mocks else result
 
+    def collection_context(self, session: aiohttp.ClientSession) -> CollectionContext:
+        """Return the collection context for the metric collector."""
+        return CollectionContext(session)
+
     async def collect_measurement(self, *args, **kwargs) -> MetricMeasurement:
         """Collect a measurement."""
         return cast(MetricMeasurement, await self.collect(*args, **kwargs))
@@ -92,7 +96,7 @@ class SourceCollectorTestCase(unittest.IsolatedAsyncioTestCase):
         """Create the mock get response."""
         get_response = AsyncMock()
         get_response.json = AsyncMock(return_value=json_return_value, side_effect=json_side_effect)
-        get_response.read.return_value = content
+        get_response.read.return_value = content or text.encode()
         get_response.text.return_value = text
         type(get_response).headers = PropertyMock(return_value=headers or {})
         type(get_response).links = PropertyMock(return_value={}, side_effect=[links, {}] if links else None)
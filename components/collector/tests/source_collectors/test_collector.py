@@ -1,14 +1,16 @@
 """Unit tests for the Collector class."""
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import aiohttp
 
 from shared.model.metric import Metric
 
-from base_collectors import SourceCollector
+from base_collectors import CollectionContext, SourceCollector
 from collector_utilities.type import URL
 from model import Entities, Entity, SourceResponses
+from source_collectors.junit.tests import JUnitTests
 
 from shared_test_code.fixtures import METRIC_ID
 
@@ -78,9 +80,44 @@ class CollectorTest(SourceCollectorTestCase):
 
         with patch("aiohttp.ClientSession.get", side_effect=Exception):
             async with aiohttp.ClientSession() as session:
-                measurement = await FailingLandingUrl(session, self.metric, self.sources["source_id"]).collect()
+                collector = FailingLandingUrl(self.metric, self.sources["source_id"], CollectionContext(session))
+                measurement = await collector.collect()
         self.assertEqual("https://api_url", measurement.landing_url)
 
+    @patch("base_collectors.source_collector.MAX_REQUESTS_PER_HOST", 2)
+    async def test_limit_concurrent_requests_per_host_with_pagination(self):
+        """Test that the pages that collectors retrieve concurrently count toward the limit per host."""
+        in_flight, max_in_flight = 0, 0
+
+        async def get(*_args, **_kwargs) -> Mock:
+            """Count the requests in flight."""
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(in_flight, max_in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return Mock()
+
+        class Pages(SourceCollector):
+            """Fake collector retrieving multiple pages concurrently."""
+
+            async def _get_source_responses(self, *urls: URL) -> SourceResponses:
+                """Override to retrieve four pages at once."""
+                return await super()._get_source_responses(*[URL(f"{urls[0]}?page={page}") for page in range(4)])
+
+        with patch("aiohttp.ClientSession.get", AsyncMock(side_effect=get)):
+            async with aiohttp.ClientSession() as session:
+                context = CollectionContext(session)
+                collectors = [Pages(self.metric, self.sources["source_id"], context) for _ in range(3)]
+                await asyncio.gather(*[collector.collect() for collector in collectors])
+        self.assertEqual(2, max_in_flight)
+
+    async def test_collect_without_session(self):
+        """Test that a collector without client session reports a connection error."""
+        collector = JUnitTests(self.metric, self.sources["source_id"], CollectionContext())
+        measurement = await collector.collect()
+        self.assertIn("no client session", str(measurement.connection_error))
+
     async def test_default_parameter_value_supersedes_empty_string(self) -> None:
         """Test that a parameter default value takes precedence over an empty string."""
         sources = {"source_uuid": {"type": "calendar", "parameters": {"date": ""}}}
@@ -102,7 +139,6 @@ class CollectorTest(SourceCollectorTestCase):
                 """Return whether to include the entity in the measurement."""
                 return bool(entity["key"] != "1")
 
-        async with aiohttp.ClientSession() as session:
-            collector = ThreeParsedEntities(session, self.metric, {})
-            measurement = await collector._parse_source_responses(SourceResponses())  # noqa: SLF001
+        collector = ThreeParsedEntities(self.metric, {}, CollectionContext())
+        measurement = await collector._parse_source_responses(SourceResponses())  # noqa: SLF001
         self.assertEqual(["0", "2"], [entity["key"] for entity in measurement.entities or []])
@@ -1,5 +1,17 @@
 """Unit tests for the Trivy JSON security warnings collector."""
 
+import dataclasses
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+
+from base_collectors import CollectionContext, MetricCollector
+from base_collectors.parse_executor import ParseExecutor
+from base_collectors.validator_cache import ValidatorCache
+
 from .base import TrivyJSONTestCase
 
 
@@ -91,3 +103,56 @@ class TrivyJSONSecurityWarningsTest(TrivyJSONTestCase):
             with self.subTest(schema_version=schema_version):
                 measurement = await self.collect_json(schema_version)
                 self.assert_measurement(measurement, value="3", entities=self.expected_entities()[1:])
+
+    async def test_parse_in_worker_process(self):
+        """Test that big JSON files are parsed in a worker process, if so configured."""
+        with patch("base_collectors.parse_executor.ProcessPoolExecutor", ThreadPoolExecutor):
+            parse_executor = ParseExecutor(max_workers=1)
+        contents = json.dumps(self.vulnerabilities_json()).encode()
+        context = CollectionContext(parse_executor=parse_executor)
+        with patch.object(self, "collection_context", lambda session: dataclasses.replace(context, session=session)):
+            measurement = await self.collect_measurement(get_request_content=contents)
+        self.assert_measurement(measurement, value="4", entities=self.expected_entities())
+        self.assertEqual(1, parse_executor.statistics("TrivyJSONSecurityWarnings").offloaded)
+
+    async def collect_conditionally(self, *responses: AsyncMock) -> tuple[list, AsyncMock, ValidatorCache]:
+        """Collect the metric once per response, sharing a validator cache."""
+        validator_cache = ValidatorCache()
+        get = AsyncMock(side_effect=responses)
+        with patch("aiohttp.ClientSession.get", get):
+            async with aiohttp.ClientSession() as session:
+                context = CollectionContext(session, validator_cache=validator_cache)
+                measurements = [await MetricCollector(self.metric, context).collect() for _ in responses]
+        return measurements, get, validator_cache
+
+    def file_response(self, status: HTTPStatus = HTTPStatus.OK, headers: dict[str, str] | None = None) -> AsyncMock:
+        """Return a response with the Trivy JSON file."""
+        response = AsyncMock(status=status, headers=headers if headers is not None else {"ETag": '"1"'})
+        response.read.return_value = b"" if status == HTTPStatus.NOT_MODIFIED else b"{}"
+        response.json.return_value = self.vulnerabilities_json()
+        return response
+
+    async def test_reuse_measurement_if_not_modified(self):
+        """Test that the previous measurement is reused if the file is not modified."""
+        not_modified = self.file_response(HTTPStatus.NOT_MODIFIED)
+        measurements, get, validator_cache = await self.collect_conditionally(self.file_response(), not_modified)
+        self.assert_measurement(measurements[1], value="4", entities=self.expected_entities())
+        self.assertEqual({"If-None-Match": '"1"'}, get.call_args.kwargs["headers"])
+        not_modified.json.assert_not_called()
+        self.assertEqual(1, validator_cache.hits)
+        payload_hashes = [measurement.as_dict()["payload_hash"] for measurement in measurements]
+        self.assertEqual(payload_hashes[0], payload_hashes[1])
+
+    async def test_parse_if_modified(self):
+        """Test that the file is parsed again if it is modified."""
+        measurements, get, validator_cache = await self.collect_conditionally(
+            self.file_response(), self.file_response(headers={"ETag": '"2"'})
+        )
+        self.assert_measurement(measurements[1], value="4", entities=self.expected_entities())
+        self.assertEqual({"If-None-Match": '"1"'}, get.call_args.kwargs["headers"])
+        self.assertEqual(0, validator_cache.hits)
+
+    async def test_no_conditional_request_without_validators(self):
+        """Test that requests are unconditional if the file has no validators."""
+        _, get, _ = await self.collect_conditionally(self.file_response(headers={}), self.file_response())
+        self.assertEqual({}, get.call_args.kwargs["headers"])
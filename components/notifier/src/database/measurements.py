@@ -4,35 +4,79 @@ from typing import TYPE_CHECKING
 
 import pymongo
 
+from shared.database.measurements import LATEST_MEASUREMENT_ID, PREVIOUS_MEASUREMENT_ID
 from shared.model.measurement import Measurement
 
 if TYPE_CHECKING:
+    from bson import ObjectId
     from pymongo.database import Database
 
     from shared.model.metric import Metric
+    from shared.utils.type import MetricId
 
+# The notifier doesn't need the entities and issue status of measurements:
+PROJECTION = {"sources.entities": False, "sources.entity_user_data": False, "issue_status": False}
+SCALES = tuple(Measurement.SCALE_CLASSES)
 
-def get_recent_measurements(
-    database: Database,
-    metrics: list[Metric],
-    limit_per_metric: int = 2,
-) -> list[Measurement]:  # pragma: no feature-test-cover
-    """Return recent measurements for the specified metrics, without entities and issue status."""
-    projection = {
-        "_id": False,
-        "sources.entities": False,
-        "sources.entity_user_data": False,
-        "issue_status": False,
+
+def get_measurements_started_after(database: Database, min_iso_timestamp: str) -> list[dict]:
+    """Return the metric uuid, report uuid, start, and status per scale of the measurements started after the timestamp.
+
+    The measurements are sorted by start, oldest first.
+    """
+    projection = {"_id": False, "metric_uuid": True, "report_uuid": True, "start": True} | {
+        f"{scale}.status": True for scale in SCALES
     }
-    measurements: list = []
-    for metric in metrics:
-        measurement_data = list(
-            database["measurements"].find(
-                {"metric_uuid": metric.uuid},
-                limit=limit_per_metric,
-                sort=[("start", pymongo.DESCENDING)],
-                projection=projection,
-            ),
+    return list(
+        database.measurements.find(
+            {"start": {"$gt": min_iso_timestamp}}, projection=projection, sort=[("start", pymongo.ASCENDING)]
         )
-        measurements.extend([Measurement(metric, measurement) for measurement in measurement_data])
+    )
+
+
+def get_recent_measurements(database: Database, metrics: list[Metric]) -> list[Measurement]:
+    """Return the latest and the previous measurement of the metrics, without entities and issue status.
+
+    The ids of the latest and the previous measurement of each metric are stored in the latest measurements collection,
+    so the recent measurements of all metrics are retrieved with two queries instead of one query per metric. Metrics
+    without previous measurement id, because they have not been measured since the previous measurement ids were added
+    to the latest measurements collection, are looked up per metric.
+    """
+    recent_measurement_ids = get_recent_measurement_ids(database, [metric.uuid for metric in metrics])
+    measurement_filter = {"_id": {"$in": [id_ for ids in recent_measurement_ids.values() for id_ in ids]}}
+    measurements_by_id = {
+        measurement.pop("_id"): measurement
+        for measurement in database.measurements.find(measurement_filter, projection=PROJECTION)
+    }
+    measurements: list[Measurement] = []
+    for metric in metrics:
+        if (ids := recent_measurement_ids.get(metric.uuid)) is None:
+            measurements_data = get_recent_measurements_of_metric(database, metric.uuid)
+        else:
+            measurements_data = [measurements_by_id[id_] for id_ in ids if id_ in measurements_by_id]
+        measurements.extend(Measurement(metric, measurement_data) for measurement_data in measurements_data)
     return measurements
+
+
+def get_recent_measurement_ids(database: Database, metric_uuids: list[MetricId]) -> dict[MetricId, list[ObjectId]]:
+    """Return the ids of the latest and the previous measurement, if any, of the metrics that have both ids stored."""
+    recent_measurement_ids = {}
+    for ids in database.latest_measurements.find({"metric_uuid": {"$in": metric_uuids}}):
+        if LATEST_MEASUREMENT_ID in ids and PREVIOUS_MEASUREMENT_ID in ids:
+            recent_ids = [ids[LATEST_MEASUREMENT_ID], ids[PREVIOUS_MEASUREMENT_ID]]
+            recent_measurement_ids[ids["metric_uuid"]] = [id_ for id_ in recent_ids if id_ is not None]
+    return recent_measurement_ids
+
+
+def get_recent_measurements_of_metric(
+    database: Database, metric_uuid: MetricId, limit: int = 2
+) -> list[dict]:  # pragma: no feature-test-cover
+    """Return the most recent measurements of the metric, latest first, without entities and issue status."""
+    return list(
+        database.measurements.find(
+            {"metric_uuid": metric_uuid},
+            limit=limit,
+            sort=[("start", pymongo.DESCENDING)],
+            projection=PROJECTION | {"_id": False},
+        )
+    )
@@ -0,0 +1,33 @@
+"""Notification queue collection."""
+
+from typing import TYPE_CHECKING
+
+from shared.utils.functions import iso_timestamp
+
+if TYPE_CHECKING:
+    from bson import ObjectId
+    from pymongo.database import Database
+
+
+def enqueue_notification(database: Database, webhook: str, payload: dict) -> None:
+    """Add the notification to the queue, to be delivered as soon as possible."""
+    database.notification_queue.insert_one(
+        {"webhook": webhook, "payload": payload, "attempts": 0, "next_attempt": iso_timestamp()}
+    )
+
+
+def get_due_notifications(database: Database) -> list[dict]:
+    """Return the queued notifications that are due for (another) delivery attempt, oldest first."""
+    return list(database.notification_queue.find({"next_attempt": {"$lte": iso_timestamp()}}, sort=[("_id", 1)]))
+
+
+def remove_notification(database: Database, notification_id: ObjectId) -> None:
+    """Remove the notification from the queue."""
+    database.notification_queue.delete_one({"_id": notification_id})
+
+
+def reschedule_notification(database: Database, notification_id: ObjectId, attempts: int, next_attempt: str) -> None:
+    """Record the failed delivery attempts of the notification and when to try delivering it again."""
+    database.notification_queue.update_one(
+        {"_id": notification_id}, {"$set": {"attempts": attempts, "next_attempt": next_attempt}}
+    )
@@ -8,15 +8,31 @@ from shared.model.report import Report, get_metrics_from_reports
 from .measurements import get_recent_measurements
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from pymongo.database import Database
 
     from shared.model.measurement import Measurement
     from shared.model.metric import Metric
-    from shared.utils.type import MetricId
+    from shared.utils.type import MetricId, ReportId
+
 
+def get_reports_and_measurements(
+    database: Database,
+    metric_uuids: Collection[MetricId] | None = None,
+    report_uuids: Collection[ReportId] | None = None,
+) -> tuple[list[Report], list[Measurement]]:
+    """Get the reports and the recent measurements of the metrics, or of all metrics if no metric uuids are given.
 
-def get_reports_and_measurements(database: Database) -> tuple[list[Report], list[Measurement]]:
-    """Get the reports and measurements from the database."""
-    reports: list[Report] = get_reports(database)
+    If report uuids are given, only the reports with those uuids are retrieved, unless the reports don't contain all
+    metrics. This happens when the report uuids are not up to date, for example because a metric was moved to another
+    report. In that case all reports are retrieved.
+    """
+    reports: list[Report] = get_reports(database, report_uuids=report_uuids)
     metrics: dict[MetricId, Metric] = get_metrics_from_reports(reports)
+    if report_uuids is not None and not all(metric_uuid in metrics for metric_uuid in metric_uuids or []):
+        reports = get_reports(database)
+        metrics = get_metrics_from_reports(reports)
+    if metric_uuids is not None:
+        metrics = {metric_uuid: metric for metric_uuid, metric in metrics.items() if metric_uuid in metric_uuids}
     return reports, get_recent_measurements(database, list(metrics.values()))
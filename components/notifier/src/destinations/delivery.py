@@ -0,0 +1,76 @@
+"""Deliver notifications to webhooks."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from dateutil.tz import tzutc
+
+from database.notification_queue import get_due_notifications, remove_notification, reschedule_notification
+from notifier_utilities.log import get_logger
+
+if TYPE_CHECKING:
+    import aiohttp
+    from pymongo.database import Database
+
+
+class NotificationDelivery:
+    """Deliver the queued notifications to their webhooks concurrently, in the background.
+
+    Notifications are queued in the database, so notifications that could not be delivered yet survive restarts of
+    the notifier. Deliveries to the same host are limited to prevent the host from throttling the notifier. Failed
+    deliveries are retried with exponential backoff, until the maximum number of attempts has been made.
+    """
+
+    MAX_ATTEMPTS = 10
+    INITIAL_RETRY_DELAY = timedelta(minutes=1)
+    MAX_RETRY_DELAY = timedelta(hours=6)
+
+    def __init__(self, database: Database, max_requests_per_host: int = 5) -> None:
+        """Initialize the delivery."""
+        self.__database = database
+        self.__max_requests_per_host = max_requests_per_host
+        self.__semaphores: dict[str, asyncio.Semaphore] = {}
+        self.__task: asyncio.Task | None = None
+
+    def deliver(self, session: aiohttp.ClientSession) -> None:
+        """Start delivering the due notifications in the background, unless the previous delivery is still running."""
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.deliver_due_notifications(session))
+
+    async def deliver_due_notifications(self, session: aiohttp.ClientSession) -> None:
+        """Deliver the notifications that are due concurrently."""
+        try:
+            notifications = get_due_notifications(self.__database)
+            await asyncio.gather(*(self.__deliver(session, notification) for notification in notifications))
+        except Exception:  # noqa: BLE001
+            # The delivery runs in the background, so log the exception as nobody awaits the result of the delivery:
+            get_logger().exception("Delivering notifications failed")
+
+    async def __deliver(self, session: aiohttp.ClientSession, notification: dict) -> None:
+        """Deliver the notification, or reschedule it if the delivery fails."""
+        webhook, host = notification["webhook"], urlparse(notification["webhook"]).netloc
+        if (semaphore := self.__semaphores.get(host)) is None:
+            semaphore = self.__semaphores[host] = asyncio.Semaphore(self.__max_requests_per_host)
+        try:
+            async with semaphore, session.post(webhook, json=notification["payload"]) as response:
+                response.raise_for_status()
+        except Exception as reason:  # noqa: BLE001
+            self.__reschedule(notification, host, reason)
+        else:
+            get_logger().info("Delivered notification to %s", host)
+            remove_notification(self.__database, notification["_id"])
+
+    def __reschedule(self, notification: dict, host: str, reason: Exception) -> None:
+        """Reschedule the notification with exponential backoff, or drop it if the maximum attempts have been made."""
+        attempts = notification["attempts"] + 1
+        logger = get_logger()
+        if attempts >= self.MAX_ATTEMPTS:
+            logger.error("Could not deliver notification to %s after %d attempts: %s", host, attempts, reason)
+            remove_notification(self.__database, notification["_id"])
+            return
+        delay = min(self.INITIAL_RETRY_DELAY * 2 ** (attempts - 1), self.MAX_RETRY_DELAY)
+        next_attempt = (datetime.now(tz=tzutc()) + delay).isoformat()
+        logger.warning("Could not deliver notification to %s, retrying at %s: %s", host, next_attempt, reason)
+        reschedule_notification(self.__database, notification["_id"], attempts, next_attempt)
@@ -4,8 +4,6 @@ from typing import TYPE_CHECKING
 
 import pymsteams
 
-from notifier_utilities.log import get_logger
-
 if TYPE_CHECKING:
     from models.notification import MetricNotificationData, Notification
 
@@ -49,14 +47,3 @@ def create_connector_card(destination: str, notification: Notification) -> pymst
     for metric in sorted(notification.metrics, key=lambda metric: metric.metric_name):
         card.addSection(metric_section(metric, notification.report_url))
     return card
-
-
-def send_notification(destination: str, notification: Notification) -> None:
-    """Send notification to Microsoft Teams using a Webhook."""
-    logger = get_logger()
-    logger.info("Sending notification to configured teams webhook")
-    card = create_connector_card(destination, notification)
-    try:
-        card.send()
-    except Exception:
-        logger.exception("Could not deliver notification")
@@ -0,0 +1,69 @@
+"""Cache of the status of the latest measurement of metrics."""
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from shared.utils.functions import iso_timestamp
+
+from database.measurements import SCALES, get_measurements_started_after
+
+if TYPE_CHECKING:
+    from pymongo.database import Database
+
+    from shared.utils.type import MetricId, ReportId
+
+
+class MetricStatusCache:
+    """Remember the status per scale of the latest measurement of metrics to find the metrics whose status changed.
+
+    Rather than retrieving the recent measurements of all metrics every time the notifier wakes up, the cache keeps a
+    watermark: the start of the most recent measurement seen. Only measurements that started after the watermark are
+    retrieved, and only metrics whose new measurement has another status than the cached status, or whose status is
+    not cached yet, may have changed status. The notifier only evaluates those metrics. The notifier commits the new
+    statuses and watermark after it has queued the notifications, so metrics are evaluated again if that fails.
+    """
+
+    # Measurements are inserted shortly after their start is determined. Look back a bit further than the watermark to
+    # not miss measurements that were inserted later than measurements with a more recent start. The cached statuses
+    # prevent measurements that were seen before from being reported as status changes again:
+    LOOK_BACK = timedelta(seconds=60)
+
+    def __init__(self, database: Database) -> None:
+        """Initialize the cache with the current time as watermark."""
+        self.__database = database
+        self.__started = self.__watermark = iso_timestamp()  # Ignore measurements from before the notifier started
+        self.__statuses: dict[MetricId, dict[str, str | None]] = {}
+        self.__new_statuses: dict[MetricId, dict[str, str | None]] = {}
+        self.__new_watermark = self.__watermark
+        self.changed_after = datetime.fromisoformat(self.__started)
+        self.changed_report_uuids: set[ReportId] = set()
+
+    def changed_metric_uuids(self) -> set[MetricId]:
+        """Return the uuids of the metrics that have new measurements with another status than the cached status.
+
+        Also set the changed_after attribute to the timestamp after which the new measurements started, and the
+        changed_report_uuids attribute to the uuids of the reports of the new measurements of the changed metrics. The
+        new statuses and watermark are only remembered after calling commit().
+        """
+        look_back = (datetime.fromisoformat(self.__watermark) - self.LOOK_BACK).isoformat()
+        changed_after = max(self.__started, look_back)
+        changed_metric_uuids, changed_report_uuids = set(), set()
+        self.__new_statuses, self.__new_watermark = {}, self.__watermark
+        for measurement in get_measurements_started_after(self.__database, changed_after):
+            metric_uuid = measurement["metric_uuid"]
+            statuses = {scale: measurement[scale].get("status") for scale in SCALES if scale in measurement}
+            if self.__new_statuses.get(metric_uuid, self.__statuses.get(metric_uuid)) != statuses:
+                changed_metric_uuids.add(metric_uuid)
+                if report_uuid := measurement.get("report_uuid"):
+                    changed_report_uuids.add(report_uuid)
+                self.__new_statuses[metric_uuid] = statuses
+            self.__new_watermark = max(self.__new_watermark, measurement["start"])
+        self.changed_after = datetime.fromisoformat(changed_after)
+        self.changed_report_uuids = changed_report_uuids
+        return changed_metric_uuids
+
+    def commit(self) -> None:
+        """Remember the new statuses and watermark found by the last call of changed_metric_uuids()."""
+        self.__statuses.update(self.__new_statuses)
+        self.__watermark = self.__new_watermark
+        self.__new_statuses = {}
@@ -3,16 +3,18 @@
 import asyncio
 import pathlib
 import tempfile
-from datetime import datetime
 from os import getenv
 from typing import TYPE_CHECKING, NoReturn
 
-from dateutil.tz import tzutc
+import aiohttp
 
 from shared.utils.functions import iso_timestamp
 
+from database.notification_queue import enqueue_notification
 from database.reports import get_reports_and_measurements
-from destinations.ms_teams import send_notification
+from destinations.delivery import NotificationDelivery
+from destinations.ms_teams import create_connector_card
+from notifier.metric_status_cache import MetricStatusCache
 from notifier_utilities.log import get_logger
 from strategies.notification_strategy import NotificationFinder
 
@@ -20,28 +22,41 @@ if TYPE_CHECKING:
     from pymongo.database import Database
 
     from shared.model.measurement import Measurement
+    from shared.model.report import Report
+
+DELIVERY_TIMEOUT = 30  # Seconds
 
 
 async def notify(database: Database, sleep_duration: int = 60) -> NoReturn:
     """Notify our users periodically of the number of red metrics."""
     logger = get_logger()
-    most_recent_measurement_seen = datetime.max.replace(tzinfo=tzutc())
+    metric_status_cache = MetricStatusCache(database)
     notification_finder = NotificationFinder()
-    while True:
-        record_health()
-        logger.info("Determining notifications...")
-        try:
-            reports, measurements = get_reports_and_measurements(database)
-        except Exception:
-            logger.exception("Getting reports and measurements failed")
-            reports = []
-            measurements = []
-
-        for notification in notification_finder.get_notifications(reports, measurements, most_recent_measurement_seen):
-            send_notification(str(notification.destination["webhook"]), notification)
-        most_recent_measurement_seen = most_recent_measurement_timestamp(measurements)
-        logger.info("Sleeping %.1f seconds...", sleep_duration)
-        await asyncio.sleep(sleep_duration)
+    notification_delivery = NotificationDelivery(database)
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DELIVERY_TIMEOUT)) as session:
+        while True:
+            record_health()
+            logger.info("Determining notifications...")
+            reports: list[Report] = []
+            measurements: list[Measurement] = []
+            try:
+                if changed_metric_uuids := metric_status_cache.changed_metric_uuids():
+                    changed_report_uuids = metric_status_cache.changed_report_uuids
+                    reports, measurements = get_reports_and_measurements(
+                        database, changed_metric_uuids, changed_report_uuids
+                    )
+            except Exception:
+                # Don't commit the statuses, so the changed metrics are evaluated again the next time
+                logger.exception("Getting reports and measurements failed")
+            else:
+                changed_after = metric_status_cache.changed_after
+                for notification in notification_finder.get_notifications(reports, measurements, changed_after):
+                    webhook = str(notification.destination["webhook"])
+                    enqueue_notification(database, webhook, create_connector_card(webhook, notification).payload)
+                metric_status_cache.commit()
+            notification_delivery.deliver(session)
+            logger.info("Sleeping %.1f seconds...", sleep_duration)
+            await asyncio.sleep(sleep_duration)
 
 
 def record_health() -> None:
@@ -53,11 +68,3 @@ def record_health() -> None:
             health_check.write(iso_timestamp())
     except OSError:
         logger.exception("Could not write health check time stamp to %s", filepath)
-
-
-def most_recent_measurement_timestamp(measurements: list[Measurement]) -> datetime:
-    """Return the most recent measurement timestamp."""
-    most_recent = datetime.min.replace(tzinfo=tzutc())
-    for measurement in measurements:
-        most_recent = max(most_recent, datetime.fromisoformat(measurement["end"]))
-    return most_recent
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from shared.model.measurement import Measurement
     from shared.model.metric import Metric
     from shared.model.report import Report
+    from shared.utils.type import MetricId
 
 
 class NotificationFinder:
@@ -22,13 +23,13 @@ class NotificationFinder:
         most_recent_measurement_seen: datetime,
     ) -> list[Notification]:
         """Return the reports that have a webhook and metrics that require notifying."""
-        measurements.sort(key=lambda measurement: str(measurement["end"]))  # Sort ascending by end timestamp
+        measurements_by_metric = self.group_measurements_by_metric(measurements)
         notifications = []
         for report in reports:
             notable_metrics = []
             for subject in report["subjects"].values():
                 for metric_uuid, metric in subject["metrics"].items():
-                    metric_measurements = [m for m in measurements if m["metric_uuid"] == metric_uuid]
+                    metric_measurements = measurements_by_metric.get(metric_uuid, [])
                     if self.status_changed(metric, metric_measurements, most_recent_measurement_seen):
                         notification_data = MetricNotificationData(metric, metric_uuid, metric_measurements, subject)
                         notable_metrics.append(notification_data)
@@ -43,6 +44,14 @@ class NotificationFinder:
                 )
         return notifications
 
+    @staticmethod
+    def group_measurements_by_metric(measurements: list[Measurement]) -> dict[MetricId, list[Measurement]]:
+        """Return the measurements grouped by metric uuid, each group sorted ascending by end timestamp."""
+        measurements_by_metric: dict[MetricId, list[Measurement]] = {}
+        for measurement in sorted(measurements, key=lambda measurement: str(measurement["end"])):
+            measurements_by_metric.setdefault(measurement["metric_uuid"], []).append(measurement)
+        return measurements_by_metric
+
     @staticmethod
     def status_changed(metric: Metric, measurements: list[Measurement], most_recent_measurement_seen: datetime) -> bool:
         """Determine if a metric got a new status after the given timestamp."""
@@ -0,0 +1,94 @@
+"""Benchmark finding the notifications for a growing number of metrics.
+
+The benchmark creates synthetic reports and measurements in memory and times how long the notification finder needs
+to find the metrics whose status changed, for an increasing number of metrics. Finding the notifications should take
+time linear in the number of metrics and measurements. The benchmark fails if the time per metric for the largest
+number of metrics is more than the tolerance times the time per metric for the smallest number of metrics.
+
+The benchmark does not need a database. Run it from the notifier folder, for example:
+
+    PYTHONPATH=src python -m tests.benchmarks.notification_finder --metrics 1000 --doublings 5
+"""
+
+import argparse
+import sys
+import time
+from datetime import UTC, datetime
+
+from shared.model.measurement import Measurement
+from shared.model.report import Report
+
+from strategies.notification_strategy import NotificationFinder
+
+METRICS_PER_SUBJECT = 50
+SUBJECTS_PER_REPORT = 10
+OLD_TIMESTAMP = "2020-01-01T00:00:00+00:00"
+NEW_TIMESTAMP = "2020-01-02T00:00:00+00:00"
+
+
+def create_reports(nr_metrics: int) -> list[Report]:
+    """Create reports with the number of metrics."""
+    metrics_per_report = METRICS_PER_SUBJECT * SUBJECTS_PER_REPORT
+    destination = {"name": "destination", "report_url": "https://report", "webhook": "https://webhook"}
+    reports = []
+    for first_metric in range(0, nr_metrics, metrics_per_report):
+        subjects: dict[str, dict] = {}
+        for metric_index in range(first_metric, min(first_metric + metrics_per_report, nr_metrics)):
+            subject = subjects.setdefault(f"subject-{metric_index // METRICS_PER_SUBJECT}", {"type": "software"})
+            subject.setdefault("metrics", {})[f"metric-{metric_index}"] = {"type": "tests", "scale": "count"}
+        report_data = {"report_uuid": f"report-{first_metric}", "subjects": subjects}
+        reports.append(Report({}, report_data | {"notification_destinations": {"destination": destination}}))
+    return reports
+
+
+def create_measurements(reports: list[Report]) -> list[Measurement]:
+    """Create two measurements per metric. The status of one in ten metrics changed."""
+    measurements = []
+    for report in reports:
+        for index, metric in enumerate(report.metrics):
+            new_status = "target_not_met" if index % 10 == 0 else "target_met"
+            for start, status in ((OLD_TIMESTAMP, "target_met"), (NEW_TIMESTAMP, new_status)):
+                measurement = {"metric_uuid": metric.uuid, "start": start, "end": start, "count": {"status": status}}
+                measurements.append(Measurement(metric, measurement))
+    return measurements
+
+
+def duration(nr_metrics: int, repeat: int) -> float:
+    """Return the best duration of finding the notifications for the number of metrics."""
+    reports = create_reports(nr_metrics)
+    measurements = create_measurements(reports)
+    most_recent_measurement_seen = datetime(2020, 1, 1, 12, tzinfo=UTC)
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        NotificationFinder().get_notifications(reports, measurements, most_recent_measurement_seen)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def benchmark(nr_metrics: int, doublings: int, repeat: int, tolerance: float) -> bool:
+    """Time finding the notifications for a doubling number of metrics. Return whether the time scaled linearly."""
+    print(f"{'Metrics':>9}{'Duration (s)':>14}{'Per metric (µs)':>17}")  # noqa: T201
+    durations_per_metric = []
+    for doubling in range(doublings + 1):
+        metrics = nr_metrics * 2**doubling
+        seconds = duration(metrics, repeat)
+        durations_per_metric.append(seconds / metrics)
+        print(f"{metrics:>9}{seconds:>14.3f}{1_000_000 * seconds / metrics:>17.1f}")  # noqa: T201
+    return durations_per_metric[-1] <= tolerance * durations_per_metric[0]
+
+
+def main() -> None:
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--metrics", type=int, default=1000, help="initial number of metrics (default: %(default)s)")
+    parser.add_argument("--doublings", type=int, default=5, help="times to double the metrics (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per measurement (default: %(default)s)")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="allowed growth per metric (default: %(default)s)")
+    args = parser.parse_args()
+    if not benchmark(args.metrics, args.doublings, args.repeat, args.tolerance):
+        sys.exit("The time needed to find the notifications grows faster than linearly with the number of metrics")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark retrieving the recent measurements of all metrics, as the notifier does every time it wakes up.
+
+The benchmark fills a separate database with a synthetic measurement history and compares the time needed to
+retrieve the latest and previous measurement of each metric via the latest measurements collection with the time
+needed to retrieve them with one query per metric, which the notifier did before.
+
+The benchmark needs a running MongoDB, configured with the usual DATABASE_* environment variables. Run it from the
+notifier folder, for example:
+
+    PYTHONPATH=src python -m tests.benchmarks.recent_measurements --metrics 10000 --measurements 50
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, cast
+
+import pymongo
+from bson import ObjectId
+
+from shared.database.measurements import LATEST_MEASUREMENT_ID, PREVIOUS_MEASUREMENT_ID
+from shared.initialization.database import get_database, mongo_client
+from shared.model.metric import Metric
+from shared_data_model.snapshot import data_model_snapshot
+
+from database.measurements import get_recent_measurements, get_recent_measurements_of_metric
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pymongo.database import Database
+
+    from shared.utils.type import MetricId
+
+BENCHMARK_DATABASE = "quality_time_benchmark"
+START = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+def metric_uuid(metric_index: int) -> MetricId:
+    """Return the uuid of the metric."""
+    return cast("MetricId", f"metric-{metric_index}")
+
+
+def fill_database(database: Database, nr_metrics: int, nr_measurements: int, batch_size: int = 10_000) -> None:
+    """Fill the database with the measurements and the latest measurements ids of the metrics."""
+    database.measurements.drop()
+    database.latest_measurements.drop()
+    database.measurements.create_index([("metric_uuid", pymongo.ASCENDING), ("start", pymongo.DESCENDING)])
+    database.latest_measurements.create_index("metric_uuid", unique=True)
+    batch, latest_measurement_ids = [], []
+    for metric_index in range(nr_metrics):
+        measurement_ids = [ObjectId() for _ in range(nr_measurements)]
+        for measurement_index, measurement_id in enumerate(measurement_ids):
+            start = (START + timedelta(hours=measurement_index)).isoformat()
+            batch.append(
+                {
+                    "_id": measurement_id,
+                    "metric_uuid": metric_uuid(metric_index),
+                    "start": start,
+                    "end": start,
+                    "sources": [{"source_uuid": "source", "value": "1", "entities": [{"key": "entity"}] * 10}],
+                    "count": {"status": "target_met", "value": "1"},
+                }
+            )
+            if len(batch) >= batch_size:
+                database.measurements.insert_many(batch)
+                batch = []
+        latest_measurement_ids.append(
+            {
+                "metric_uuid": metric_uuid(metric_index),
+                LATEST_MEASUREMENT_ID: measurement_ids[-1],
+                PREVIOUS_MEASUREMENT_ID: measurement_ids[-2] if nr_measurements > 1 else None,
+            }
+        )
+    if batch:
+        database.measurements.insert_many(batch)
+    database.latest_measurements.insert_many(latest_measurement_ids)
+
+
+def get_recent_measurements_per_metric(database: Database, metrics: list[Metric]) -> list[dict]:
+    """Return the recent measurements with one query per metric."""
+    return [
+        measurement for metric in metrics for measurement in get_recent_measurements_of_metric(database, metric.uuid)
+    ]
+
+
+def duration(function: Callable[[], list], repeat: int) -> tuple[float, int]:
+    """Return the best duration of calling the function and the number of measurements it returned."""
+    durations = []
+    nr_measurements = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nr_measurements = len(function())
+        durations.append(time.perf_counter() - start)
+    return min(durations), nr_measurements
+
+
+def benchmark(database: Database, nr_metrics: int, repeat: int) -> None:
+    """Time retrieving the recent measurements of all metrics."""
+    data_model = data_model_snapshot()
+    metrics = [Metric(data_model, {"type": "violations"}, metric_uuid(index)) for index in range(nr_metrics)]
+    batched, found = duration(lambda: get_recent_measurements(database, metrics), repeat)
+    per_metric, _ = duration(lambda: get_recent_measurements_per_metric(database, metrics), repeat)
+    print(f"{'Metrics':>9}{'Batched (s)':>13}{'Per metric (s)':>16}{'Measurements':>14}")  # noqa: T201
+    print(f"{nr_metrics:>9}{batched:>13.3f}{per_metric:>16.3f}{found:>14}")  # noqa: T201
+
+
+def main() -> None:
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--metrics", type=int, default=10_000, help="number of metrics (default: %(default)s)")
+    parser.add_argument("--measurements", type=int, default=50, help="measurements per metric (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per measurement (default: %(default)s)")
+    parser.add_argument("--skip-fill", action="store_true", help="reuse the database of a previous run")
+    args = parser.parse_args()
+    with mongo_client() as client:
+        database = get_database(client, BENCHMARK_DATABASE)
+        if not args.skip_fill:
+            fill_database(database, args.metrics, args.measurements)
+        benchmark(database, args.metrics, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
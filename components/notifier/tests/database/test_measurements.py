@@ -10,7 +10,7 @@ from dateutil.tz import tzutc
 from shared.database.reports import get_reports
 from shared.utils.functions import iso_timestamp
 
-from database.measurements import get_recent_measurements
+from database.measurements import get_measurements_started_after, get_recent_measurements
 
 from shared_test_code.fixtures import METRIC_ID
 
@@ -87,10 +87,41 @@ class MeasurementsTest(unittest.TestCase):
 
         self.database["measurements"].insert_many(measurements)
 
-        measurements = get_recent_measurements(self.database, metrics, limit_per_metric=2)
+        measurements = get_recent_measurements(self.database, metrics)
 
         self.assertEqual(len(measurements), 2)
         self.assertEqual(measurements[0]["metric_uuid"], METRIC_ID)
         self.assertEqual(measurements[0]["count"]["value"], "100")
         self.assertEqual(measurements[1]["metric_uuid"], METRIC_ID)
         self.assertEqual(measurements[1]["count"]["value"], "30")
+
+    def test_get_recent_measurements_via_latest_measurements(self):
+        """Test that the recent measurements are retrieved via the latest measurements collection."""
+        self.database["reports"].insert_one(create_report_data())
+        metrics = [metric for report in get_reports(self.database) for metric in report.metrics]
+        self.database["measurements"].insert_many(self.measurements)
+        self.database["latest_measurements"].insert_one(
+            {"metric_uuid": METRIC_ID, "latest_measurement_id": 2, "previous_measurement_id": 1}
+        )
+        measurements = get_recent_measurements(self.database, metrics)
+        self.assertEqual(["3", "0"], [measurement["start"] for measurement in measurements])
+        self.assertNotIn("_id", measurements[0])
+
+    def test_get_recent_measurements_without_previous_measurement(self):
+        """Test that the latest measurement is returned if the metric has no previous measurement."""
+        self.database["reports"].insert_one(create_report_data())
+        metrics = [metric for report in get_reports(self.database) for metric in report.metrics]
+        self.database["measurements"].insert_many(self.measurements)
+        self.database["latest_measurements"].insert_one(
+            {"metric_uuid": METRIC_ID, "latest_measurement_id": 1, "previous_measurement_id": None}
+        )
+        measurements = get_recent_measurements(self.database, metrics)
+        self.assertEqual(["0"], [measurement["start"] for measurement in measurements])
+
+    def test_get_measurements_started_after(self):
+        """Test that the measurements that started after the timestamp are returned, oldest first."""
+        self.database["measurements"].insert_many(self.measurements[::-1])
+        measurements = get_measurements_started_after(self.database, "2")
+        self.assertEqual(
+            [{"metric_uuid": METRIC_ID, "start": "3"}, {"metric_uuid": METRIC_ID, "start": "6"}], measurements
+        )
@@ -0,0 +1,42 @@
+"""Unit tests for the notification queue collection."""
+
+import unittest
+from datetime import datetime, timedelta
+
+import mongomock
+from dateutil.tz import tzutc
+
+from database.notification_queue import (
+    enqueue_notification,
+    get_due_notifications,
+    remove_notification,
+    reschedule_notification,
+)
+
+
+class NotificationQueueTest(unittest.TestCase):
+    """Unit tests for the notification queue."""
+
+    def setUp(self) -> None:
+        """Override to create the database and queue a notification."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+        enqueue_notification(self.database, "https://webhook", {"title": "Notification"})
+
+    def test_enqueued_notification_is_due(self):
+        """Test that a queued notification is due immediately."""
+        notifications = get_due_notifications(self.database)
+        self.assertEqual(["https://webhook"], [notification["webhook"] for notification in notifications])
+        self.assertEqual(0, notifications[0]["attempts"])
+
+    def test_remove_notification(self):
+        """Test that a notification can be removed from the queue."""
+        remove_notification(self.database, get_due_notifications(self.database)[0]["_id"])
+        self.assertEqual([], get_due_notifications(self.database))
+
+    def test_reschedule_notification(self):
+        """Test that a rescheduled notification is not due until the next attempt."""
+        notification_id = get_due_notifications(self.database)[0]["_id"]
+        next_attempt = (datetime.now(tz=tzutc()) + timedelta(minutes=1)).isoformat()
+        reschedule_notification(self.database, notification_id, 1, next_attempt)
+        self.assertEqual([], get_due_notifications(self.database))
+        self.assertEqual(1, self.database.notification_queue.find_one({"_id": notification_id})["attempts"])
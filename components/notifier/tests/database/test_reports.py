@@ -7,7 +7,7 @@ import mongomock
 
 from database.reports import get_reports_and_measurements
 
-from shared_test_code.fixtures import METRIC_ID
+from shared_test_code.fixtures import METRIC_ID, REPORT_ID
 
 from tests.fixtures import create_report_data
 
@@ -35,3 +35,27 @@ class ReportsTest(unittest.TestCase):
         reports, measurements = get_reports_and_measurements(self.database)
         self.assertEqual(report_data["report_uuid"], reports[0]["report_uuid"])
         self.assertEqual(2, len(measurements))
+
+    def test_get_reports_and_measurements_of_metrics(self):
+        """Test that only the measurements of the specified metrics are returned."""
+        self.database["reports"].insert_one(create_report_data())
+        self.database["measurements"].insert_many(self.measurements)
+        reports, measurements = get_reports_and_measurements(self.database, set())
+        self.assertEqual(1, len(reports))
+        self.assertEqual([], measurements)
+
+    def test_get_reports_and_measurements_of_reports(self):
+        """Test that only the reports with the specified uuids are returned."""
+        self.database["reports"].insert_many([create_report_data(), create_report_data() | {"report_uuid": "other"}])
+        self.database["measurements"].insert_many(self.measurements)
+        reports, measurements = get_reports_and_measurements(self.database, {METRIC_ID}, {REPORT_ID})
+        self.assertEqual([REPORT_ID], [report.uuid for report in reports])
+        self.assertEqual(2, len(measurements))
+
+    def test_get_reports_and_measurements_of_moved_metrics(self):
+        """Test that all reports are returned if the reports with the specified uuids don't contain the metrics."""
+        self.database["reports"].insert_one(create_report_data())
+        self.database["measurements"].insert_many(self.measurements)
+        reports, measurements = get_reports_and_measurements(self.database, {METRIC_ID}, {"other"})
+        self.assertEqual([REPORT_ID], [report.uuid for report in reports])
+        self.assertEqual(2, len(measurements))
@@ -0,0 +1,102 @@
+"""Unit tests for the delivery of notifications."""
+
+import asyncio
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import aiohttp
+import mongomock
+from dateutil.tz import tzutc
+
+from database.notification_queue import enqueue_notification
+from destinations.delivery import NotificationDelivery
+
+from shared_test_code import disable_logging
+
+
+class NotificationDeliveryTest(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the notification delivery."""
+
+    def setUp(self) -> None:
+        """Override to create the database, queue a notification, and create the delivery."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+        enqueue_notification(self.database, "https://webhook/1", {"title": "Notification"})
+        self.delivery = NotificationDelivery(self.database)
+        self.response = Mock()
+
+    def session(self, side_effect: type[Exception] | None = None) -> Mock:
+        """Return a fake session."""
+        context_manager = MagicMock()
+        context_manager.__aenter__ = AsyncMock(return_value=self.response, side_effect=side_effect)
+        context_manager.__aexit__ = AsyncMock(return_value=False)
+        return Mock(post=Mock(return_value=context_manager))
+
+    def queued_notification(self) -> dict | None:
+        """Return the queued notification."""
+        return self.database.notification_queue.find_one()
+
+    async def test_deliver(self):
+        """Test that a delivered notification is removed from the queue."""
+        session = self.session()
+        await self.delivery.deliver_due_notifications(session)
+        session.post.assert_called_once_with("https://webhook/1", json={"title": "Notification"})
+        self.assertIsNone(self.queued_notification())
+
+    async def test_deliver_concurrently(self):
+        """Test that multiple notifications are delivered."""
+        enqueue_notification(self.database, "https://webhook/2", {"title": "Notification"})
+        session = self.session()
+        await self.delivery.deliver_due_notifications(session)
+        self.assertEqual(2, session.post.call_count)
+        self.assertIsNone(self.queued_notification())
+
+    async def test_deliver_in_background(self):
+        """Test that the delivery runs in the background and only once at a time."""
+        session = self.session()
+        self.delivery.deliver(session)
+        self.delivery.deliver(session)
+        await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+        session.post.assert_called_once()
+
+    @patch("destinations.delivery.get_logger")
+    async def test_log_failing_delivery_in_background(self, get_logger: Mock):
+        """Test that an exception raised by the delivery in the background is logged."""
+        with patch("destinations.delivery.get_due_notifications", Mock(side_effect=RuntimeError)):
+            self.delivery.deliver(self.session())
+            await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+        get_logger.return_value.exception.assert_called_once_with("Delivering notifications failed")
+
+    async def test_create_one_semaphore_per_host(self):
+        """Test that the deliveries to the same host share one semaphore."""
+        enqueue_notification(self.database, "https://webhook/2", {"title": "Notification"})
+        with patch("asyncio.Semaphore", Mock(wraps=asyncio.Semaphore)) as semaphore:
+            await self.delivery.deliver_due_notifications(self.session())
+        semaphore.assert_called_once_with(5)
+
+    @disable_logging
+    async def test_retry_failed_delivery(self):
+        """Test that a failed delivery is retried later."""
+        await self.delivery.deliver_due_notifications(self.session(aiohttp.ClientError))
+        notification = self.queued_notification()
+        self.assertEqual(1, notification["attempts"])
+        self.assertGreater(datetime.fromisoformat(notification["next_attempt"]), datetime.now(tz=tzutc()))
+
+    @disable_logging
+    async def test_retry_failed_delivery_with_exponential_backoff(self):
+        """Test that the delay between retries doubles with each attempt."""
+        self.database.notification_queue.update_one({}, {"$set": {"attempts": 3}})
+        with patch.object(NotificationDelivery, "MAX_RETRY_DELAY", NotificationDelivery.INITIAL_RETRY_DELAY * 2):
+            await self.delivery.deliver_due_notifications(self.session(aiohttp.ClientError))
+        next_attempt = datetime.fromisoformat(self.queued_notification()["next_attempt"])
+        delay = next_attempt - datetime.now(tz=tzutc())
+        self.assertLessEqual(delay, NotificationDelivery.INITIAL_RETRY_DELAY * 2)
+        self.assertGreater(delay, NotificationDelivery.INITIAL_RETRY_DELAY)
+
+    @disable_logging
+    async def test_drop_notification_after_max_attempts(self):
+        """Test that a notification is dropped after the maximum number of delivery attempts."""
+        self.database.notification_queue.update_one({}, {"$set": {"attempts": NotificationDelivery.MAX_ATTEMPTS - 1}})
+        self.response.raise_for_status.side_effect = aiohttp.ClientError
+        await self.delivery.deliver_due_notifications(self.session())
+        self.assertIsNone(self.queued_notification())
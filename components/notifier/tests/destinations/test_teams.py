@@ -1,7 +1,7 @@
 """Unit tests for the Teams notification destination."""
 
 from typing import TYPE_CHECKING
-from unittest import TestCase, mock
+from unittest import TestCase
 
 from pymsteams import cardsection, connectorcard
 
@@ -10,11 +10,10 @@ from shared.model.metric import Metric
 from shared.model.report import Report
 from shared.model.subject import Subject
 
-from destinations.ms_teams import ICON_URL, create_connector_card, send_notification
+from destinations.ms_teams import ICON_URL, create_connector_card
 from models.metric_notification_data import MetricNotificationData
 from models.notification import Notification
 
-from shared_test_code import disable_logging
 from shared_test_code.fixtures import METRIC_ID, METRIC_ID2, SUBJECT_ID
 
 if TYPE_CHECKING:
@@ -53,23 +52,6 @@ class MsTeamsTestCase(TestCase):
         )
 
 
-@mock.patch("pymsteams.connectorcard.send")
-class SendNotificationToTeamsTests(MsTeamsTestCase):
-    """Unit tests for the Teams destination for notifications."""
-
-    @disable_logging
-    def test_invalid_webhook(self, mock_send: mock.Mock):
-        """Test that exceptions are caught."""
-        mock_send.side_effect = OSError("Some error")
-        send_notification("invalid_webhook", self.notification)
-        mock_send.assert_called()
-
-    def test_valid_webhook(self, mock_send: mock.Mock):
-        """Test that a valid message is sent to a valid webhook."""
-        send_notification("valid_webhook", self.notification)
-        mock_send.assert_called()
-
-
 class BuildNotificationMessageTests(MsTeamsTestCase):
     """Unit tests for the message builder."""
 
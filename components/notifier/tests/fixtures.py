@@ -10,9 +10,12 @@ def create_report_data(deleted: bool = False) -> dict:
         "title": "Title",
         "subjects": {
             SUBJECT_ID: {
+                "type": "software",
                 "metrics": {
                     METRIC_ID: {
                         "name": "Metric",
+                        "type": "tests",
+                        "scale": "count",
                     },
                 },
             },
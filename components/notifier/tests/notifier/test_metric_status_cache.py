@@ -0,0 +1,96 @@
+"""Unit tests for the metric status cache."""
+
+import unittest
+from datetime import datetime, timedelta
+
+import mongomock
+from dateutil.tz import tzutc
+
+from notifier.metric_status_cache import MetricStatusCache
+
+from shared_test_code.fixtures import METRIC_ID, METRIC_ID2, REPORT_ID
+
+
+class MetricStatusCacheTest(unittest.TestCase):
+    """Unit tests for the metric status cache."""
+
+    def setUp(self) -> None:
+        """Override to create the database and the cache."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+        self.cache = MetricStatusCache(self.database)
+
+    def insert_measurement(self, status: str, metric_uuid: str = METRIC_ID, **delta: float) -> None:
+        """Insert a measurement that started at the current time plus the delta."""
+        start = (datetime.now(tz=tzutc()) + timedelta(**delta)).isoformat()
+        self.database.measurements.insert_one(
+            {
+                "metric_uuid": metric_uuid,
+                "report_uuid": REPORT_ID,
+                "start": start,
+                "end": start,
+                "count": {"status": status, "value": "0"},
+            }
+        )
+
+    def test_no_measurements(self):
+        """Test that no metrics changed if there are no measurements."""
+        self.assertEqual(set(), self.cache.changed_metric_uuids())
+
+    def test_ignore_measurements_before_start(self):
+        """Test that measurements that started before the cache was created are ignored."""
+        self.insert_measurement("target_met", minutes=-1)
+        self.assertEqual(set(), self.cache.changed_metric_uuids())
+
+    def test_new_measurements(self):
+        """Test that metrics with new measurements and no cached status may have changed."""
+        self.insert_measurement("target_met", seconds=1)
+        self.insert_measurement("target_not_met", METRIC_ID2, seconds=2)
+        self.assertEqual({METRIC_ID, METRIC_ID2}, self.cache.changed_metric_uuids())
+
+    def test_changed_report_uuids(self):
+        """Test that the report uuids of the changed metrics are remembered."""
+        self.insert_measurement("target_met", seconds=1)
+        self.cache.changed_metric_uuids()
+        self.assertEqual({REPORT_ID}, self.cache.changed_report_uuids)
+        self.cache.commit()
+        self.cache.changed_metric_uuids()
+        self.assertEqual(set(), self.cache.changed_report_uuids)
+
+    def test_measurements_are_seen_once(self):
+        """Test that measurements that were seen before are not reported again, even when looking back."""
+        self.insert_measurement("target_met", seconds=1)
+        self.cache.changed_metric_uuids()
+        self.cache.commit()
+        self.assertEqual(set(), self.cache.changed_metric_uuids())
+
+    def test_status_unchanged(self):
+        """Test that metrics whose new measurement has the cached status did not change."""
+        self.insert_measurement("target_met", seconds=1)
+        self.cache.changed_metric_uuids()
+        self.cache.commit()
+        self.insert_measurement("target_met", seconds=2)
+        self.assertEqual(set(), self.cache.changed_metric_uuids())
+
+    def test_status_changed(self):
+        """Test that metrics whose new measurement has another status than the cached status changed."""
+        self.insert_measurement("target_met", seconds=1)
+        self.cache.changed_metric_uuids()
+        self.cache.commit()
+        self.insert_measurement("target_not_met", seconds=2)
+        self.assertEqual({METRIC_ID}, self.cache.changed_metric_uuids())
+
+    def test_uncommitted_statuses_are_not_remembered(self):
+        """Test that metrics are reported again if the statuses were not committed."""
+        self.insert_measurement("target_met", seconds=1)
+        self.cache.changed_metric_uuids()
+        self.assertEqual({METRIC_ID}, self.cache.changed_metric_uuids())
+
+    def test_changed_after(self):
+        """Test that the timestamp after which the measurements started looks back from the watermark."""
+        self.insert_measurement("target_met", minutes=10)
+        self.cache.changed_metric_uuids()
+        self.cache.commit()
+        self.cache.changed_metric_uuids()
+        self.cache.commit()
+        expected = datetime.now(tz=tzutc()) + timedelta(minutes=9)
+        self.assertAlmostEqual(expected, self.cache.changed_after, delta=timedelta(seconds=5))
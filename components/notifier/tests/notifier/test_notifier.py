@@ -5,38 +5,20 @@ import pathlib
 import tempfile
 import unittest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import mongomock
-from dateutil.tz import tzutc
 
-from shared.model.measurement import Measurement
-from shared.model.metric import Metric
-from shared.model.report import Report
 from shared.utils.functions import iso_timestamp
 
-from notifier.notifier import most_recent_measurement_timestamp, notify, record_health
+from database.reports import get_reports_and_measurements
+from notifier.notifier import notify, record_health
 
-from shared_test_code.fixtures import METRIC_ID, METRIC_ID2, NOTIFICATION_DESTINATION_ID, REPORT_ID, SUBJECT_ID
+from shared_test_code.fixtures import METRIC_ID, NOTIFICATION_DESTINATION_ID, REPORT_ID, SUBJECT_ID
 
 from tests.fixtures import create_report_data
 
 
-class MostRecentMeasurementTimestampTests(unittest.TestCase):
-    """Unit tests for the most recent measurement timestamp method."""
-
-    def test_no_measurements(self):
-        """Test without measurements."""
-        self.assertEqual(datetime.min.replace(tzinfo=tzutc()), most_recent_measurement_timestamp([]))
-
-    def test_one_measurement(self):
-        """Test that the end timestamp of the measurement is returned."""
-        now = datetime.now(tz=tzutc())
-        metric = Metric({}, {}, METRIC_ID)
-        measurement = Measurement(metric, {"start": now.isoformat(), "end": now.isoformat()})
-        self.assertEqual(now, most_recent_measurement_timestamp([measurement]))
-
-
 class HealthCheckTest(unittest.TestCase):
     """Unit tests for the record_health method."""
 
@@ -63,78 +45,22 @@ class HealthCheckTest(unittest.TestCase):
         logger.exception.assert_called_once_with("Could not write health check time stamp to %s", self.filename)
 
 
+NOW = "2026-10-18T12:00:00+00:00"
+
+
 @patch("pathlib.Path.open", mock_open())
+@patch("destinations.delivery.NotificationDelivery.deliver", Mock())
+@patch("notifier.metric_status_cache.iso_timestamp", Mock(return_value=NOW))
 class NotifyTests(unittest.IsolatedAsyncioTestCase):
     """Unit tests for the notify method."""
 
     def setUp(self):
         """Define info that is used in multiple tests."""
-        self.title = "Report 1"
-        self.history = "2020-01-01T23:59:00+00:00"
-        self.url = "www.url.com"
         self.database = mongomock.MongoClient()["quality_time_db"]
-        self.subjects = {
-            SUBJECT_ID: {
-                "type": "software",
-                "name": "Subject 1",
-                "metrics": {
-                    METRIC_ID: {
-                        "type": "tests",
-                        "name": "metric1",
-                        "status": "target_not_met",
-                        "scale": "count",
-                    },
-                },
-            },
-        }
-
-    @patch("logging.getLogger")
-    @patch("asyncio.sleep")
-    @patch("notifier.notifier.get_reports_and_measurements")
-    async def test_exception(self, mocked_get: Mock, mocked_sleep: Mock, mocked_get_logger: Mock):
-        """Test that an exception while retrieving the reports is handled."""
-        logger = mocked_get_logger.return_value = Mock()
-        mocked_get.side_effect = OSError
-        mocked_sleep.side_effect = RuntimeError
-        with contextlib.suppress(RuntimeError):
-            await notify(self.database)
-
-        logger.exception.assert_called_once()
-        self.assertEqual(logger.exception.mock_calls[0].args[0], "Getting reports and measurements failed")
-
-    @patch("pymsteams.connectorcard.send")
-    @patch("asyncio.sleep")
-    @patch("notifier.notifier.get_reports_and_measurements")
-    async def test_no_new_red_metrics(self, mocked_get: Mock, mocked_sleep: Mock, mocked_send: Mock):
-        """Test that no notifications are sent if there are no new red metrics."""
-        report_data = create_report_data()
-        now = iso_timestamp()
-        just_now = (datetime.now(tz=tzutc()) - timedelta(seconds=10)).isoformat()
-        measurements = [
-            {"metric_uuid": METRIC_ID2, "end": now, "start": now, "count": {"status": "target_not_met", "value": "10"}},
-            {
-                "metric_uuid": METRIC_ID2,
-                "end": just_now,
-                "start": just_now,
-                "count": {"status": "target_met", "value": "0"},
-            },
-        ]
-        mocked_get.side_effect = [([Report({}, report_data)], measurements), ([Report({}, report_data)], measurements)]
-        mocked_sleep.side_effect = [None, RuntimeError]
-        with contextlib.suppress(RuntimeError):
-            await notify(self.database)
-
-        mocked_send.assert_not_called()
-
-    @patch("notifier.notifier.send_notification")
-    @patch("asyncio.sleep")
-    @patch("notifier.notifier.get_reports_and_measurements")
-    async def test_one_new_red_metric(self, mocked_get: Mock, mocked_sleep: Mock, mocked_send: Mock):
-        """Test that a notification is sent if there is one new red metric."""
-        report_data = {
+        self.report_data = {
             "report_uuid": REPORT_ID,
-            "title": self.title,
-            "url": self.url,
+            "title": "Report 1",
+            "last": True,
             "notification_destinations": {
                 NOTIFICATION_DESTINATION_ID: {
                     "name": "destination name",
@@ -142,88 +68,103 @@ class NotifyTests(unittest.IsolatedAsyncioTestCase):
                     "report_url": "https://report",
                 },
             },
-            "subjects": self.subjects,
-        }
-        now = iso_timestamp()
-        just_now = (datetime.now(tz=tzutc()) - timedelta(days=1)).isoformat()
-        measurements = [
-            {"metric_uuid": METRIC_ID, "end": now, "start": now, "count": {"status": "target_not_met", "value": "0"}},
-            {
-                "metric_uuid": METRIC_ID,
-                "end": just_now,
-                "start": just_now,
-                "count": {"status": "target_met", "value": "10"},
-            },
-        ]
-        mocked_get.side_effect = [([Report({}, report_data)], []), ([Report({}, report_data)], measurements)]
-
-        mocked_sleep.side_effect = [None, RuntimeError]
-        with contextlib.suppress(RuntimeError):
-            await notify(self.database)
-
-        # gets twice, once for the first report, once for the second
-        self.assertEqual(mocked_get.call_count, 2)
-        self.assertEqual(mocked_send.call_count, 1)
-
-    @patch("pymsteams.connectorcard.send")
-    @patch("asyncio.sleep")
-    @patch("notifier.notifier.get_reports_and_measurements")
-    async def test_one_old_red_metric_with_one_measurement(
-        self,
-        mocked_get: Mock,
-        mocked_sleep: Mock,
-        mocked_send: Mock,
-    ):
-        """Test that a notification is not sent if there is one old red metric."""
-        history = self.history
-        measurement = {
-            "metric_uuid": METRIC_ID,
-            "start": history,
-            "end": history,
-            "count": {"status": "target_met", "value": "5"},
-        }
-        report_data = {
-            "report_uuid": REPORT_ID,
-            "title": self.title,
-            "url": self.url,
-            "webhook": "https://webhook",
             "subjects": {
                 SUBJECT_ID: {
-                    "metrics": {
-                        METRIC_ID: {
-                            "type": "tests",
-                            "name": "metric1",
-                            "status": "target_not_met",
-                            "scale": "count",
-                        },
-                    },
+                    "type": "software",
+                    "name": "Subject 1",
+                    "metrics": {METRIC_ID: {"type": "tests", "name": "metric1", "scale": "count"}},
                 },
             },
         }
+        self.database.reports.insert_one(self.report_data)
 
-        mocked_get.return_value = ([Report({}, report_data), Report({}, report_data)], [measurement, measurement])
-        mocked_sleep.side_effect = [None, RuntimeError]
-        with contextlib.suppress(RuntimeError):
+    def insert_measurement(self, status: str, **delta: float) -> None:
+        """Insert a measurement that started at the time the notifier started plus the delta."""
+        start = (datetime.fromisoformat(NOW) + timedelta(**delta)).isoformat()
+        self.database.measurements.insert_one(
+            {
+                "metric_uuid": METRIC_ID,
+                "report_uuid": REPORT_ID,
+                "start": start,
+                "end": start,
+                "count": {"status": status, "value": "0"},
+            }
+        )
+
+    async def notify(self, nr_cycles: int = 1) -> None:
+        """Run the notifier for the number of cycles."""
+        sleep = AsyncMock(side_effect=[None] * (nr_cycles - 1) + [RuntimeError])
+        with patch("asyncio.sleep", sleep), contextlib.suppress(RuntimeError):
             await notify(self.database)
 
-        mocked_send.assert_not_called()
+    def assert_notifications_queued(self, expected: int) -> None:
+        """Assert that the expected number of notifications has been queued for delivery."""
+        self.assertEqual(expected, self.database.notification_queue.count_documents({}))
 
-    @patch("pymsteams.connectorcard.send")
-    @patch("asyncio.sleep")
+    @patch("logging.getLogger")
     @patch("notifier.notifier.get_reports_and_measurements")
-    async def test_no_webhook_in_notification_destination(
-        self,
-        mocked_get: Mock,
-        mocked_sleep: Mock,
-        mocked_send: Mock,
-    ):
-        """Test that the notifier continues if a destination does not have a webhook configured."""
-        report_data = create_report_data()
-        measurements: list[dict] = []
-        mocked_get.side_effect = [([Report({}, report_data)], measurements), ([Report({}, report_data)], measurements)]
+    async def test_exception(self, mocked_get: Mock, mocked_get_logger: Mock):
+        """Test that an exception while retrieving the reports is handled."""
+        logger = mocked_get_logger.return_value = Mock()
+        mocked_get.side_effect = OSError
+        self.insert_measurement("target_not_met", minutes=1)
+        await self.notify()
+        logger.exception.assert_called_once()
+        self.assertEqual(logger.exception.mock_calls[0].args[0], "Getting reports and measurements failed")
 
-        mocked_sleep.side_effect = [None, RuntimeError]
-        with contextlib.suppress(RuntimeError):
-            await notify(self.database)
+    @patch("logging.getLogger", Mock())
+    async def test_retry_after_exception(self):
+        """Test that the changed metrics are evaluated again after an exception while retrieving the reports."""
+        self.insert_measurement("target_met", days=-1)
+        self.insert_measurement("target_not_met", minutes=1)
+        reports_and_measurements = get_reports_and_measurements(self.database, {METRIC_ID}, {REPORT_ID})
+        with patch("notifier.notifier.get_reports_and_measurements", side_effect=[OSError, reports_and_measurements]):
+            await self.notify(nr_cycles=2)
+        self.assert_notifications_queued(1)
 
-        mocked_send.assert_not_called()
+    @patch("notifier.notifier.get_reports_and_measurements")
+    async def test_no_new_measurements(self, mocked_get: Mock):
+        """Test that the reports are not retrieved if there are no new measurements."""
+        self.insert_measurement("target_met", days=-1)
+        await self.notify(nr_cycles=2)
+        mocked_get.assert_not_called()
+
+    async def test_one_new_red_metric(self):
+        """Test that a notification is queued if there is one new red metric."""
+        self.insert_measurement("target_met", days=-1)
+        self.insert_measurement("target_not_met", minutes=1)
+        await self.notify()
+        self.assert_notifications_queued(1)
+        notification = self.database.notification_queue.find_one()
+        self.assertEqual("www.webhook.com", notification["webhook"])
+        self.assertEqual("Report 1 has 1 metric that changed status", notification["payload"]["summary"])
+
+    async def test_notify_once(self):
+        """Test that a notification is queued once, even though the notifier looks back when retrieving measurements."""
+        self.insert_measurement("target_met", days=-1)
+        self.insert_measurement("target_not_met", minutes=1)
+        await self.notify(nr_cycles=3)
+        self.assert_notifications_queued(1)
+
+    async def test_unchanged_status(self):
+        """Test that no notification is queued if the status of the new measurement did not change."""
+        self.insert_measurement("target_not_met", days=-1)
+        self.insert_measurement("target_not_met", minutes=1)
+        await self.notify()
+        self.assert_notifications_queued(0)
+
+    async def test_old_red_metric(self):
+        """Test that no notification is queued for status changes from before the notifier started."""
+        self.insert_measurement("target_met", days=-2)
+        self.insert_measurement("target_not_met", days=-1)
+        await self.notify()
+        self.assert_notifications_queued(0)
+
+    async def test_no_webhook_in_notification_destination(self):
+        """Test that the notifier continues if a destination does not have a webhook configured."""
+        self.database.reports.delete_many({})
+        self.database.reports.insert_one(create_report_data())
+        self.insert_measurement("target_met", days=-1)
+        self.insert_measurement("target_not_met", minutes=1)
+        await self.notify()
+        self.assert_notifications_queued(0)
@@ -237,3 +237,39 @@ class StrategiesTests(unittest.TestCase):
         """Test that no notification is to be sent if notification destinations do not exist in the data."""
         del self.reports[0]["notification_destinations"]
         self.assertEqual([], self.get_notifications())
+
+    def test_group_measurements_by_metric(self):
+        """Test that the measurements are grouped by metric and sorted by end timestamp."""
+        metric2 = Metric({}, {"name": "metric2", "scale": "count", "status": "target_met", "type": "tests"}, METRIC_ID2)
+        old_measurement = Measurement(metric2, metric_uuid=METRIC_ID2, start=self.OLD_TIMESTAMP, end=self.OLD_TIMESTAMP)
+        new_measurement = Measurement(metric2, metric_uuid=METRIC_ID2, start=self.OLD_TIMESTAMP, end=self.NEW_TIMESTAMP)
+        measurements = [new_measurement, *self.red_metric_measurements, old_measurement]
+        self.assertEqual(
+            {METRIC_ID: self.red_metric_measurements, METRIC_ID2: [old_measurement, new_measurement]},
+            self.notification_finder.group_measurements_by_metric(measurements),
+        )
+
+    def test_measurements_are_grouped_once(self):
+        """Test that the number of metric uuid lookups grows linearly with the number of metrics and measurements."""
+        lookups = []
+
+        class CountingMeasurement(Measurement):
+            """Measurement that counts the metric uuid lookups."""
+
+            def __getitem__(self, item: str):  # noqa: ANN204
+                """Extend to count the metric uuid lookups."""
+                if item == "metric_uuid":
+                    lookups.append(item)
+                return super().__getitem__(item)
+
+        metrics, measurements = {}, []
+        for index in range(100):
+            metric_uuid = f"metric-{index}"
+            metrics[metric_uuid] = metric = self.metric(status="target_not_met")
+            measurements.extend(
+                CountingMeasurement(metric, measurement, metric_uuid=metric_uuid)
+                for measurement in self.red_metric_measurements
+            )
+        self.reports[0]["subjects"][SUBJECT_ID]["metrics"] = metrics
+        self.assertEqual(100, len(self.get_notifications(measurements)[0].metrics))
+        self.assertEqual(len(measurements), len(lookups))
@@ -1,6 +1,6 @@
 _.subject_uuids  # unused attribute (src/shared/model/report.py:40)
 NotificationDestinationId  # unused variable (src/shared/utils/type.py:17)
-DATA_MODEL_JSON  # unused variable (src/shared_data_model/__init__.py:10)
+DATA_MODEL_JSON  # unused variable (src/shared_data_model/__init__.py:14)
 _.check_description  # unused method (src/shared_data_model/meta/base.py:29)
 reference_documentation_url  # unused variable (src/shared_data_model/meta/base.py:39)
 _.set_reference_documentation_url  # unused method (src/shared_data_model/meta/base.py:41)
@@ -25,7 +25,7 @@ explanation_urls  # unused variable (src/shared_data_model/meta/metric.py:58)
 documentation  # unused variable (src/shared_data_model/meta/metric.py:59)
 _.set_default_scale  # unused method (src/shared_data_model/meta/metric.py:61)
 _.check_unit  # unused method (src/shared_data_model/meta/metric.py:67)
-model_config  # unused variable (src/shared_data_model/meta/parameter.py:28)
+model_config  # unused variable (src/shared_data_model/meta/parameter.py:30)
 mandatory  # unused variable (src/shared_data_model/meta/parameter.py:34)
 _.check_help  # unused method (src/shared_data_model/meta/parameter.py:42)
 _.check_placeholder  # unused method (src/shared_data_model/meta/parameter.py:52)
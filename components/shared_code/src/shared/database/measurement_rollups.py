@@ -0,0 +1,114 @@
+"""Measurement rollups collection."""
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, get_args
+
+from pymongo import ASCENDING, UpdateOne
+
+from shared.utils.type import Resolution, Scale
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from pymongo.database import Database
+
+RESOLUTIONS: tuple[Resolution, ...] = get_args(Resolution)
+SCALES: tuple[Scale, ...] = get_args(Scale)
+
+
+def period_start(iso_timestamp: str, resolution: Resolution) -> datetime:
+    """Return the start of the day or week (starting on Monday) that contains the timestamp."""
+    start = datetime.fromisoformat(iso_timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+    return start - timedelta(days=start.weekday()) if resolution == "week" else start
+
+
+def period_length(resolution: Resolution) -> timedelta:
+    """Return the length of the period."""
+    return timedelta(days=7 if resolution == "week" else 1)
+
+
+def rollup_operations(measurement: Mapping) -> list[UpdateOne]:
+    """Return the operations to roll up the measurement into the periods that contain the end of the measurement.
+
+    A rollup contains the value and status per scale of the last measurement of the metric in the period. Because a
+    measurement is updated each time the metric is measured, the rollups of the periods in which the metric is
+    measured are kept up to date when measurements are inserted or their end is updated.
+    """
+    return [
+        rollup_operation(measurement, resolution, period_start(measurement["end"], resolution))
+        for resolution in RESOLUTIONS
+    ]
+
+
+def rollup_operation(measurement: Mapping, resolution: Resolution, start: datetime) -> UpdateOne:
+    """Return the operation to upsert the rollup of the metric for the period with the measurement."""
+    return UpdateOne(
+        rollup_filter(measurement, resolution, start),
+        {"$set": rollup_fields(measurement, measurement["end"])},
+        upsert=True,
+    )
+
+
+def backfill_operation(measurement: Mapping, resolution: Resolution, start: datetime, end: str) -> UpdateOne:
+    """Return the operation to upsert the rollup of the metric for the period, unless the rollup is newer.
+
+    The backfill may run while the collector writes new measurements, and thus rollups. Use an update pipeline that
+    keeps the fields of the stored rollup if its end is later than the end of the backfilled rollup, so the backfill
+    doesn't overwrite the rollup of a newer measurement with the rollup of an older measurement.
+    """
+    stored_rollup_is_newer = {"$gt": [{"$ifNull": ["$end", ""]}, end]}
+    fields = {
+        field: {"$cond": [stored_rollup_is_newer, f"${field}", {"$literal": value}]}
+        for field, value in rollup_fields(measurement, end).items()
+    }
+    return UpdateOne(rollup_filter(measurement, resolution, start), [{"$set": fields}], upsert=True)
+
+
+def rollup_filter(measurement: Mapping, resolution: Resolution, start: datetime) -> dict[str, str]:
+    """Return the filter to find the rollup of the metric for the period."""
+    return {"metric_uuid": measurement["metric_uuid"], "resolution": resolution, "start": start.isoformat()}
+
+
+def rollup_fields(measurement: Mapping, end: str) -> dict[str, object]:
+    """Return the end and the value and status per scale of the rollup of the measurement."""
+    scales: dict[str, dict[str, str | None]] = {
+        scale: {"value": scale_measurement.get("value"), "status": scale_measurement.get("status")}
+        for scale in SCALES
+        if (scale_measurement := measurement.get(scale))
+    }
+    return {"end": end, **scales}
+
+
+def backfill_operations(measurements: Iterator[Mapping]) -> Iterator[UpdateOne]:
+    """Return the operations to roll up existing measurements into all periods that they overlap with.
+
+    The measurements should be sorted by start, so that the last measurement in a period determines the rollup.
+    """
+    for measurement in measurements:
+        for resolution in RESOLUTIONS:
+            start = period_start(measurement["start"], resolution)
+            while start.isoformat() <= measurement["end"]:
+                end = min(measurement["end"], (start + period_length(resolution)).isoformat())
+                yield backfill_operation(measurement, resolution, start, end)
+                start += period_length(resolution)
+
+
+def backfill_rollups(database: Database, batch_size: int = 1000) -> int:
+    """Create the rollups of all existing measurements and return the number of rollup operations performed."""
+    projection = {"_id": False, "metric_uuid": True, "start": True, "end": True} | dict.fromkeys(SCALES, True)
+    measurements = database.measurements.find({}, projection=projection, sort=[("start", ASCENDING)])
+    nr_operations = 0
+    batch: list[UpdateOne] = []
+    for operation in backfill_operations(measurements):
+        batch.append(operation)
+        if len(batch) >= batch_size:
+            nr_operations += write_rollups(database, batch)
+            batch = []
+    return nr_operations + write_rollups(database, batch)
+
+
+def write_rollups(database: Database, operations: list[UpdateOne]) -> int:
+    """Write the rollup operations to the database and return the number of operations."""
+    if operations:
+        database.measurement_rollups.bulk_write(operations)
+    return len(operations)
@@ -3,35 +3,93 @@
 from typing import TYPE_CHECKING
 
 import pymongo
+from pymongo import UpdateOne
 
+from shared.database.filters import DOES_NOT_EXIST
+from shared.database.measurement_rollups import rollup_operations
 from shared.model.measurement import Measurement
 
 if TYPE_CHECKING:
     from pymongo.database import Database
 
     from shared.model.metric import Metric
+    from shared.utils.type import MetricId
+
+
+# Fields of the documents in the latest measurements collection
+LATEST_MEASUREMENT_ID = "latest_measurement_id"
+LATEST_SUCCESSFUL_MEASUREMENT_ID = "latest_successful_measurement_id"
+PREVIOUS_MEASUREMENT_ID = "previous_measurement_id"  # The measurement that was the latest before the latest one
 
 
 def latest_measurement(
     database: Database, metric: Metric, *, skip_measurements_with_error: bool = False
 ) -> Measurement | None:
-    """Return the latest measurement."""
-    measurement_filter: dict[str, bool | str] = {"metric_uuid": metric.uuid}
-    sort_options = [("start", pymongo.DESCENDING)]
-    if skip_measurements_with_error:
-        measurement_filter["has_error"] = False
-    latest = database.measurements.find_one(filter=measurement_filter, sort=sort_options)
+    """Return the latest measurement.
+
+    The latest measurements collection contains one document per metric with the ids of the latest measurement and
+    the latest successful measurement of the metric, so the latest measurement can be retrieved by id instead of by
+    scanning the measurements of the metric.
+    """
+    field = LATEST_SUCCESSFUL_MEASUREMENT_ID if skip_measurements_with_error else LATEST_MEASUREMENT_ID
+    latest_measurement_ids = database.latest_measurements.find_one({"metric_uuid": metric.uuid}) or {}
+    if field in latest_measurement_ids:
+        measurement_id = latest_measurement_ids[field]
+        latest = None if measurement_id is None else database.measurements.find_one({"_id": measurement_id})
+    else:
+        latest = initialize_latest_measurement(database, metric.uuid, field)
     return None if latest is None else Measurement(metric, latest)
 
 
+def initialize_latest_measurement(database: Database, metric_uuid: MetricId, field: str) -> dict | None:
+    """Look up the latest (successful) measurement of a metric and store its id.
+
+    Metrics measured by a version of Quality-time without the latest measurements collection have no document in the
+    collection yet, or a document without the id of their latest successful measurement. Find the latest measurement
+    the slow way and store its id so the next lookup is fast. Don't overwrite ids stored in the meantime.
+    """
+    measurement_filter: dict[str, bool | str] = {"metric_uuid": metric_uuid}
+    if field == LATEST_SUCCESSFUL_MEASUREMENT_ID:
+        measurement_filter["has_error"] = False
+    latest = database.measurements.find_one(filter=measurement_filter, sort=[("start", pymongo.DESCENDING)])
+    measurement_id = None if latest is None else latest["_id"]
+    result = database.latest_measurements.update_one(
+        {"metric_uuid": metric_uuid}, {"$setOnInsert": {field: measurement_id}}, upsert=True
+    )
+    if result.upserted_id is None:  # The metric already had a document, add the id if it is still missing
+        database.latest_measurements.update_one(
+            {"metric_uuid": metric_uuid, field: DOES_NOT_EXIST}, {"$set": {field: measurement_id}}
+        )
+    return latest
+
+
+def latest_measurement_ids_operation(measurement: Measurement, previous: Measurement | None) -> UpdateOne:
+    """Return the operation to make the measurement the latest measurement of its metric.
+
+    The measurement must have been inserted into the measurements collection, so it has an id. The previous
+    measurement is the measurement that was the latest measurement of the metric until now, if any.
+    """
+    latest_measurement_ids = {
+        LATEST_MEASUREMENT_ID: measurement["_id"],
+        PREVIOUS_MEASUREMENT_ID: None if previous is None else previous["_id"],
+    }
+    if measurement.get("has_error") is False:
+        latest_measurement_ids[LATEST_SUCCESSFUL_MEASUREMENT_ID] = measurement["_id"]
+    return UpdateOne({"metric_uuid": measurement.metric.uuid}, {"$set": latest_measurement_ids}, upsert=True)
+
+
 def insert_new_measurement(database: Database, measurement: Measurement) -> Measurement:
-    """Insert a new measurement."""
+    """Insert a new measurement, make it the latest measurement of its metric, and update the metric's rollups."""
     if latest := latest_measurement(database, measurement.metric):  # pragma: no feature-test-cover
-        # No need to keep hashes around. This update is ignored if the latest measurement has no hash.
-        database.measurements.update_one({"_id": latest["_id"]}, {"$unset": {"source_parameter_hash": ""}})
+        # No need to keep hashes around. This update is ignored if the latest measurement has no hashes.
+        database.measurements.update_one(
+            {"_id": latest["_id"]}, {"$unset": {"source_parameter_hash": "", "payload_hash": ""}}
+        )
     measurement.update_measurement()
     if "_id" in measurement:  # pragma: no feature-test-cover
         del measurement["_id"]  # Remove the Mongo ID if present so this measurement can be re-inserted in the database.
     database.measurements.insert_one(measurement)
+    database.latest_measurements.bulk_write([latest_measurement_ids_operation(measurement, latest)])
+    database.measurement_rollups.bulk_write(rollup_operations(measurement))
     del measurement["_id"]
     return measurement
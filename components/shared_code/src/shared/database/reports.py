@@ -4,13 +4,21 @@ from typing import TYPE_CHECKING
 
 from shared.database.filters import DOES_NOT_EXIST
 from shared.model.report import Report
-from shared_data_model import DATA_MODEL
+from shared_data_model.snapshot import data_model_snapshot
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from pymongo.database import Database
 
+    from shared.utils.type import ReportId
+
 
-def get_reports(database: Database, report_class: type[Report] = Report) -> list[Report]:
-    """Return a list of reports."""
-    query = {"last": True, "deleted": DOES_NOT_EXIST}
-    return [report_class(DATA_MODEL.model_dump(), report_dict) for report_dict in database.reports.find(filter=query)]
+def get_reports(
+    database: Database, report_class: type[Report] = Report, report_uuids: Collection[ReportId] | None = None
+) -> list[Report]:
+    """Return a list of reports, or of the reports with the given uuids."""
+    query: dict[str, object] = {"last": True, "deleted": DOES_NOT_EXIST}
+    if report_uuids is not None:
+        query["report_uuid"] = {"$in": list(report_uuids)}
+    return [report_class(data_model_snapshot(), report_dict) for report_dict in database.reports.find(filter=query)]
@@ -194,8 +194,13 @@ class Measurement(dict):
         return measurement_class(self.get(scale, {}), measurement=self, previous_scale_measurement=previous)
 
     def copy(self) -> Measurement:
-        """Extend to return an instance of this class instead of a dict."""
-        return self.__class__(self.metric, super().copy(), previous_measurement=self)
+        """Extend to return an instance of this class instead of a dict.
+
+        The copy has no payload hash, because it is not based on the source responses alone.
+        """
+        copy = super().copy()
+        copy.pop("payload_hash", None)
+        return self.__class__(self.metric, copy, previous_measurement=self)
 
     def __getitem__(self, item: str):  # noqa: ANN204
         """Override to convert the scale dictionary to a ScaleMeasurement instance before returning it."""
@@ -10,6 +10,8 @@ from shared.utils.type import Direction, MetricId, Scale, SourceId, Status, Subj
 from .source import Source
 
 if TYPE_CHECKING:
+    from shared_data_model.snapshot import DataModelSnapshot
+
     from .measurement import Measurement
 
 
@@ -18,7 +20,7 @@ class Metric(dict):  # noqa: PLW1641
 
     def __init__(
         self,
-        data_model: dict,
+        data_model: DataModelSnapshot,
         metric_data: dict,
         metric_uuid: MetricId,
         subject_uuid: SubjectId | None = None,
@@ -8,6 +8,7 @@ from .subject import Subject
 
 if TYPE_CHECKING:
     from shared.model.source import Source
+    from shared_data_model.snapshot import DataModelSnapshot
 
     from .measurement import Measurement
     from .metric import Metric
@@ -28,7 +29,7 @@ STATUS_COLOR_MAPPING = cast(
 class Report(dict):  # noqa: PLW1641
     """Class representing a report."""
 
-    def __init__(self, data_model: dict, report_data: dict) -> None:
+    def __init__(self, data_model: DataModelSnapshot, report_data: dict) -> None:
         """Instantiate a report."""
         self.__data_model = data_model
 
@@ -7,6 +7,8 @@ from shared.utils.type import MetricId, SubjectId
 from .metric import Metric
 
 if TYPE_CHECKING:
+    from shared_data_model.snapshot import DataModelSnapshot
+
     from .measurement import Measurement
     from .report import Report
 
@@ -14,7 +16,9 @@ if TYPE_CHECKING:
 class Subject(dict):  # noqa: PLW1641
     """Class representing a subject."""
 
-    def __init__(self, data_model: dict, subject_data: dict, subject_uuid: SubjectId, report: Report) -> None:
+    def __init__(
+        self, data_model: DataModelSnapshot, subject_data: dict, subject_uuid: SubjectId, report: Report
+    ) -> None:
         """Instantiate a subject."""
         self.__data_model = data_model
         self.uuid = subject_uuid
@@ -4,6 +4,7 @@ from typing import Literal, NewType
 
 Color = Literal["blue", "green", "grey", "red", "yellow", "white"]
 Direction = Literal["<", ">"]
+Resolution = Literal["day", "week"]
 Scale = Literal["count", "percentage", "version_number"]
 Status = Literal["informative", "target_met", "debt_target_met", "near_target_met", "target_not_met"]
 TargetType = Literal["target", "near_target", "debt_target"]
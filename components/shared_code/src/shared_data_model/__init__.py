@@ -1,10 +1,24 @@
-"""The Quality-time data model."""
+"""The Quality-time data model.
 
-from .meta.data_model import DataModel
-from .metrics import METRICS
-from .scales import SCALES
-from .sources import SOURCES
-from .subjects import SUBJECTS
+The data model is loaded from the precompiled artifact of the data model on first use, see the artifact module.
+"""
 
-DATA_MODEL = DataModel(scales=SCALES, metrics=METRICS, sources=SOURCES, subjects=SUBJECTS)
-DATA_MODEL_JSON = DATA_MODEL.model_dump_json(exclude_none=True)
+from typing import TYPE_CHECKING
+
+from .artifact import load_data_model, load_data_model_json
+
+if TYPE_CHECKING:
+    from .meta.data_model import DataModel
+
+    DATA_MODEL: DataModel
+    DATA_MODEL_JSON: str
+
+
+def __getattr__(name: str) -> object:
+    """Load the data model or its JSON dump on first use."""
+    if name == "DATA_MODEL":
+        return load_data_model()
+    if name == "DATA_MODEL_JSON":
+        return load_data_model_json()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
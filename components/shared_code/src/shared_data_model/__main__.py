@@ -0,0 +1,5 @@
+"""Generate the precompiled artifact of the data model."""
+
+from .artifact import write_artifact
+
+write_artifact()
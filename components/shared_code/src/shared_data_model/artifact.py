@@ -0,0 +1,74 @@
+"""Precompiled artifact of the data model.
+
+Building the data model from its definitions means importing the definitions of all scales, metrics, sources, and
+subjects and running all validators of the meta model. To keep the start-up of the components fast, the components
+load a JSON artifact of the data model instead. The artifact is generated from the definitions and the unit tests
+check that the artifact is up-to-date. After changing the data model, regenerate the artifact with:
+
+    python -m shared_data_model
+
+The meta model is only imported when needed, so users of the JSON dump of the data model don't need to import Pydantic.
+"""
+
+import functools
+import json
+import pathlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .meta.data_model import DataModel
+    from .meta.parameter import Parameter
+
+ARTIFACT_PATH = pathlib.Path(__file__).parent / "data_model.json"
+
+
+def build_data_model() -> DataModel:
+    """Build the data model from its definitions and validate it."""
+    from .meta.data_model import DataModel  # noqa: PLC0415
+    from .metrics import METRICS  # noqa: PLC0415
+    from .scales import SCALES  # noqa: PLC0415
+    from .sources import SOURCES  # noqa: PLC0415
+    from .subjects import SUBJECTS  # noqa: PLC0415
+
+    return DataModel(scales=SCALES, metrics=METRICS, sources=SOURCES, subjects=SUBJECTS)
+
+
+def dump_data_model(data_model: DataModel) -> str:
+    """Return the JSON dump of the data model."""
+    return data_model.model_dump_json(exclude_none=True)
+
+
+@functools.cache
+def load_data_model_json() -> str:
+    """Return the JSON dump of the data model from the artifact."""
+    return ARTIFACT_PATH.read_text(encoding="utf-8")
+
+
+@functools.cache
+def load_data_model() -> DataModel:
+    """Return the data model, loaded from the artifact.
+
+    The meta model declares the source parameters as Parameter, so Pydantic would load them as Parameter instances and
+    reject the attributes that only subclasses of Parameter have. Hence, the parameters are loaded first.
+    """
+    from .meta.data_model import DataModel  # noqa: PLC0415
+
+    data_model = json.loads(load_data_model_json())
+    for source in data_model["sources"].values():
+        source["parameters"] = {key: load_parameter(parameter) for key, parameter in source["parameters"].items()}
+    return DataModel.model_validate(data_model)
+
+
+def load_parameter(parameter: dict[str, object]) -> Parameter:
+    """Load the parameter with the first parameter class that has all attributes of the parameter."""
+    from .meta.parameter import Parameter  # noqa: PLC0415
+    from .parameters import IntegerParameter, PrivateToken  # noqa: PLC0415
+
+    parameter_classes: tuple[type[Parameter], ...] = (Parameter, IntegerParameter, PrivateToken)
+    parameter_class = next((cls for cls in parameter_classes if parameter.keys() <= cls.model_fields.keys()), Parameter)
+    return parameter_class.model_validate(parameter)
+
+
+def write_artifact() -> None:
+    """Build the data model from its definitions and write it to the artifact."""
+    ARTIFACT_PATH.write_text(dump_data_model(build_data_model()), encoding="utf-8")
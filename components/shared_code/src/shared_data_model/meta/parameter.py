@@ -25,7 +25,9 @@ class ParameterType(StrEnum):
 class Parameter(NamedModel):
     """Source parameter model."""
 
-    model_config = ConfigDict(validate_default=True)
+    # Build the validators of parameter classes on first use, because loading the data model from the artifact only
+    # validates a few of them:
+    model_config = ConfigDict(validate_default=True, extra="forbid", defer_build=True)
 
     help: str | None = None
     help_url: HttpUrl | None = None
@@ -1,14 +1,15 @@
 """Data model source model."""
 
-from typing import TYPE_CHECKING, Self
+from typing import Self
 
 from pydantic import Field, HttpUrl, SerializeAsAny, model_validator
 
 from .base import DescribedModel, NamedModel
-from .parameter import DEFAULT_PARAMETER_LAYOUT, Parameter, ParameterGroup, ParameterType
 
-if TYPE_CHECKING:
-    from .entity import Entity
+# Ruff wants this import in a TYPE_CHECKING block, but that makes Pydantic complain that Source is not fully defined
+# when the data model is loaded from JSON.
+from .entity import Entity  # noqa: TC001
+from .parameter import DEFAULT_PARAMETER_LAYOUT, Parameter, ParameterGroup, ParameterType
 
 
 class Configuration(NamedModel):
@@ -33,6 +34,9 @@ class Source(DescribedModel):
     supported_versions_description: str | None = None  # The source versions that Quality-time supports, e.g. "≥10.2"
     deprecated: bool | None = False
     deprecation_url: HttpUrl | None = None  # URL to a GitHub issue
+    # The maximum number of sources of this type the collector retrieves concurrently from one host. If None, the
+    # collector default applies:
+    max_concurrent_requests: int | None = Field(default=None, gt=0)
 
     @model_validator(mode="after")
     def check_parameters(self) -> Self:
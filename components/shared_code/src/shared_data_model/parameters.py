@@ -44,7 +44,7 @@ class URL(Parameter):
 
     name: str = "URL"
     mandatory: bool = True
-    validate_on: list[str] | None = list(CREDENTIAL_PARAMETERS)
+    validate_on: list[str] | None = sorted(CREDENTIAL_PARAMETERS)
     type: ParameterType = ParameterType.URL
 
 
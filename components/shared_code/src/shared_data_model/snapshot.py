@@ -0,0 +1,40 @@
+"""Read-only snapshot of the data model, shared by all reports, subjects, and metrics in a process."""
+
+import functools
+import hashlib
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from .artifact import load_data_model_json
+
+type DataModelSnapshot = Mapping[str, Any]
+
+DATA_MODEL_HASH = hashlib.md5(load_data_model_json().encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def data_model_snapshot() -> DataModelSnapshot:
+    """Return the snapshot of the data model.
+
+    The snapshot is parsed from the JSON dump of the data model, so the Pydantic data model doesn't need to be loaded.
+    Parsing is done once per data model version and the result is then shared by all reports, subjects, and metrics.
+    The snapshot is frozen to prevent one user of the snapshot from changing the data model of all other users.
+    """
+    return _frozen_data_model(DATA_MODEL_HASH)
+
+
+@functools.cache
+def _frozen_data_model(data_model_hash: str) -> DataModelSnapshot:  # noqa: ARG001
+    """Return the frozen JSON dump of the data model. The data model hash is only used as cache key."""
+    snapshot: DataModelSnapshot = freeze(json.loads(load_data_model_json()))
+    return snapshot
+
+
+def freeze(value: Any) -> Any:  # noqa: ANN401
+    """Return a read-only version of the value, recursively converting dicts to mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
@@ -72,6 +72,7 @@ AZURE_DEVOPS = Source(
     "management, reporting, requirements management, project management, automated builds, testing and "
     "release management.",
     url=HttpUrl("https://azure.microsoft.com/en-us/products/devops/server/"),
+    max_concurrent_requests=10,
     parameters={
         "url": URL(
             name="URL including organization and project",
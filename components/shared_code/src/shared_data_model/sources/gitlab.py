@@ -95,6 +95,7 @@ GITLAB = Source(
     description="GitLab provides Git-repositories, wiki's, issue-tracking and continuous integration/continuous "
     "deployment pipelines.",
     url=HttpUrl("https://about.gitlab.com/"),
+    max_concurrent_requests=10,
     documentation={
         "generic": """```{note}
 Some metric sources are documents in JSON, XML, CSV, or HTML format. Examples include JUnit XML reports, JaCoCo XML
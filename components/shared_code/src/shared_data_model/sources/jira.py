@@ -62,6 +62,7 @@ JIRA = Source(
     "management.",
     url=HttpUrl("https://www.atlassian.com/software/jira"),
     issue_tracker=True,
+    max_concurrent_requests=5,
     parameters={
         "api_version": APIVersion(
             values=["v2", "v3"],
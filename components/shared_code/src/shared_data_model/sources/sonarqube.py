@@ -100,6 +100,7 @@ SONARQUBE = Source(
     description="SonarQube Server is an on-premise analysis tool designed to detect coding issues in 30+ languages, "
     "frameworks, and infrastructure-as-code platforms.",
     supported_versions_description="≥10.2",
+    max_concurrent_requests=10,
     url=HttpUrl("https://www.sonarsource.com/products/sonarqube/"),
     configuration={
         "commented_out_rules": Configuration(
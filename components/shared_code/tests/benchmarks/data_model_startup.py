@@ -0,0 +1,53 @@
+"""Benchmark the time needed to load the data model, as each component does when it starts.
+
+The benchmark compares building the data model from its definitions, which the components did before the data model
+was precompiled, with loading the data model and the JSON dump of the data model from the artifact. Each variant runs
+in a new Python process, so the import of the data model and its dependencies is included in the measured time.
+
+Run it from the shared code folder, for example:
+
+    PYTHONPATH=src python -m tests.benchmarks.data_model_startup --repeat 5
+"""
+
+import argparse
+import subprocess
+import sys
+
+VARIANTS = {
+    "Build from definitions": "from shared_data_model.artifact import build_data_model, dump_data_model\n"
+    "dump_data_model(build_data_model())",
+    "Load data model": "from shared_data_model import DATA_MODEL",
+    "Load JSON dump": "from shared_data_model import DATA_MODEL_JSON",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def duration(code: str, repeat: int) -> float:
+    """Return the best duration of running the code in a new Python process."""
+    durations = []
+    for _ in range(repeat):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", TIMER.format(code=code)], capture_output=True, check=True, text=True
+        ).stdout
+        durations.append(float(output))
+    return min(durations)
+
+
+def main() -> None:
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per variant (default: %(default)s)")
+    args = parser.parse_args()
+    print(f"{'Variant':<24}{'Duration (s)':>14}")  # noqa: T201
+    for variant, code in VARIANTS.items():
+        print(f"{variant:<24}{duration(code, args.repeat):>14.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
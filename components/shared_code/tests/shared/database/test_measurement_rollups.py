@@ -0,0 +1,89 @@
+"""Unit tests for the measurement rollups collection."""
+
+import unittest
+from datetime import UTC, datetime
+
+import mongomock
+
+from shared.database.measurement_rollups import backfill_rollups, period_start, rollup_operations
+
+from shared_test_code.fixtures import METRIC_ID
+
+
+class PeriodStartTest(unittest.TestCase):
+    """Unit tests for the period start."""
+
+    def test_day(self):
+        """Test that the start of the day is returned."""
+        self.assertEqual(datetime(2026, 10, 15, tzinfo=UTC), period_start("2026-10-15T12:34:56.123456+00:00", "day"))
+
+    def test_week(self):
+        """Test that the start of the week, on Monday, is returned."""
+        self.assertEqual(datetime(2026, 10, 12, tzinfo=UTC), period_start("2026-10-15T12:34:56.123456+00:00", "week"))
+
+
+class RollupsTest(unittest.TestCase):
+    """Unit tests for rolling up measurements."""
+
+    def setUp(self) -> None:
+        """Override to set up the database."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+
+    @staticmethod
+    def measurement(start: str, end: str, value: str) -> dict:
+        """Create a measurement."""
+        count = {"value": value, "status": "target_met", "target": "0"}
+        return {"metric_uuid": METRIC_ID, "start": start, "end": end, "count": count, "sources": []}
+
+    def rollups(self, resolution: str) -> list[dict]:
+        """Return the rollups with the resolution."""
+        projection = {"_id": False, "resolution": False, "metric_uuid": False}
+        return list(self.database.measurement_rollups.find({"resolution": resolution}, projection, sort=[("start", 1)]))
+
+    def test_rollup(self):
+        """Test that the rollups contain the value and status of the latest measurement in the period."""
+        for measurement in (
+            self.measurement("2026-10-15T10:00:00+00:00", "2026-10-15T11:00:00+00:00", "1"),
+            self.measurement("2026-10-15T12:00:00+00:00", "2026-10-15T13:00:00+00:00", "2"),
+        ):
+            self.database.measurement_rollups.bulk_write(rollup_operations(measurement))
+        expected_count = {"value": "2", "status": "target_met"}
+        self.assertEqual(
+            [{"start": "2026-10-15T00:00:00+00:00", "end": "2026-10-15T13:00:00+00:00", "count": expected_count}],
+            self.rollups("day"),
+        )
+        self.assertEqual(
+            [{"start": "2026-10-12T00:00:00+00:00", "end": "2026-10-15T13:00:00+00:00", "count": expected_count}],
+            self.rollups("week"),
+        )
+
+    def test_backfill(self):
+        """Test that existing measurements are rolled up into all periods they overlap with."""
+        self.database.measurements.insert_many(
+            [
+                self.measurement("2026-10-15T10:00:00+00:00", "2026-10-16T11:00:00+00:00", "1"),
+                self.measurement("2026-10-16T12:00:00+00:00", "2026-10-17T13:00:00+00:00", "2"),
+            ]
+        )
+        self.assertEqual(6, backfill_rollups(self.database, batch_size=2))
+        self.assertEqual(
+            [
+                {"start": "2026-10-15T00:00:00+00:00", "end": "2026-10-16T00:00:00+00:00", "count": {"value": "1"}},
+                {"start": "2026-10-16T00:00:00+00:00", "end": "2026-10-17T00:00:00+00:00", "count": {"value": "2"}},
+                {"start": "2026-10-17T00:00:00+00:00", "end": "2026-10-17T13:00:00+00:00", "count": {"value": "2"}},
+            ],
+            [rollup | {"count": {"value": rollup["count"]["value"]}} for rollup in self.rollups("day")],
+        )
+        self.assertEqual("2026-10-17T13:00:00+00:00", self.rollups("week")[0]["end"])
+
+    def test_backfill_does_not_overwrite_newer_rollups(self):
+        """Test that the backfill doesn't overwrite rollups of measurements written while the backfill runs."""
+        self.database.measurements.insert_one(
+            self.measurement("2026-10-15T10:00:00+00:00", "2026-10-15T11:00:00+00:00", "1")
+        )
+        newer_measurement = self.measurement("2026-10-15T12:00:00+00:00", "2026-10-15T13:00:00+00:00", "2")
+        self.database.measurement_rollups.bulk_write(rollup_operations(newer_measurement))
+        backfill_rollups(self.database)
+        for resolution in ("day", "week"):
+            rollup = self.rollups(resolution)[0]
+            self.assertEqual(("2026-10-15T13:00:00+00:00", "2"), (rollup["end"], rollup["count"]["value"]))
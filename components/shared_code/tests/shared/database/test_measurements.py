@@ -1,6 +1,9 @@
 """Unit tests for the measurements collection."""
 
-from unittest.mock import Mock, patch
+from typing import cast
+from unittest.mock import Mock
+
+import mongomock
 
 from shared.database.measurements import insert_new_measurement, latest_measurement
 from shared.model.measurement import Measurement
@@ -10,20 +13,20 @@ from shared_test_code.base import DataModelTestCase
 from shared_test_code.fixtures import METRIC_ID
 
 
-class MeasurementsTestCase(DataModelTestCase):
-    """Base class for unit tests for retrieving measurements from and inserting into the database."""
+class LatestMeasurementsTest(DataModelTestCase):
+    """Unit test for retrieving the latest measurement from the database."""
 
     def setUp(self) -> None:
         """Set up fixtures for measurements."""
         super().setUp()
-        self.database = Mock()
-        self.database.measurements.find_one.return_value = None
+        self.database = mongomock.MongoClient()["quality_time_db"]
         self.metric = Metric(self.DATA_MODEL, {"type": "violations"}, METRIC_ID)
 
-
-@patch("shared.model.measurement.iso_timestamp", Mock(return_value="2026-04-22T09:47:28+00:00"))
-class LatestMeasurementsTest(MeasurementsTestCase):
-    """Unit test for retrieving the latest measurement from the database."""
+    def insert_measurements(self, *measurements: dict) -> None:
+        """Insert the measurements into the database, without updating the latest measurements collection."""
+        self.database.measurements.insert_many(
+            [{"metric_uuid": METRIC_ID} | measurement for measurement in measurements]
+        )
 
     def test_no_latest_measurement(self):
         """Test no measurements found."""
@@ -31,28 +34,60 @@ class LatestMeasurementsTest(MeasurementsTestCase):
 
     def test_latest_measurement(self):
         """Test a latest measurement is found."""
-        self.database.measurements.find_one.return_value = {}
-        self.assertEqual(Measurement(self.metric), latest_measurement(self.database, self.metric))
+        self.insert_measurements({"start": "1", "has_error": False}, {"start": "2", "has_error": True})
+        self.assertEqual("2", cast(Measurement, latest_measurement(self.database, self.metric))["start"])
 
     def test_no_latest_successful_measurement(self):
         """Test no successful measurements found."""
+        self.insert_measurements({"start": "1", "has_error": True})
         self.assertIsNone(latest_measurement(self.database, self.metric, skip_measurements_with_error=True))
 
     def test_latest_successful_measurement(self):
         """Test that a successful measurement is found."""
-        self.database.measurements.find_one.return_value = {}
-        self.assertEqual(
-            Measurement(self.metric),
-            latest_measurement(self.database, self.metric, skip_measurements_with_error=True),
+        self.insert_measurements({"start": "1", "has_error": False}, {"start": "2", "has_error": True})
+        measurement = latest_measurement(self.database, self.metric, skip_measurements_with_error=True)
+        self.assertEqual("1", cast(Measurement, measurement)["start"])
+
+    def test_latest_measurement_ids_are_stored(self):
+        """Test that the ids of the latest measurements are stored, so the next lookup doesn't scan the measurements."""
+        self.insert_measurements({"start": "1", "has_error": False}, {"start": "2", "has_error": True})
+        latest = cast(Measurement, latest_measurement(self.database, self.metric))
+        latest_successful = cast(
+            Measurement, latest_measurement(self.database, self.metric, skip_measurements_with_error=True)
         )
-
-
-class InsertNewMeasurementsTest(MeasurementsTestCase):
+        latest_measurement_ids = self.database.latest_measurements.find_one({"metric_uuid": METRIC_ID})
+        self.assertEqual(latest["_id"], latest_measurement_ids["latest_measurement_id"])
+        self.assertEqual(latest_successful["_id"], latest_measurement_ids["latest_successful_measurement_id"])
+        self.insert_measurements({"start": "3", "has_error": False})
+        self.assertEqual("2", cast(Measurement, latest_measurement(self.database, self.metric))["start"])
+
+    def test_latest_measurement_ids_are_updated(self):
+        """Test that inserting a new measurement updates the latest measurements collection."""
+        self.insert_measurements({"start": "1", "has_error": False})
+        new_measurement = {
+            "metric_uuid": METRIC_ID,
+            "start": "2",
+            "end": "2026-10-18T12:00:00+00:00",
+            "has_error": True,
+        }
+        insert_new_measurement(self.database, Measurement(self.metric, new_measurement))
+        self.assertEqual("2", cast(Measurement, latest_measurement(self.database, self.metric))["start"])
+        measurement = latest_measurement(self.database, self.metric, skip_measurements_with_error=True)
+        self.assertEqual("1", cast(Measurement, measurement)["start"])
+        latest_measurement_ids = self.database.latest_measurements.find_one({"metric_uuid": METRIC_ID})
+        self.assertEqual(cast(Measurement, measurement)["_id"], latest_measurement_ids["previous_measurement_id"])
+
+
+class InsertNewMeasurementsTest(DataModelTestCase):
     """Unit test for inserting measurements into the database."""
 
     def setUp(self) -> None:
         """Set up fixtures for measurements."""
         super().setUp()
+        self.database = Mock()
+        self.database.measurements.find_one.return_value = None
+        self.database.latest_measurements.find_one.return_value = None
+        self.metric = Metric(self.DATA_MODEL, {"type": "violations"}, METRIC_ID)
         self.database.measurements.insert_one = self.insert_one_measurement
 
     @staticmethod
@@ -62,22 +97,24 @@ class InsertNewMeasurementsTest(MeasurementsTestCase):
 
     def test_insert_new_measurement_without_id(self):
         """Test inserting a measurement without id."""
-        measurement = Measurement(self.metric)
+        measurement = Measurement(self.metric, {"metric_uuid": METRIC_ID})
         inserted_measurement = insert_new_measurement(self.database, measurement)
         self.assertNotIn("_id", inserted_measurement)
 
     def test_insert_new_measurement_with_id(self):
         """Test inserting a measurement with id."""
-        measurement = Measurement(self.metric, {"_id": "measurement_id"})
+        measurement = Measurement(self.metric, {"_id": "measurement_id", "metric_uuid": METRIC_ID})
         inserted_measurement = insert_new_measurement(self.database, measurement)
         self.assertNotIn("_id", inserted_measurement)
 
-    def test_insert_new_measurement_removes_source_parameter_hash_from_previous_measurement(self):
-        """Test that inserting a measurement also removes the source parameter hash from the previous measurement."""
-        latest_measurement = Measurement(self.metric, {"_id": "measurement_id", "source_parameter_hash": "hash"})
+    def test_insert_new_measurement_removes_hashes_from_previous_measurement(self):
+        """Test that inserting a measurement also removes the hashes from the previous measurement."""
+        latest_measurement = Measurement(
+            self.metric, {"_id": "measurement_id", "source_parameter_hash": "hash", "payload_hash": "hash"}
+        )
         self.database.measurements.find_one.return_value = latest_measurement
-        new_measurement = Measurement(self.metric)
+        new_measurement = Measurement(self.metric, {"metric_uuid": METRIC_ID})
         insert_new_measurement(self.database, new_measurement)
         self.database.measurements.update_one.assert_called_once_with(
-            {"_id": "measurement_id"}, {"$unset": {"source_parameter_hash": ""}}
+            {"_id": "measurement_id"}, {"$unset": {"source_parameter_hash": "", "payload_hash": ""}}
         )
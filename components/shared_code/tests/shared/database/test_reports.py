@@ -0,0 +1,42 @@
+"""Unit tests for the reports collection."""
+
+import unittest
+from unittest.mock import patch
+
+import mongomock
+
+from shared.database.reports import get_reports
+from shared_data_model.snapshot import _frozen_data_model
+
+from tests.fixtures import create_report
+
+
+class GetReportsTest(unittest.TestCase):
+    """Unit tests for getting the reports."""
+
+    def setUp(self) -> None:
+        """Override to create a database fixture."""
+        self.database = mongomock.MongoClient()["quality_time_db"]
+        self.database["reports"].insert_many(
+            [create_report(report_uuid=f"report{index}") for index in range(100)],
+        )
+
+    def test_get_reports(self):
+        """Test that the reports are returned."""
+        self.assertEqual(100, len(get_reports(self.database)))
+
+    def test_get_reports_by_uuid(self):
+        """Test that only the reports with the given uuids are returned."""
+        reports = get_reports(self.database, report_uuids={"report1", "report2"})
+        self.assertEqual({"report1", "report2"}, {report.uuid for report in reports})
+
+    def test_reports_share_the_data_model(self):
+        """Test that the data model is parsed once and then shared by all reports, subjects, and metrics."""
+        _frozen_data_model.cache_clear()
+        self.addCleanup(_frozen_data_model.cache_clear)
+        data_model_json = '{"metrics": {"violations": {"unit": "violations"}}}'
+        with patch("shared_data_model.snapshot.load_data_model_json", return_value=data_model_json) as load_json:
+            reports = get_reports(self.database)
+            self.assertEqual(100, len(reports))
+            load_json.assert_called_once_with()
+        self.assertEqual({"violations"}, {report.metrics[0].unit for report in reports})
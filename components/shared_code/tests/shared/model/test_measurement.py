@@ -158,6 +158,14 @@ class MeasurementTest(MeasurementTestCase):
         measurement_copy = Measurement(self.metric(), start=timestamp, end=timestamp).copy()
         self.assertNotIn(timestamp, measurement_copy["start"], measurement_copy["end"])
 
+    def test_copy_without_payload_hash(self):
+        """Test that the copy has no payload hash, but does have the source parameter hash."""
+        measurement = Measurement(self.metric(), payload_hash="payload", source_parameter_hash="parameters")
+        measurement_copy = measurement.copy()
+        self.assertNotIn("payload_hash", measurement_copy)
+        self.assertEqual("parameters", measurement_copy["source_parameter_hash"])
+        self.assertEqual("payload", measurement["payload_hash"])
+
     def test_equals(self):
         """Test that equal measurements compare equal."""
         measurement_1 = Measurement(self.metric())
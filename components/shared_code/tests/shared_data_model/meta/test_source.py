@@ -89,3 +89,7 @@ class SourceTest(MetaModelTestCase):
             "Source Source has identifying parameter token but parameter token is a password",
             **extra_model_kwargs,
         )
+
+    def test_max_concurrent_requests_is_positive(self):
+        """Test that the maximum number of concurrent requests is larger than zero."""
+        self.check_source_validation_error("Input should be greater than 0", max_concurrent_requests=0, parameters={})
@@ -0,0 +1,69 @@
+"""Unit tests for the precompiled artifact of the data model."""
+
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+import shared_data_model
+from shared_data_model import DATA_MODEL, DATA_MODEL_JSON
+from shared_data_model.artifact import (
+    build_data_model,
+    dump_data_model,
+    load_data_model_json,
+    load_parameter,
+    write_artifact,
+)
+
+
+class DataModelArtifactTest(unittest.TestCase):
+    """Unit tests for the data model artifact."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Override to build the data model from its definitions once, because building it is slow."""
+        cls.data_model = build_data_model()
+
+    def test_artifact_is_up_to_date(self):
+        """Test that the artifact contains the data model as built from its definitions."""
+        self.assertEqual(
+            dump_data_model(self.data_model),
+            DATA_MODEL_JSON,
+            "The data model artifact is out of date, regenerate it with 'python -m shared_data_model'",
+        )
+
+    def test_loaded_data_model_equals_built_data_model(self):
+        """Test that loading the data model from the artifact results in the same data model."""
+        self.assertEqual(self.data_model.model_dump(), DATA_MODEL.model_dump())
+
+    def test_parameter_subclass_attributes_are_loaded(self):
+        """Test that attributes only defined by parameter subclasses are loaded from the artifact."""
+        self.assertEqual("0", DATA_MODEL.sources["gitlab"].parameters["upvotes"].min_value)
+        self.assertEqual("rest/api/2/myself", DATA_MODEL.sources["jira"].parameters["private_token"].validation_path)
+
+    def test_unknown_parameter_attribute(self):
+        """Test that loading a parameter with an attribute that no parameter class has fails."""
+        parameter = DATA_MODEL.sources["gitlab"].parameters["upvotes"].model_dump(exclude_none=True)
+        with self.assertRaises(ValidationError):
+            load_parameter({**parameter, "max_value": "10"})
+
+    def test_data_model_is_loaded_once(self):
+        """Test that the data model is loaded from the artifact once."""
+        self.assertIs(DATA_MODEL, shared_data_model.DATA_MODEL)
+        self.assertIs(DATA_MODEL_JSON, load_data_model_json())
+
+    def test_unknown_attribute(self):
+        """Test that accessing an unknown attribute of the data model package raises an attribute error."""
+        with self.assertRaises(AttributeError):
+            _ = shared_data_model.UNKNOWN
+
+    def test_write_artifact(self):
+        """Test that the artifact can be written."""
+        with tempfile.TemporaryDirectory() as directory:
+            artifact_path = pathlib.Path(directory) / "data_model.json"
+            with patch("shared_data_model.artifact.ARTIFACT_PATH", artifact_path):
+                write_artifact()
+            self.assertEqual(json.loads(DATA_MODEL_JSON), json.loads(artifact_path.read_text(encoding="utf-8")))
@@ -0,0 +1,49 @@
+"""Unit tests for the data model snapshot."""
+
+import unittest
+
+from shared_data_model import DATA_MODEL
+from shared_data_model.snapshot import DATA_MODEL_HASH, data_model_snapshot, freeze
+
+
+class DataModelSnapshotTest(unittest.TestCase):
+    """Unit tests for the data model snapshot."""
+
+    def test_snapshot_is_shared(self):
+        """Test that the same snapshot is returned each time, so the data model is only dumped once."""
+        self.assertIs(data_model_snapshot(), data_model_snapshot())
+
+    def test_snapshot_equals_data_model_dump(self):
+        """Test that the snapshot contains the same data as a dump of the data model."""
+        self.assertEqual(
+            DATA_MODEL.model_dump()["metrics"]["violations"]["name"],
+            data_model_snapshot()["metrics"]["violations"]["name"],
+        )
+
+    def test_snapshot_is_read_only(self):
+        """Test that the snapshot can't be changed."""
+        with self.assertRaises(TypeError):
+            data_model_snapshot()["metrics"]["violations"]["name"] = "Changed"  # type: ignore[index]
+
+    def test_hash(self):
+        """Test that the data model hash is a md5 hash."""
+        self.assertEqual(32, len(DATA_MODEL_HASH))
+
+
+class FreezeTest(unittest.TestCase):
+    """Unit tests for the freeze function."""
+
+    def test_freeze_dict(self):
+        """Test that dicts are frozen recursively."""
+        frozen = freeze({"key": {"nested": "value"}})
+        self.assertEqual("value", frozen["key"]["nested"])
+        with self.assertRaises(TypeError):
+            frozen["key"]["nested"] = "new value"
+
+    def test_freeze_list(self):
+        """Test that lists are converted to tuples."""
+        self.assertEqual(("a", ("b",)), freeze(["a", ["b"]]))
+
+    def test_freeze_scalar(self):
+        """Test that scalars are returned as is."""
+        self.assertEqual(42, freeze(42))
@@ -0,0 +1,33 @@
+"""Shim for mongomock, used by the unit tests of the components that access the database."""
+
+import functools
+import inspect
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def accept_bulk_write_sort() -> None:
+    """Let mongomock bulk writes accept the sort argument that pymongo passes for UpdateOne and ReplaceOne operations.
+
+    Pymongo passes the sort argument even if the operation has no sort. Mongomock doesn't know the argument yet, so
+    drop it. This is safe as long as the filters of the operations match at most one document.
+    """
+    from mongomock.collection import BulkOperationBuilder  # noqa: PLC0415
+
+    for method_name in ("add_update", "add_replace"):
+        method = getattr(BulkOperationBuilder, method_name)
+        if "sort" not in inspect.signature(method, follow_wrapped=False).parameters:
+            setattr(BulkOperationBuilder, method_name, ignore_sort(method))
+
+
+def ignore_sort(method: Callable) -> Callable:
+    """Return a wrapper of the method that drops the sort argument."""
+
+    @functools.wraps(method)
+    def wrapper(*args: object, sort: object = None, **kwargs: object) -> object:  # noqa: ARG001
+        """Call the method without the sort argument."""
+        return method(*args, **kwargs)
+
+    return wrapper